@@ -1,64 +1,47 @@
 import os
-import pandas as pd
-from datetime import datetime
-from bs4 import BeautifulSoup
+import argparse
+from extent_html_parser import iter_test_fields
+from extent_times import to_datetime_column
+from duration_summary import MAX_EXCEL_RUNS, summarize_runs
+from excel_workbook import DETAILS_SHEET, DetailSheetStream, finish_summary_workbook
+from openpyxl import Workbook
+from report_ingest import load_report_rows
+from report_rows import SUMMARY_ROW_COLUMNS, ReportRowBatch
+from report_cache import CACHE_DIR, ReportRowCache
+from report_manifest import MANIFEST_FILE, ReportManifest
 
 # === Configurable Flag ===
-REPROCESS_ALL = True  # Set to False to keep previous run info
+REPROCESS_ALL = False  # True ignores the manifest and row cache and reparses every report
+PARSER_BACKEND = "auto"  # "auto" (sniff report layout), "stream" (v3/v4 layout only) or "bs4" (BeautifulSoup tree)
 
 # === Constants ===
 DATETIME_FORMAT = "%m/%d/%Y %H:%M:%S"
-
-def reset_processed_log(log_path):
-    if os.path.exists(log_path):
-        os.remove(log_path)
-        print(f"🗑️  Deleted previous '{log_path}' to reprocess all reports.")
-
-def load_processed_files(log_path):
-    if os.path.exists(log_path):
-        return set(pd.read_csv(log_path)['filename'])
-    return set()
-
-def save_processed_file(log_path, filename):
-    mode = 'a' if os.path.exists(log_path) else 'w'
-    header = not os.path.exists(log_path)
-    with open(log_path, mode) as f:
-        if header:
-            f.write("filename\n")
-        f.write(f"{filename}\n")
+LAST_RUNS = MAX_EXCEL_RUNS  # run-N columns kept per test (latest runs); Excel sheets stop at 16,384 columns
 
 def extract_tests_from_html(html_path):
-    with open(html_path, "r", encoding="utf-8", errors="ignore") as f:
-        soup = BeautifulSoup(f, "html.parser")
-
     test_data = []
 
-    for test in soup.select("ul.test-collection > li"):
+    for test in iter_test_fields(html_path, backend=PARSER_BACKEND):
         test_name = "Unknown"
         test_status = "Unknown"
         test_start = ""
         test_end = ""
 
-        name_span = test.select_one("span.test-name")
-        if name_span:
-            test_name = name_span.text.strip()
+        if test["name"] is not None:
+            test_name = test["name"]
 
-        status_span = test.select_one("span.test-status")
-        if status_span:
-            test_status = status_span.text.strip()
+        if test["status"] is not None:
+            test_status = test["status"]
 
-        start_span = test.select_one("span.test-started-time")
-        if start_span:
-            test_start = start_span.text.strip()
+        if test["started"] is not None:
+            test_start = test["started"]
 
-        end_span = test.select_one("span.test-ended-time")
-        if end_span:
-            test_end = end_span.text.strip()
+        if test["ended"] is not None:
+            test_end = test["ended"]
 
         if not test_end or test_end.strip() == "":
-            timestamps = test.select("td.timestamp")
-            if timestamps:
-                last_step_time = timestamps[-1].text.strip()
+            if test["last_timestamp"] is not None:
+                last_step_time = test["last_timestamp"]
                 if test_start and len(test_start.split()) == 2:
                     test_date = test_start.split()[0]
                     test_end = f"{test_date} {last_step_time}"
@@ -73,79 +56,62 @@ def extract_tests_from_html(html_path):
 
     return test_data
 
+def add_durations(df):
+    # ✅ Duration calculation with rounding and clipping
+    df["Start Time"] = to_datetime_column(df["Start Time"], DATETIME_FORMAT)
+    df["End Time"] = to_datetime_column(df["End Time"], DATETIME_FORMAT)
+    df["Duration (mins)"] = ((df["End Time"] - df["Start Time"]).dt.total_seconds() / 60).clip(lower=0).round(2)
+    return df
+
 def summarize_test_durations(df):
-    df["Start Time"] = pd.to_datetime(df["Start Time"], errors="coerce")
-    df["End Time"] = pd.to_datetime(df["End Time"], errors="coerce")
+    df["Start Time"] = to_datetime_column(df["Start Time"], DATETIME_FORMAT)
+    df["End Time"] = to_datetime_column(df["End Time"], DATETIME_FORMAT)
     df = df.dropna(subset=["Start Time", "End Time"])
 
     # ✅ Round and clip negative durations
     df["Duration (mins)"] = ((df["End Time"] - df["Start Time"]).dt.total_seconds() / 60).clip(lower=0).round(2)
-    df["Start+Duration"] = list(zip(df["Start Time"], df["Duration (mins)"]))
-
-    grouped = df.groupby("Test Name")["Start+Duration"].agg(
-        SortedRuns=lambda x: [d for _, d in sorted(x)]
-    ).reset_index()
-
-    agg_stats = df.groupby("Test Name")["Duration (mins)"].agg(
-        Count="count", Total_Time="sum", Max_Time="max"
-    ).reset_index()
 
-    merged = pd.merge(grouped, agg_stats, on="Test Name")
+    return summarize_runs(df, "Test Name", "Start Time", "Duration (mins)", last_runs=LAST_RUNS)
 
-    max_runs = merged["SortedRuns"].apply(len).max()
-    run_columns = pd.DataFrame(merged["SortedRuns"].tolist(),
-                               columns=[f"run-{i+1}" for i in range(max_runs)])
-
-    summary_df = pd.concat([
-        merged[["Test Name", "Count", "Total_Time", "Max_Time"]],
-        run_columns
-    ], axis=1)
-
-    return summary_df
-
-def extract_all_reports_from_folder(folder_path):
-    log_path = os.path.join(folder_path, "processed_files.csv")
+def extract_all_reports_from_folder(folder_path, workers=1):
+    manifest_path = os.path.join(folder_path, MANIFEST_FILE)
     output_excel = os.path.join(folder_path, "Test_Run_Details.xlsx")
 
-    if REPROCESS_ALL:
-        reset_processed_log(log_path)
-
-    all_data = []
-    processed = load_processed_files(log_path)
+    with ReportManifest(manifest_path) as manifest:
+        if REPROCESS_ALL:
+            manifest.reset()
 
-    for root, _, files in os.walk(folder_path):
-        for file in files:
-            if file.lower().endswith(".html") and file not in processed:
-                html_path = os.path.join(root, file)
-                print(f"🔍 Processing: {html_path}")
-                try:
-                    test_info = extract_tests_from_html(html_path)
-                    if test_info:
-                        all_data.extend(test_info)
-                        save_processed_file(log_path, file)
-                except Exception as e:
-                    print(f"❌ Error reading {file}: {e}")
+        cache = ReportRowCache(os.path.join(folder_path, CACHE_DIR), namespace="summary",
+                               backend=PARSER_BACKEND)
+        rows = ReportRowBatch(SUMMARY_ROW_COLUMNS,
+                              {"Start Time": DATETIME_FORMAT, "End Time": DATETIME_FORMAT})
 
-    if all_data:
-        df = pd.DataFrame(all_data)
+        # ✅ Detail rows stream into the workbook as reports are extracted (write-only,
+        # "test run details (2)", ... past 1,048,576 rows); only the compact batch is kept for the summary
+        wb = Workbook(write_only=True)
+        details = DetailSheetStream(wb, DETAILS_SHEET, prepare=add_durations, tee=rows)
+        _, changed = load_report_rows(folder_path, extract_tests_from_html, manifest, cache, workers=workers,
+                                      reprocess_all=REPROCESS_ALL, rows=details,
+                                      skip_unchanged=os.path.exists(output_excel))
 
-        # ✅ Duration calculation with rounding and clipping
-        df["Start Time"] = pd.to_datetime(df["Start Time"], errors="coerce")
-        df["End Time"] = pd.to_datetime(df["End Time"], errors="coerce")
-        df["Duration (mins)"] = ((df["End Time"] - df["Start Time"]).dt.total_seconds() / 60).clip(lower=0).round(2)
-
-        summary_df = summarize_test_durations(df)
-
-        with pd.ExcelWriter(output_excel, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name="test run details")
-            summary_df.to_excel(writer, index=False, sheet_name="summary report")
+    if rows and (changed or not os.path.exists(output_excel)):
+        details.flush()
+        summary_df = summarize_test_durations(add_durations(rows.to_pandas(sort_categories=True)))
+        finish_summary_workbook(wb, output_excel, summary_df)
 
         print(f"\n✅ Output Excel saved to: {output_excel}")
-        print(f"✅ {len(df)} test entries written with summary.")
+        print(f"✅ {len(rows)} test entries written with summary"
+              f"{f' across {len(details.sheet.sheets)} detail sheets' if len(details.sheet.sheets) > 1 else ''}.")
     else:
         print("\n⚠️ No new HTML reports to process.")
 
 # === Entry point ===
 if __name__ == "__main__":
     folder_to_scan = "Reports"  # Change this to your report folder path
-    extract_all_reports_from_folder(folder_to_scan)
+
+    parser = argparse.ArgumentParser(description="Summarize Extent HTML reports into Test_Run_Details.xlsx")
+    parser.add_argument("folder", nargs="?", default=folder_to_scan, help="Folder to scan for .html reports")
+    parser.add_argument("--workers", type=int, default=1, help="Parse reports in N worker processes")
+    args = parser.parse_args()
+
+    extract_all_reports_from_folder(args.folder, workers=args.workers)
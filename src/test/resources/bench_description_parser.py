@@ -0,0 +1,88 @@
+"""
+Per-row vs batch parsing of excel-project.py's Description column.
+
+Synthetic descriptions mix the shapes the parser handles: "|Step-N| action |
+expected |" blocks spread over several lines, "Step No | Action | Expected"
+tables (line-by-line fallback), lower-case "step-N" markers (per-row block
+fallback), text without steps, numbers and empty cells. The per-row path
+calls parse_description_to_steps for every row, as update_excel_columns did;
+the batch path is parse_descriptions on the whole column. Both must give the
+same Design Steps / Expected Result values.
+
+Usage:
+    python bench_description_parser.py                  # 100k descriptions
+    python bench_description_parser.py --rows 20000 --distinct 0.2
+"""
+
+import argparse
+import importlib.util
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+ACTIONS = ["Open the login page", "Enter the user name", "Click submit | wait for spinner", "Navigate to the cart",
+           "Select the first product", "Apply coupon code", "Log out from the menu"]
+EXPECTATIONS = ["Page should load", "Field shows the text", "User is logged in", "Cart will display items",
+                "Total is updated", "Error message must appear", "Login page is displayed"]
+
+
+def load_processor_class(log_level="ERROR"):
+    """ExcelDescriptionProcessor of excel-project.py, logging at log_level (default: errors only)."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "excel-project.py")
+    spec = importlib.util.spec_from_file_location("excel_project", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.configure_logging(log_level)  # no per-row output or parser fallback warnings while timing
+    return module.ExcelDescriptionProcessor
+
+
+def synthetic_descriptions(rows, distinct, seed=4):
+    rng = np.random.default_rng(seed)
+    pool = []
+    for i in range(max(1, int(rows * distinct))):
+        steps = int(rng.integers(1, 8))
+        picks = [(ACTIONS[rng.integers(len(ACTIONS))], EXPECTATIONS[rng.integers(len(EXPECTATIONS))], k + 1)
+                 for k in range(steps)]
+        shape = i % 10
+        if shape < 5:
+            text = "".join(f"|Step-{k}| {action}\n  detail {i} | {expected} |\r\n" for action, expected, k in picks)
+        elif shape < 8:
+            text = "Step No | Action | Expected\n" + "\n".join(f"Step-{k} | {action} {i} | {expected}"
+                                                                for action, expected, k in picks)
+        elif shape == 8:
+            text = "".join(f"|step-{k}| {action} | {expected} {i}|" for action, expected, k in picks)
+        else:
+            text = [None, np.nan, "", f"Free text without steps {i}", i][i // 10 % 5]
+        pool.append(text)
+    return pd.Series([pool[i] for i in rng.integers(0, len(pool), rows)], dtype=object)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--distinct", type=float, default=1.0, help="Share of distinct descriptions")
+    args = parser.parse_args()
+
+    processor = load_processor_class()("unused.xlsx")
+    descriptions = synthetic_descriptions(args.rows, args.distinct)
+
+    start = time.perf_counter()
+    per_row = [processor.parse_description_to_steps(text) for text in descriptions]
+    row_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    design, expected = processor.parse_descriptions(descriptions)
+    batch_seconds = time.perf_counter() - start
+
+    same = design.tolist() == [steps[0] for steps in per_row] and expected.tolist() == [steps[1] for steps in per_row]
+    print(f"{'Parser':<10}{'Rows':>10}{'Seconds':>10}{'Rows/s':>12}")
+    print(f"{'per row':<10}{args.rows:>10}{row_seconds:>10.2f}{args.rows / row_seconds:>12,.0f}")
+    print(f"{'batch':<10}{args.rows:>10}{batch_seconds:>10.2f}{args.rows / batch_seconds:>12,.0f}")
+    print(f"\nSpeedup {row_seconds / batch_seconds:.1f}x; Design Steps / Expected Result "
+          f"{'identical' if same else 'DIFFERENT'} to the per-row parser")
+
+
+if __name__ == "__main__":
+    main()
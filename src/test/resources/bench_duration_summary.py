@@ -0,0 +1,189 @@
+"""
+Benchmark duration_summary.summarize_runs against the original summarize_test_durations copies.
+
+The summarize_test_durations functions of FinalSummary_Final.py and
+finalsummarysheet.py are loaded from the files themselves (only their
+imports and function definitions are executed, not the example call at the
+bottom) and run on a synthetic CSV. The vectorized pipeline does the same
+read/parse/summarize/write steps, and both output CSVs must be byte-identical.
+
+Usage:
+    python bench_duration_summary.py                  # 10k, 100k and 1M rows
+    python bench_duration_summary.py --rows 50000 --tests 300
+"""
+
+import argparse
+import ast
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from duration_summary import summarize_runs
+from extent_times import to_datetime_column
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LEGACY_SCRIPTS = {
+    "FinalSummary_Final.py": "start",
+    "finalsummarysheet.py": "longest",
+}
+OUTPUT_NAME = "test_duration_summary.csv"
+CSV_TIME_FORMAT = "%Y-%m-%d %H:%M"  # python8.py / python9.py CSV output
+
+
+# === Legacy implementations ===
+def load_legacy_function(script_name, function_name="summarize_test_durations"):
+    """Exec only the imports and function definitions of a script that runs example code on import."""
+    path = os.path.join(HERE, script_name)
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    tree.body = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom, ast.FunctionDef))]
+    namespace = {}
+    exec(compile(tree, path, "exec"), namespace)
+    return namespace[function_name]
+
+
+def summarize_sorted_runs_legacy(df):
+    # The in-memory summary step the Excel summary scripts used before duration_summary
+    df = df.copy()
+    df["Start+Duration"] = list(zip(df["Test Start Time"], df["Duration (min)"]))
+
+    grouped = df.groupby("Test Name")["Start+Duration"].agg(
+        SortedRuns=lambda x: [d for _, d in sorted(x)]
+    ).reset_index()
+
+    agg_stats = df.groupby("Test Name")["Duration (min)"].agg(
+        Count="count", Total_Time="sum", Max_Time="max"
+    ).reset_index()
+
+    merged = pd.merge(grouped, agg_stats, on="Test Name")
+
+    max_runs = merged["SortedRuns"].apply(len).max()
+    run_columns = pd.DataFrame(merged["SortedRuns"].tolist(),
+                               columns=[f"run-{i+1}" for i in range(max_runs)])
+
+    return pd.concat([
+        merged[["Test Name", "Count", "Total_Time", "Max_Time"]],
+        run_columns
+    ], axis=1)
+
+
+# === Vectorized pipelines (same inputs, same output file) ===
+def load_runs(file_path, dropna=True):
+    df = pd.read_csv(file_path)
+    df["Test Start Time"] = to_datetime_column(df["Test Start Time"])
+    df["Test End Time"] = to_datetime_column(df["Test End Time"])
+    if dropna:
+        df = df.dropna(subset=["Test Start Time", "Test End Time"])
+    df["Duration (min)"] = (df["Test End Time"] - df["Test Start Time"]).dt.total_seconds() / 60
+    return df
+
+
+def summarize_csv_vectorized(file_path, run_order):
+    df = load_runs(file_path, dropna=run_order == "start")
+
+    result_df = summarize_runs(df, "Test Name", "Test Start Time", "Duration (min)", run_order=run_order)
+    if run_order == "longest":
+        result_df = result_df.sort_values(by="Total_Time", ascending=False)
+
+    output_path = os.path.join(os.path.dirname(file_path), OUTPUT_NAME)
+    result_df.to_csv(output_path, index=False)
+
+
+# === Synthetic input ===
+def write_synthetic_csv(path, rows, tests, seed=7):
+    rng = np.random.default_rng(seed)
+    names = np.array([f"com.example.tests.Suite{i % 37}.test{i}" for i in range(tests)], dtype=object)
+    base = np.datetime64("2025-05-01T08:00:00")
+    starts = base + rng.integers(0, 60 * 24 * 3600, rows).astype("timedelta64[s]")
+    ends = starts + rng.integers(5, 1800, rows).astype("timedelta64[s]")
+    df = pd.DataFrame({
+        "Test Name": names[rng.integers(0, tests, rows)],
+        "Test Start Time": pd.Series(starts).dt.strftime(CSV_TIME_FORMAT),
+        "Test End Time": pd.Series(ends).dt.strftime(CSV_TIME_FORMAT),
+    })
+    df.to_csv(path, index=False)
+
+
+def check_unobserved_categories():
+    """Categorical names with a test whose runs were all dropped: rows and run columns must line up."""
+    df = pd.DataFrame({
+        "Test Name": pd.Categorical(["A", "A", "B", "C", "C"], categories=["A", "B", "C"]),
+        "Test Start Time": pd.to_datetime(["2025-05-01 10:00", "2025-05-01 11:00", None,
+                                           "2025-05-01 09:00", "2025-05-01 12:00"]),
+        "Test End Time": pd.to_datetime(["2025-05-01 10:01", "2025-05-01 11:02", None,
+                                         "2025-05-01 09:10", "2025-05-01 12:20"]),
+    }).dropna(subset=["Test Start Time", "Test End Time"])
+    df["Duration (min)"] = (df["Test End Time"] - df["Test Start Time"]).dt.total_seconds() / 60
+
+    result = summarize_runs(df, "Test Name", "Test Start Time", "Duration (min)", sparse=False)
+    expected = summarize_sorted_runs_legacy(df.astype({"Test Name": str}))
+    return result.astype({"Test Name": str}).equals(expected.astype({"Test Name": str}))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def print_result(label, rows, legacy_seconds, vector_seconds, identical):
+    print(f"{label:<24}{rows:>10}{legacy_seconds:>11.2f}{vector_seconds:>11.2f}"
+          f"{legacy_seconds / vector_seconds:>9.1f}x  {'identical' if identical else 'DIFFERENT'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--tests", type=int, default=None, help="Distinct test names (default rows / 200)")
+    args = parser.parse_args()
+
+    failed = not check_unobserved_categories()
+    print(f"Categorical names with an emptied test: {'DIFFERENT' if failed else 'identical'}\n")
+
+    print(f"{'Script':<24}{'Rows':>10}{'Legacy s':>11}{'Vector s':>11}{'Speedup':>10}  Output")
+    for rows in args.rows:
+        tests = args.tests or max(10, rows // 200)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = os.path.join(tmp_dir, "test_data.csv")
+            output_path = os.path.join(tmp_dir, OUTPUT_NAME)
+            write_synthetic_csv(input_path, rows, tests)
+
+            # End to end: read CSV, parse, summarize, write CSV
+            for script_name, run_order in LEGACY_SCRIPTS.items():
+                legacy = load_legacy_function(script_name)
+                legacy_seconds, _ = timed(legacy, input_path)
+                with open(output_path, "rb") as f:
+                    expected = f.read()
+
+                vector_seconds, _ = timed(summarize_csv_vectorized, input_path, run_order)
+                with open(output_path, "rb") as f:
+                    identical = f.read() == expected
+                failed |= not identical
+                print_result(script_name, rows, legacy_seconds, vector_seconds, identical)
+
+            # Summary step alone, as used by the Excel summary scripts
+            df = load_runs(input_path)
+            legacy_seconds, expected = timed(summarize_sorted_runs_legacy, df)
+            # Dense run columns, the frame the legacy copies build, so equals() compares like with like
+            vector_seconds, result = timed(partial(summarize_runs, sparse=False), df, "Test Name", "Test Start Time",
+                                           "Duration (min)")
+            identical = result.equals(expected) and result.to_csv(index=False) == expected.to_csv(index=False)
+            failed |= not identical
+            print_result("summary step only", rows, legacy_seconds, vector_seconds, identical)
+
+    if failed:
+        print("\n❌ Vectorized output differs from the original implementation.")
+        sys.exit(1)
+    print("\n✅ Vectorized summaries are byte-identical to the originals.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark the Extent report extraction backends in extent_html_parser.py.
+
+Generates a synthetic Spark-style report with inlined base64 screenshots (or
+uses the report you pass in), runs every backend in its own interpreter so
+peak RSS is not shared, checks that all backends return the same rows and
+prints peak RSS, throughput and how many bytes the base64 pre-scan skipped.
+"stream-noprescan" is the streaming parser fed the raw file.
+
+Usage:
+    python bench_extent_parser.py                     # synthetic ~50 MB report
+    python bench_extent_parser.py --tests 400 --steps 10 --screenshot-kb 60
+    python bench_extent_parser.py --report Reports/index.html
+"""
+
+import argparse
+import base64
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from extent_html_parser import BACKENDS, ScanStats, detect_layout, iter_test_fields, iter_test_fields_stream
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# === Synthetic report ===
+def write_synthetic_report(path, tests, steps, screenshot_kb):
+    screenshot = base64.b64encode(os.urandom(screenshot_kb * 768)).decode("ascii")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<!DOCTYPE html><html><head><title>Extent</title>"
+                "<script>var x = '<span class=\"test-name\">fake</span>';</script></head>"
+                "<body class='spark'><ul class='test-list-item test-collection'>\n")
+        for t in range(tests):
+            minute = t % 60
+            f.write(f"<li class='test-item' status='pass'>"
+                    f"<div class='test-detail'><p class='name'><span class='test-name'>Test &amp; {t % 97}</span></p>"
+                    f"<span class='test-status'>{'pass' if t % 7 else 'fail'}</span>"
+                    f"<span class='test-started-time'>05/19/2025 10:{minute:02d}:00</span>"
+                    f"{'' if t % 3 == 0 else f'<span class=test-ended-time>05/19/2025 10:{minute:02d}:30</span>'}"
+                    f"</div><table class='table'><tbody>")
+            for s in range(steps):
+                f.write(f"<tr class='log'><td class='status pass'><i>pass</i></td>"
+                        f"<td class='timestamp'>10:{minute:02d}:{s % 60:02d}</td>"
+                        f"<td class='step-details'>Step {s}<br/>"
+                        f"<img src='data:image/png;base64,{screenshot}' height='200' width='300'/>"
+                        f"<div class='modal'><img class='modal-content' src='data:image/png;base64,{screenshot}'/></div>"
+                        f"</td></tr>")
+            f.write("</tbody></table></li>\n")
+        f.write("</ul></body></html>\n")
+
+
+BENCH_BACKENDS = BACKENDS + ("stream-noprescan",)
+
+
+# === Child process: run one backend ===
+def run_backend(backend, report_path):
+    stats = ScanStats()
+    start = time.perf_counter()
+    if backend == "auto":
+        rows = list(iter_test_fields_stream(report_path, detect_layout(report_path), stats=stats))
+    elif backend == "stream":
+        rows = list(iter_test_fields_stream(report_path, stats=stats))
+    elif backend == "stream-noprescan":
+        rows = list(iter_test_fields_stream(report_path, prescan=False))
+    else:
+        rows = list(iter_test_fields(report_path, backend=backend))
+    elapsed = time.perf_counter() - start
+
+    peak_rss_mb = None
+    if resource is not None:
+        peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak_rss_kb //= 1024
+        peak_rss_mb = round(peak_rss_kb / 1024, 1)
+
+    print(json.dumps({
+        "backend": backend,
+        "seconds": elapsed,
+        "peak_rss_mb": peak_rss_mb,
+        "scan": stats.as_dict() if stats.bytes_parsed else None,
+        "rows": rows,
+    }))
+
+
+def measure(backend, report_path):
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--run-backend", backend, report_path],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--report", help="Existing Extent HTML report to benchmark")
+    parser.add_argument("--tests", type=int, default=200)
+    parser.add_argument("--steps", type=int, default=5)
+    parser.add_argument("--screenshot-kb", type=int, default=25)
+    parser.add_argument("--backends", nargs="+", default=list(BENCH_BACKENDS), choices=BENCH_BACKENDS)
+    parser.add_argument("--run-backend", nargs=2, metavar=("BACKEND", "REPORT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_backend:
+        run_backend(*args.run_backend)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        report_path = args.report
+        if not report_path:
+            report_path = os.path.join(tmp_dir, "index.html")
+            write_synthetic_report(report_path, args.tests, args.steps, args.screenshot_kb)
+
+        size_mb = os.path.getsize(report_path) / (1024 * 1024)
+        print(f"📄 Report: {report_path} ({size_mb:.1f} MB)")
+
+        results = [measure(backend, report_path) for backend in args.backends]
+
+    print(f"\n{'Backend':<18}{'Rows':>8}{'Seconds':>10}{'MB/s':>10}{'Peak RSS (MB)':>16}{'Parsed MB':>12}{'Skipped MB':>12}")
+    for result in results:
+        rss = result["peak_rss_mb"] if result["peak_rss_mb"] is not None else "n/a"
+        scan = result["scan"]
+        parsed = f"{scan['bytes_parsed'] / (1024 * 1024):.1f}" if scan else f"{size_mb:.1f}"
+        skipped = f"{scan['bytes_skipped'] / (1024 * 1024):.1f}" if scan else "0.0"
+        print(f"{result['backend']:<18}{len(result['rows']):>8}{result['seconds']:>10.2f}"
+              f"{size_mb / result['seconds']:>10.1f}{rss:>16}{parsed:>12}{skipped:>12}")
+
+    reference = results[0]["rows"]
+    for result in results[1:]:
+        if result["rows"] != reference:
+            print(f"\n❌ Backend '{result['backend']}' rows differ from '{results[0]['backend']}'")
+            sys.exit(1)
+    print("\n✅ All backends produced identical rows.")
+
+
+if __name__ == "__main__":
+    main()
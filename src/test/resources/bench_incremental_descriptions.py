@@ -0,0 +1,95 @@
+"""
+Full vs incremental runs of excel-project.py on one large workbook.
+
+A synthetic "Input" sheet (Description, Design Steps, Expected Result, ID)
+is processed four ways, logging errors only:
+
+- full: FORCE_REPROCESS, every row parsed and written
+- cold: first incremental run, builds <workbook>.steps-cache.json.gz
+- unchanged: incremental rerun on the untouched workbook (hash check only)
+- full edited / edited: full run and incremental rerun after --edits
+  descriptions were changed in both copies
+
+The edited workbook must end up with the same cells as the full run's copy.
+Loading and saving the workbook stay the same for an edited workbook; the
+parse and cell writes are what an incremental run saves.
+
+Usage:
+    python bench_incremental_descriptions.py                 # 20k rows, 10 edits
+    python bench_incremental_descriptions.py --rows 50000 --edits 100
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+from openpyxl import Workbook, load_workbook
+
+from bench_description_parser import load_processor_class, synthetic_descriptions
+
+SHEET = "Input"
+
+
+def write_workbook(path, rows):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(SHEET)
+    ws.append(["Description", "Description (Design Steps)", "Description (Expected Result)", "ID"])
+    for i, text in enumerate(synthetic_descriptions(rows, 1.0)):
+        ws.append([None if isinstance(text, float) else text, None, None, f"TC-{i:06d}"])
+    wb.save(path)
+
+
+def edit_workbook(path, edits, seed=8):
+    wb = load_workbook(path)
+    ws = wb[SHEET]
+    for row in np.random.default_rng(seed).choice(np.arange(2, ws.max_row + 1), edits, replace=False).tolist():
+        ws.cell(row=row, column=1, value=f"|Step-1| Edited row {row} | Result should be shown |")
+    wb.save(path)
+
+
+def run(processor_class, path, **options):
+    """Process path; returns seconds."""
+    start = time.perf_counter()
+    ok = processor_class(path, SHEET, **options).process(create_backup=False)
+    assert ok, f"processing {path} failed"
+    return time.perf_counter() - start
+
+
+def sheet_cells(path):
+    return list(load_workbook(path, read_only=True)[SHEET].iter_rows(values_only=True))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--edits", type=int, default=10, help="Descriptions changed before the last run")
+    args = parser.parse_args()
+
+    processor_class = load_processor_class()
+    with tempfile.TemporaryDirectory() as tmp:
+        incremental, full = os.path.join(tmp, "incremental.xlsx"), os.path.join(tmp, "full.xlsx")
+        write_workbook(incremental, args.rows)
+        shutil.copy(incremental, full)
+
+        timings = [("full", run(processor_class, full, force_reprocess=True)),
+                   ("cold", run(processor_class, incremental, incremental=True)),
+                   ("unchanged", run(processor_class, incremental, incremental=True))]
+        for path in (incremental, full):
+            edit_workbook(path, args.edits)
+        timings.append(("full edited", run(processor_class, full, force_reprocess=True)))
+        timings.append(("edited", run(processor_class, incremental, incremental=True)))
+
+        same = sheet_cells(incremental) == sheet_cells(full)
+
+    print(f"{'Run':<12}{'Rows':>10}{'Seconds':>10}")
+    for name, seconds in timings:
+        print(f"{name:<12}{args.rows:>10}{seconds:>10.2f}")
+    print(f"\nEdited run {timings[3][1] / timings[4][1]:.1f}x faster than a full run, unchanged "
+          f"{timings[0][1] / timings[2][1]:.0f}x; cells {'identical' if same else 'DIFFERENT'} to a full run")
+
+
+if __name__ == "__main__":
+    main()
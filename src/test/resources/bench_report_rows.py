@@ -0,0 +1,109 @@
+"""
+Memory per row of extracted report rows: list of dicts vs report_rows.ReportRowBatch.
+
+Synthetic rows shaped like the Excel summary scripts' (HTML Report, Test Name,
+Test Status, Start Time, End Time) are collected both ways and handed to
+pandas. tracemalloc measures the Python memory the collected rows hold;
+the DataFrame is measured with memory_usage(deep=True), since pandas keeps
+strings in Arrow buffers tracemalloc does not see. Timings come from a
+separate run without tracemalloc.
+
+Usage:
+    python bench_report_rows.py                      # 100k rows
+    python bench_report_rows.py --rows 250000 --tests 2000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from report_rows import SUMMARY_ROW_COLUMNS, ReportRowBatch
+
+DATETIME_FORMAT = "%m/%d/%Y %H:%M:%S"
+TIME_FORMATS = {"Start Time": DATETIME_FORMAT, "End Time": DATETIME_FORMAT}
+STATUSES = ["pass", "fail", "skip"]
+
+
+def iter_synthetic_rows(rows, tests, tests_per_report=50, seed=11):
+    rng = np.random.default_rng(seed)
+    base = np.datetime64("2025-05-01T08:00:00")
+    starts = base + rng.integers(0, 60 * 24 * 3600, rows).astype("timedelta64[s]")
+    ends = starts + rng.integers(5, 1800, rows).astype("timedelta64[s]")
+    start_text = pd.Series(starts).dt.strftime(DATETIME_FORMAT).tolist()
+    end_text = pd.Series(ends).dt.strftime(DATETIME_FORMAT).tolist()
+    names = [f"com.example.tests.Suite{i % 37}.test{i}" for i in range(tests)]
+    name_codes = rng.integers(0, tests, rows).tolist()
+    status_codes = rng.integers(0, len(STATUSES), rows).tolist()
+    for i in range(rows):
+        # Each report builds its own dicts and strings, like the extractors do
+        yield {
+            "HTML Report": f"run{i // tests_per_report}/index.html",
+            "Test Name": "".join(names[name_codes[i]]),
+            "Test Status": "".join(STATUSES[status_codes[i]]),
+            "Start Time": "".join(start_text[i]),
+            "End Time": "".join(end_text[i]),
+        }
+
+
+def collect_dicts(rows):
+    return list(rows)
+
+
+def collect_batch(rows):
+    batch = ReportRowBatch(SUMMARY_ROW_COLUMNS, TIME_FORMATS)
+    batch.extend(rows)
+    return batch
+
+
+def dicts_to_pandas(rows):
+    df = pd.DataFrame(rows)
+    df["Start Time"] = pd.to_datetime(df["Start Time"], format=DATETIME_FORMAT, errors="coerce")
+    df["End Time"] = pd.to_datetime(df["End Time"], format=DATETIME_FORMAT, errors="coerce")
+    return df
+
+
+def batch_to_pandas(batch):
+    return batch.to_pandas(sort_categories=True)
+
+
+def measure(rows, tests, collect, to_pandas):
+    """Return (collected bytes, DataFrame bytes, seconds, DataFrame)."""
+    gc.collect()
+    tracemalloc.start()
+    collected = collect(iter_synthetic_rows(rows, tests))
+    collected_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del collected
+    gc.collect()
+
+    rows_iter = iter_synthetic_rows(rows, tests)
+    start = time.perf_counter()
+    df = to_pandas(collect(rows_iter))
+    seconds = time.perf_counter() - start
+    return collected_bytes, df.memory_usage(deep=True).sum(), seconds, df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--tests", type=int, default=1000, help="Distinct test names")
+    args = parser.parse_args()
+
+    print(f"{'Container':<16}{'Rows':>10}{'Rows B/row':>12}{'Frame B/row':>13}{'Seconds':>9}")
+    for rows in args.rows:
+        frames = []
+        for label, collect, to_pandas in (("list of dicts", collect_dicts, dicts_to_pandas),
+                                          ("ReportRowBatch", collect_batch, batch_to_pandas)):
+            collected_bytes, frame_bytes, seconds, df = measure(rows, args.tests, collect, to_pandas)
+            frames.append(df)
+            print(f"{label:<16}{rows:>10}{collected_bytes / rows:>12.0f}{frame_bytes / rows:>13.0f}{seconds:>9.2f}")
+        same = frames[0].astype(str).equals(frames[1].astype(str))
+        print(f"{'':<16}{'':>10}  DataFrames {'identical' if same else 'DIFFERENT'}")
+
+
+if __name__ == "__main__":
+    main()
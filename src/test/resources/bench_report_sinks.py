@@ -0,0 +1,81 @@
+"""
+Write / read cost of the report_sinks formats for a detail table.
+
+A synthetic python5.py-shaped table (File Path, Test Name, Test Status, typed
+Test Start / End Time, Time Taken) is written to every sink, then read back
+the way python6.py / python7.py read it: only Test Name and the two times,
+with the times as datetime64 (CSV strings parsed with extent_times).
+Every read is checked against the in-memory table.
+
+Usage:
+    python bench_report_sinks.py                     # 200k rows, Excel skipped
+    python bench_report_sinks.py --rows 50000 --excel
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from extent_times import to_datetime_column
+from report_sinks import CSV_TIME_FORMAT, read_table, write_table
+
+COLUMNS = ["Test Name", "Test Start Time", "Test End Time"]
+
+
+def synthetic_details(rows, tests, seed=5):
+    rng = np.random.default_rng(seed)
+    starts = np.datetime64("2025-05-01T08:00:00") + rng.integers(0, 60 * 24 * 3600, rows).astype("timedelta64[s]")
+    ends = starts + rng.integers(5, 1800, rows).astype("timedelta64[s]")
+    names = np.array([f"com.example.tests.Suite{i % 37}.test{i}" for i in range(tests)], dtype=object)
+    return pd.DataFrame({
+        "File Path": pd.Categorical([f"run{i // 300}/index.html" for i in range(rows)]),
+        "Test Name": pd.Categorical(names[rng.integers(0, tests, rows)]),
+        "Test Status": pd.Categorical(np.array(["pass", "fail", "skip"], dtype=object)[rng.integers(0, 3, rows)]),
+        "Test Start Time": pd.Series(starts).astype("datetime64[us]"),
+        "Test End Time": pd.Series(ends).astype("datetime64[us]"),
+        "Time Taken": "0h 1m 0s",
+    })
+
+
+def read_projected(path):
+    df = read_table(path, COLUMNS, keep_default_na=False)
+    for col in COLUMNS[1:]:
+        df[col] = to_datetime_column(df[col], CSV_TIME_FORMAT)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--tests", type=int, default=2000, help="Distinct test names")
+    parser.add_argument("--excel", action="store_true", help="Also time the .xlsx sink (slow)")
+    args = parser.parse_args()
+
+    df = synthetic_details(args.rows, args.tests)
+    expected = df[COLUMNS].astype({"Test Name": object})
+    suffixes = [".csv", ".csv.gz", ".parquet", ".arrow"] + ([".xlsx"] if args.excel else [])
+
+    print(f"{'Sink':<10}{'Write s':>9}{'Read s':>9}{'MB':>8}  Read back")
+    with tempfile.TemporaryDirectory() as tmp:
+        for suffix in suffixes:
+            path = os.path.join(tmp, "extent_report_test_details" + suffix)
+            start = time.perf_counter()
+            write_table(df, path)
+            write_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            back = read_projected(path)
+            read_seconds = time.perf_counter() - start
+
+            back = back.astype({"Test Name": object})
+            same = all((back[col].to_numpy() == expected[col].to_numpy()).all() for col in COLUMNS)
+            print(f"{suffix:<10}{write_seconds:>9.2f}{read_seconds:>9.2f}{os.path.getsize(path) / 2 ** 20:>8.1f}  "
+                  f"{'identical' if same else 'DIFFERENT'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Peak memory of the streaming "test run details" export against row count.
+
+Synthetic extractor rows, shaped like bench_report_rows.py's but generated
+one report at a time (so the generator itself holds nothing), are fed into excel_workbook.DetailSheetStream over a write-only workbook, the way
+ExtentReport-Excel-Summary.py streams them, and the workbook is saved.
+tracemalloc's peak should stay flat as rows grow; --max-rows lowers the
+per-sheet limit to show the "test run details (2)", ... rollover without
+writing millions of rows.
+
+Usage:
+    python bench_streaming_export.py                          # 10k, 20k, 40k rows
+    python bench_streaming_export.py --rows 30000 --max-rows 12000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+
+from bench_report_rows import DATETIME_FORMAT, STATUSES
+from excel_workbook import DETAILS_SHEET, EXCEL_MAX_ROWS, DetailSheetStream
+
+REPORT_ROWS = 50  # rows per extracted report, as handed to extend()
+
+
+def iter_synthetic_reports(rows, tests, seed=11):
+    """Yield lists of REPORT_ROWS row dicts, each report generated when it is asked for."""
+    rng = np.random.default_rng(seed)
+    base = np.datetime64("2025-05-01T08:00:00")
+    for report, first in enumerate(range(0, rows, REPORT_ROWS)):
+        size = min(REPORT_ROWS, rows - first)
+        starts = base + rng.integers(0, 60 * 24 * 3600, size).astype("timedelta64[s]")
+        ends = starts + rng.integers(5, 1800, size).astype("timedelta64[s]")
+        yield [{
+            "HTML Report": f"run{report}/index.html",
+            "Test Name": f"com.example.tests.Suite{name % 37}.test{name}",
+            "Test Status": STATUSES[status],
+            "Start Time": start.item().strftime(DATETIME_FORMAT),
+            "End Time": end.item().strftime(DATETIME_FORMAT),
+        } for name, status, start, end in zip(rng.integers(0, tests, size).tolist(),
+                                              rng.integers(0, len(STATUSES), size).tolist(), starts, ends)]
+
+
+def add_durations(df):
+    df["Start Time"] = pd.to_datetime(df["Start Time"], format=DATETIME_FORMAT, errors="coerce")
+    df["End Time"] = pd.to_datetime(df["End Time"], format=DATETIME_FORMAT, errors="coerce")
+    df["Duration (mins)"] = ((df["End Time"] - df["Start Time"]).dt.total_seconds() / 60).clip(lower=0).round(2)
+    return df
+
+
+def stream_export(path, rows, tests, max_rows):
+    """Stream rows into path; returns (sheet titles, peak bytes, seconds)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    wb = Workbook(write_only=True)
+    details = DetailSheetStream(wb, DETAILS_SHEET, prepare=add_durations, max_rows=max_rows)
+    for report in iter_synthetic_reports(rows, tests):
+        details.extend(report)
+    details.flush()
+    wb.save(path)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return [ws.title for ws in details.sheet.sheets], peak, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 20_000, 40_000])
+    parser.add_argument("--tests", type=int, default=1000, help="Distinct test names")
+    parser.add_argument("--max-rows", type=int, default=EXCEL_MAX_ROWS, help="Rows per sheet, header included")
+    args = parser.parse_args()
+
+    print(f"{'Rows':>10}{'Sheets':>8}{'Peak MB':>10}{'Seconds':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = os.path.join(tmp, f"details-{rows}.xlsx")
+            titles, peak, seconds = stream_export(path, rows, args.tests, args.max_rows)
+            print(f"{rows:>10}{len(titles):>8}{peak / 2 ** 20:>10.1f}{seconds:>9.1f}")
+
+        wb = load_workbook(path, read_only=True)
+        written = sum(sum(1 for _ in wb[title].iter_rows(values_only=True)) - 1 for title in titles)
+        print(f"\nLast run: {', '.join(titles)}; {written} data rows read back "
+              f"({'all rows' if written == args.rows[-1] else 'ROWS MISSING'})")
+
+
+if __name__ == "__main__":
+    main()
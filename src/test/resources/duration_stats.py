@@ -0,0 +1,259 @@
+"""
+Chunked, bounded-memory duration statistics for test detail CSVs of any size.
+
+The detail CSV (extent_report_test_details.csv and friends) is read in
+fixed-size batches; each batch's times are parsed with extent_times and
+reduced with vectorized group operations into per-test state that is
+mergeable, so batches, files or worker results can be combined in any order:
+
+- count, sum, min, max
+- mean and variance, batch moments merged with the parallel form of
+  Welford's algorithm (Chan et al.), so the variance stays accurate on
+  100M-row histories
+- a DDSketch-style quantile sketch (log-spaced buckets with a fixed relative
+  accuracy) for p50/p90/p99; its size depends on the spread of a test's
+  durations, never on the number of runs. Durations <= 0 are counted in a
+  zero bucket.
+
+Usage:
+    python duration_stats.py test-reports/extent_report_test_details.parquet
+    python duration_stats.py history-*.csv --chunk-rows 500000 --unit sec -o stats.csv
+"""
+
+import argparse
+import math
+import os
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from extent_times import EPOCH_UNIT, NAT, detect_time_format, parse_epoch
+from report_sinks import iter_table_batches, write_table
+
+NAME_COL = "Test Name"
+START_COL = "Test Start Time"
+END_COL = "Test End Time"
+CHUNK_ROWS = 1_000_000
+RELATIVE_ACCURACY = 0.01
+QUANTILES = (0.5, 0.9, 0.99)
+UNIT_SECONDS = {"sec": 1, "min": 60}
+EPOCH_TICKS_PER_SECOND = np.timedelta64(1, "s") // np.timedelta64(1, EPOCH_UNIT)
+BUCKET_BITS = 24  # bucket index range inside a combined (test, bucket) key
+
+
+# === Quantile sketch ===
+class DurationSketch:
+    """Mergeable quantile sketch: every estimate is within relative_accuracy of a true value."""
+
+    def __init__(self, relative_accuracy=RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = Counter()
+        self.zero_count = 0
+
+    @property
+    def count(self):
+        return self.zero_count + sum(self.buckets.values())
+
+    def bucket_indexes(self, values):
+        """Bucket of each positive value: ceil(log_gamma(value))."""
+        return np.ceil(np.log(values) / self.log_gamma).astype(np.int64)
+
+    def add(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        positive = values[values > 0]
+        self.zero_count += len(values) - len(positive)
+        indexes, counts = np.unique(self.bucket_indexes(positive), return_counts=True)
+        self.buckets.update(dict(zip(indexes.tolist(), counts.tolist())))
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        self.buckets.update(other.buckets)
+        self.zero_count += other.zero_count
+
+    def quantile(self, q):
+        """Estimate of the value at rank floor(q * (count - 1)), like quantile(interpolation="lower")."""
+        total = self.count
+        if not total:
+            return math.nan
+        rank = q * (total - 1)
+        if rank < self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return 2 * self.gamma ** index / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+# === Per-test state ===
+class DurationStats:
+    """count/sum/min/max, Welford mean and M2, and a quantile sketch for one test."""
+
+    def __init__(self, relative_accuracy=RELATIVE_ACCURACY):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of squared deviations from the mean
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.sketch = DurationSketch(relative_accuracy)
+
+    def merge_moments(self, count, total, mean, m2, minimum, maximum):
+        if not count:
+            return
+        combined = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / combined
+        self.m2 += m2 + delta * delta * self.count * count / combined
+        self.count = combined
+        self.total += total
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+
+    def merge(self, other):
+        self.merge_moments(other.count, other.total, other.mean, other.m2, other.minimum, other.maximum)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def variance(self):
+        """Sample variance, like pandas .var()."""
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+
+class DurationAggregator:
+    """Per-test DurationStats fed by vectorized batches; aggregators merge like their stats."""
+
+    def __init__(self, relative_accuracy=RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.tests = {}
+        self.rows = 0
+        self.skipped = 0
+
+    def _stats(self, name):
+        stats = self.tests.get(name)
+        if stats is None:
+            stats = self.tests[name] = DurationStats(self.relative_accuracy)
+        return stats
+
+    def add_batch(self, names, durations):
+        """Absorb one batch: names and durations are equal-length arrays, NaN durations skipped."""
+        names = np.asarray(names, dtype=object)
+        durations = np.asarray(durations, dtype=np.float64)
+        valid = ~np.isnan(durations) & pd.notna(names)
+        self.skipped += int(len(durations) - valid.sum())
+        names, durations = names[valid], durations[valid]
+        self.rows += len(durations)
+        if not len(durations):
+            return
+
+        codes, uniques = pd.factorize(names)
+        counts = np.bincount(codes)
+        totals = np.bincount(codes, weights=durations)
+        means = totals / counts
+        m2s = np.bincount(codes, weights=(durations - means[codes]) ** 2)
+        grouped = pd.Series(durations).groupby(codes)
+        minimums = grouped.min().to_numpy()
+        maximums = grouped.max().to_numpy()
+
+        stats = [self._stats(name) for name in uniques]
+        for code, test in enumerate(stats):
+            test.merge_moments(int(counts[code]), totals[code], means[code], m2s[code],
+                               minimums[code], maximums[code])
+
+        # Sketch buckets for every (test, bucket) pair of the batch in one np.unique
+        sketch = stats[0].sketch
+        positive = durations > 0
+        zero_counts = np.bincount(codes[~positive], minlength=len(uniques))
+        buckets = sketch.bucket_indexes(durations[positive])
+        keys = (codes[positive].astype(np.int64) << BUCKET_BITS) + (buckets + (1 << (BUCKET_BITS - 1)))
+        keys, key_counts = np.unique(keys, return_counts=True)
+        key_codes = keys >> BUCKET_BITS
+        key_buckets = (keys & ((1 << BUCKET_BITS) - 1)) - (1 << (BUCKET_BITS - 1))
+        for code, bucket, count in zip(key_codes.tolist(), key_buckets.tolist(), key_counts.tolist()):
+            stats[code].sketch.buckets[bucket] += count
+        for code in np.flatnonzero(zero_counts).tolist():
+            stats[code].sketch.zero_count += int(zero_counts[code])
+
+    def merge(self, other):
+        for name, stats in other.tests.items():
+            self._stats(name).merge(stats)
+        self.rows += other.rows
+        self.skipped += other.skipped
+
+    def summary_frame(self, unit="min"):
+        scale = UNIT_SECONDS[unit]
+        records = []
+        for name in sorted(self.tests):
+            stats = self.tests[name]
+            record = {
+                "Test Name": name,
+                "Count": stats.count,
+                f"Total ({unit})": stats.total / scale,
+                f"Mean ({unit})": stats.mean / scale,
+                f"Std ({unit})": math.sqrt(stats.variance) / scale,
+                f"Min ({unit})": stats.minimum / scale,
+                f"Max ({unit})": stats.maximum / scale,
+            }
+            for q in QUANTILES:
+                record[f"p{round(q * 100)} ({unit})"] = stats.sketch.quantile(q) / scale
+            records.append(record)
+        return pd.DataFrame(records).round(2)
+
+
+# === Chunked reader ===
+def iter_duration_batches(csv_path, chunk_rows=CHUNK_ROWS, name_col=NAME_COL, start_col=START_COL,
+                          end_col=END_COL):
+    """
+    Yield (names, durations in seconds) per batch of chunk_rows rows; unparseable rows give NaN.
+
+    csv_path may also be a .parquet / .arrow table (report_sinks), read three columns at a time.
+    """
+    formats = {}
+    reader = iter_table_batches(csv_path, [name_col, start_col, end_col], chunk_rows, keep_default_na=False)
+    for chunk in reader:
+        times = {}
+        for col in (start_col, end_col):
+            # Detect each column's format once, on its first batch (typed timestamps need none)
+            if col not in formats:
+                typed = pd.api.types.is_datetime64_any_dtype(chunk[col])
+                formats[col] = None if typed else detect_time_format(chunk[col])
+            times[col] = parse_epoch(chunk[col], formats[col])
+        start, end = times[start_col], times[end_col]
+        missing = (start == NAT) | (end == NAT)
+        durations = (end - start) / EPOCH_TICKS_PER_SECOND
+        durations[missing] = np.nan
+        names = chunk[name_col].astype(object)
+        yield names.where(names != "", np.nan).to_numpy(dtype=object), durations
+
+
+def aggregate_csv(csv_paths, chunk_rows=CHUNK_ROWS, relative_accuracy=RELATIVE_ACCURACY):
+    aggregator = DurationAggregator(relative_accuracy)
+    for csv_path in csv_paths:
+        for names, durations in iter_duration_batches(csv_path, chunk_rows):
+            aggregator.add_batch(names, durations)
+            print(f"📊 {os.path.basename(csv_path)}: {aggregator.rows:,} runs aggregated, "
+                  f"{len(aggregator.tests):,} tests")
+    return aggregator
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("csv", nargs="+", help="Detail CSV(s) or .parquet/.arrow tables with Test Name / "
+                                               "Test Start Time / Test End Time")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="Rows read per batch")
+    parser.add_argument("--unit", choices=sorted(UNIT_SECONDS), default="min")
+    parser.add_argument("--accuracy", type=float, default=RELATIVE_ACCURACY, help="Relative accuracy of p50/p90/p99")
+    parser.add_argument("-o", "--output", help="Output .csv/.csv.gz/.parquet/.arrow/.xlsx "
+                                               "(default: extent_report_stats.csv next to the first input)")
+    args = parser.parse_args()
+
+    output_path = args.output or os.path.join(os.path.dirname(args.csv[0]), "extent_report_stats.csv")
+    aggregator = aggregate_csv(args.csv, args.chunk_rows, args.accuracy)
+    write_table(aggregator.summary_frame(args.unit), output_path)
+    print(f"✅ Stats for {len(aggregator.tests)} tests ({aggregator.rows:,} runs, "
+          f"{aggregator.skipped:,} rows without valid times) saved to: {output_path}")
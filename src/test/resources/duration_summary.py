@@ -0,0 +1,159 @@
+"""
+Vectorized "summary report" engine: one row per test with its run durations.
+
+Replaces the per-group Python of the original summarize_test_durations
+copies (a list of (start, duration) tuples, groupby(...).agg(lambda ...)
+sorting every group, a second groupby, a merge and a DataFrame built from
+a list of lists) with one sort, a run index per test and a single scatter
+into the run-1..run-N matrix. The output frame is identical, column for
+column and bit for bit, to what those copies produce.
+
+The full history is also available in long format (one row per run with its
+Run Index, see runs_long()); the wide run-N view is built from it and can
+be limited to each test's last K runs, since a single test with thousands of
+runs otherwise widens every row past Excel's 16,384-column limit. The run
+columns are sparse by default, so a test with thousands of runs never
+allocates the dense tests x runs NaN matrix; pass sparse=False for plain
+float columns.
+"""
+
+import numpy as np
+import pandas as pd
+
+RUN_ORDERS = ("start", "longest")
+RUN_INDEX_COL = "Run Index"
+EXCEL_MAX_COLUMNS = 16_384
+MAX_EXCEL_RUNS = EXCEL_MAX_COLUMNS - 4  # next to Test Name, Count, Total_Time, Max_Time
+
+
+def _ordered_runs(df, name_col, start_col, duration_col, run_order):
+    """Return (runs, codes, order): named rows, their test codes (sorted names), and the run order."""
+    if run_order not in RUN_ORDERS:
+        raise ValueError(f"Unknown run order '{run_order}', expected one of {RUN_ORDERS}")
+
+    runs = df[df[name_col].notna()]
+    codes, _ = pd.factorize(runs[name_col], sort=True)
+    durations = runs[duration_col].to_numpy(dtype=np.float64)
+
+    if run_order == "start":
+        starts = runs[start_col].to_numpy(dtype="datetime64[ns]").view(np.int64)
+        order = np.lexsort((durations, starts, codes))
+    else:
+        order = np.lexsort((-durations, codes))
+    return runs, codes, order
+
+
+def summarize_runs(df, name_col="Test Name", start_col="Start Time", duration_col="Duration (mins)",
+                   run_order="start", last_runs=None, sparse=True):
+    """
+    Build the summary table: name, Count, Total_Time, Max_Time, run-1 .. run-N.
+
+    Args:
+        df (pd.DataFrame): One row per test run
+        name_col (str): Test name column; rows without a name are dropped like groupby does
+        start_col (str): Run start column, only used for run_order="start"
+        duration_col (str): Run duration column
+        run_order (str): "start" orders each test's runs by (start, duration), like
+            sorted() on the (start, duration) tuples; "longest" orders durations high to
+            low (finalsummarysheet.py), missing durations last
+        last_runs (int): Keep only the last N runs of each test in the run columns
+        sparse (bool): Return the run columns as sparse (NaN-filled) columns; False builds
+            them from one dense tests x runs matrix
+
+    Returns:
+        pd.DataFrame: Tests sorted by name, run columns padded with NaN
+    """
+    # Aggregates straight from groupby, in the original row order, so sums round identically.
+    # observed=True: a Categorical name (ReportRowBatch.to_pandas) keeps categories whose rows were
+    # all dropped, and pandas < 3 would give them a row the factorized run codes do not have
+    stats = df.groupby(name_col, observed=True)[duration_col].agg(
+        Count="count", Total_Time="sum", Max_Time="max"
+    ).reset_index()
+
+    runs, codes, order = _ordered_runs(df, name_col, start_col, duration_col, run_order)
+    durations = runs[duration_col].to_numpy(dtype=np.float64)
+    run_columns = build_run_columns(codes[order], durations[order], len(stats), last_runs, sparse)
+
+    return pd.concat([stats[[name_col, "Count", "Total_Time", "Max_Time"]], run_columns], axis=1)
+
+
+def runs_long(df, name_col="Test Name", start_col="Start Time", duration_col="Duration (mins)",
+              run_order="start"):
+    """
+    Full run history in long format: name, Run Index (1-based), start, duration.
+
+    Rows are sorted by name and Run Index, in the same run order as summarize_runs.
+    """
+    runs, codes, order = _ordered_runs(df, name_col, start_col, duration_col, run_order)
+    long_df = runs[[name_col, start_col, duration_col]].iloc[order].reset_index(drop=True)
+    long_df.insert(1, RUN_INDEX_COL, _run_positions(codes[order]) + 1)
+    return long_df
+
+
+def wide_from_long(long_df, names, name_col="Test Name", duration_col="Duration (mins)", last_runs=None,
+                   sparse=True):
+    """
+    Run-1 .. run-N columns, one row per entry of names, from a runs_long() frame.
+
+    Only the runs present in long_df are scattered, column by column, so unless
+    sparse=False no dense tests x runs matrix is ever allocated.
+    """
+    codes = pd.Index(names).get_indexer(long_df[name_col])
+    known = codes >= 0
+    return _scatter_runs(codes[known], long_df[RUN_INDEX_COL].to_numpy()[known] - 1,
+                         long_df[duration_col].to_numpy(dtype=np.float64)[known], len(names),
+                         last_runs, sparse)
+
+
+def build_run_columns(codes, durations, n_tests, last_runs=None, sparse=True):
+    """
+    Scatter runs into the run-1 .. run-N frame.
+
+    Args:
+        codes (numpy.ndarray): Test row (0 .. n_tests-1) of each run, grouped by test
+        durations (numpy.ndarray): Run durations, in run order within each test
+        n_tests (int): Rows of the output frame
+        last_runs (int): Keep only the last N runs of each test
+        sparse (bool): Build sparse columns; False scatters into a dense matrix
+
+    Returns:
+        pd.DataFrame: n_tests rows, one run-i column per run of the longest test
+    """
+    return _scatter_runs(codes, _run_positions(codes), durations, n_tests, last_runs, sparse)
+
+
+def _run_positions(codes):
+    # Position of each run inside its test: rows are grouped by code
+    if not len(codes):
+        return np.zeros(0, dtype=np.int64)
+    group_starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    sizes = np.diff(np.r_[group_starts, len(codes)])
+    return np.arange(len(codes)) - np.repeat(group_starts, sizes)
+
+
+def _scatter_runs(codes, run_index, durations, n_tests, last_runs, sparse):
+    if last_runs is not None and len(codes):
+        # Window each test to its last runs, renumbered from run-1
+        counts = np.zeros(n_tests, dtype=np.int64)
+        np.maximum.at(counts, codes, run_index + 1)
+        skipped = np.maximum(counts - last_runs, 0)[codes]
+        keep = run_index >= skipped
+        codes, run_index, durations = codes[keep], (run_index - skipped)[keep], durations[keep]
+
+    width = int(run_index.max()) + 1 if len(run_index) else 0
+    columns = [f"run-{i+1}" for i in range(width)]
+    if not sparse:
+        matrix = np.full((n_tests, width), np.nan)
+        matrix[codes, run_index] = durations
+        return pd.DataFrame(matrix, columns=columns)
+
+    # One column at a time: only a single dense column is alive while converting
+    order = np.lexsort((codes, run_index))
+    bounds = np.searchsorted(run_index[order], np.arange(width + 1))
+    data = {}
+    for i, column in enumerate(columns):
+        rows = order[bounds[i]:bounds[i + 1]]
+        values = np.full(n_tests, np.nan)
+        values[codes[rows]] = durations[rows]
+        data[column] = pd.arrays.SparseArray(values, fill_value=np.nan)
+    return pd.DataFrame(data, index=pd.RangeIndex(n_tests))
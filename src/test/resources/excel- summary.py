@@ -1,61 +1,49 @@
 import os
+import argparse
 import pandas as pd
 from datetime import datetime
-from bs4 import BeautifulSoup
+from extent_html_parser import iter_test_fields
+from extent_times import to_datetime_column
+from duration_summary import MAX_EXCEL_RUNS, summarize_runs
+from excel_workbook import write_summary_workbook
+from report_ingest import load_report_rows
+from report_rows import DICTIONARY, SUMMARY_ROW_COLUMNS, ReportRowBatch
+from report_cache import CACHE_DIR, ReportRowCache
+from report_manifest import ReportManifest
 
 # === Configuration ===
-PROCESSED_LOG_FILE = "processed_files.csv"
+MANIFEST_PATH = "processed_reports.sqlite"  # Tracks ingested reports by path + content hash
+PARSER_BACKEND = "auto"  # "auto" (sniff report layout), "stream" (v3/v4 layout only) or "bs4" (BeautifulSoup tree)
 DATETIME_FORMAT = "%m/%d/%Y %H:%M:%S"
-
-# === Load processed file names to avoid re-processing ===
-def load_processed_files():
-    if os.path.exists(PROCESSED_LOG_FILE):
-        return set(pd.read_csv(PROCESSED_LOG_FILE)['filename'])
-    return set()
-
-def save_processed_file(filename):
-    mode = 'a' if os.path.exists(PROCESSED_LOG_FILE) else 'w'
-    header = not os.path.exists(PROCESSED_LOG_FILE)
-    with open(PROCESSED_LOG_FILE, mode) as f:
-        if header:
-            f.write("filename\n")
-        f.write(f"{filename}\n")
+LAST_RUNS = MAX_EXCEL_RUNS  # run-N columns kept per test (latest runs); Excel sheets stop at 16,384 columns
 
 # === Extract test data from one HTML file ===
 def extract_tests_from_html(html_path):
-    with open(html_path, "r", encoding="utf-8", errors="ignore") as f:
-        soup = BeautifulSoup(f, "html.parser")
-
     test_data = []
 
-    for test in soup.select("ul.test-collection > li"):
+    for test in iter_test_fields(html_path, backend=PARSER_BACKEND):
         test_name = "Unknown"
         test_status = "Unknown"
         test_start = ""
         test_end = ""
         duration = ""
 
-        name_span = test.select_one("span.test-name")
-        if name_span:
-            test_name = name_span.text.strip()
+        if test["name"] is not None:
+            test_name = test["name"]
 
-        status_span = test.select_one("span.test-status")
-        if status_span:
-            test_status = status_span.text.strip()
+        if test["status"] is not None:
+            test_status = test["status"]
 
-        start_span = test.select_one("span.test-started-time")
-        if start_span:
-            test_start = start_span.text.strip()
+        if test["started"] is not None:
+            test_start = test["started"]
 
-        end_span = test.select_one("span.test-ended-time")
-        if end_span:
-            test_end = end_span.text.strip()
+        if test["ended"] is not None:
+            test_end = test["ended"]
 
         # Fallback if end time is missing
         if not test_end or test_end.strip() == "":
-            timestamps = test.select("td.timestamp")
-            if timestamps:
-                last_step_time = timestamps[-1].text.strip()
+            if test["last_timestamp"] is not None:
+                last_step_time = test["last_timestamp"]
                 if test_start and len(test_start.split()) == 2:
                     test_date = test_start.split()[0]
                     test_end = f"{test_date} {last_step_time}"
@@ -85,59 +73,30 @@ def extract_tests_from_html(html_path):
 
 # === Generate summary report DataFrame ===
 def summarize_test_durations(df):
-    df["Start Time"] = pd.to_datetime(df["Start Time"], errors="coerce")
-    df["End Time"] = pd.to_datetime(df["End Time"], errors="coerce")
+    df["Start Time"] = to_datetime_column(df["Start Time"], DATETIME_FORMAT)
+    df["End Time"] = to_datetime_column(df["End Time"], DATETIME_FORMAT)
     df = df.dropna(subset=["Start Time", "End Time"])
 
     df["Duration (mins)"] = round((df["End Time"] - df["Start Time"]).dt.total_seconds() / 60, 2)
-    df["Start+Duration"] = list(zip(df["Start Time"], df["Duration (mins)"]))
-
-    grouped = df.groupby("Test Name")["Start+Duration"].agg(
-        SortedRuns=lambda x: [d for _, d in sorted(x)]
-    ).reset_index()
-
-    agg_stats = df.groupby("Test Name")["Duration (mins)"].agg(
-        Count="count", Total_Time="sum", Max_Time="max"
-    ).reset_index()
 
-    merged = pd.merge(grouped, agg_stats, on="Test Name")
-
-    max_runs = merged["SortedRuns"].apply(len).max()
-    run_columns = pd.DataFrame(merged["SortedRuns"].tolist(),
-                               columns=[f"run-{i+1}" for i in range(max_runs)])
-
-    summary_df = pd.concat([
-        merged[["Test Name", "Count", "Total_Time", "Max_Time"]],
-        run_columns
-    ], axis=1)
-
-    return summary_df
+    return summarize_runs(df, "Test Name", "Start Time", "Duration (mins)", last_runs=LAST_RUNS)
 
 # === Main runner to process folder and generate Excel ===
-def extract_all_reports_from_folder(folder_path, output_excel):
-    all_data = []
-    processed = load_processed_files()
-
-    for root, _, files in os.walk(folder_path):
-        for file in files:
-            if file.lower().endswith(".html") and file not in processed:
-                html_path = os.path.join(root, file)
-                print(f"🔍 Processing: {html_path}")
-                try:
-                    test_info = extract_tests_from_html(html_path)
-                    if test_info:
-                        all_data.extend(test_info)
-                        save_processed_file(file)
-                except Exception as e:
-                    print(f"❌ Error reading {file}: {e}")
-
-    if all_data:
-        df = pd.DataFrame(all_data)
+def extract_all_reports_from_folder(folder_path, output_excel, workers=1):
+    with ReportManifest(MANIFEST_PATH) as manifest:
+        cache = ReportRowCache(os.path.join(folder_path, CACHE_DIR), namespace="excel-summary",
+                               backend=PARSER_BACKEND)
+        rows = ReportRowBatch({**SUMMARY_ROW_COLUMNS, "Duration (mins)": DICTIONARY},
+                              {"Start Time": DATETIME_FORMAT, "End Time": DATETIME_FORMAT})
+        all_data, changed = load_report_rows(folder_path, extract_tests_from_html, manifest, cache,
+                                             workers=workers, reprocess_all=False, rows=rows)
+
+    if all_data and (changed or not os.path.exists(output_excel)):
+        df = all_data.to_pandas(sort_categories=True)
         summary_df = summarize_test_durations(df)
 
-        with pd.ExcelWriter(output_excel, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name="test run details")
-            summary_df.to_excel(writer, index=False, sheet_name="summary report")
+        # Write-only workbook; details past 1,048,576 rows continue in "test run details (2)", ...
+        write_summary_workbook(output_excel, df, summary_df, charts=False)
 
         print(f"\n✅ {len(df)} test entries written to '{output_excel}' with summary.")
     else:
@@ -147,4 +106,10 @@ def extract_all_reports_from_folder(folder_path, output_excel):
 if __name__ == "__main__":
     folder_to_scan = "Reports"  # Update this to your HTML reports folder
     output_excel = "Test_Run_Details.xlsx"
-    extract_all_reports_from_folder(folder_to_scan, output_excel)
\ No newline at end of file
+
+    parser = argparse.ArgumentParser(description="Summarize Extent HTML reports into an Excel workbook")
+    parser.add_argument("folder", nargs="?", default=folder_to_scan, help="Folder to scan for .html reports")
+    parser.add_argument("--workers", type=int, default=1, help="Parse reports in N worker processes")
+    args = parser.parse_args()
+
+    extract_all_reports_from_folder(args.folder, output_excel, workers=args.workers)
\ No newline at end of file
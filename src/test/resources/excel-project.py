@@ -12,7 +12,11 @@ Features:
 - Parses pipe-separated test steps
 - Updates columns B & C with structured design steps and expected results
 - Preserves existing data
-- Provides detailed logging and verification
+- Provides detailed logging and verification, or summaries and progress only (--quiet)
+- Loads the workbook once, saves it once and reports per-phase timings
+- Batch mode: many workbooks (files, directories, globs) and sheets across a process pool
+- Incremental mode: a sidecar cache of description hashes, so reruns reparse only edited rows
+- Phase profiler: wall time, rows/sec and peak traced memory per phase, as a JSON report (--profile)
 - Auto-activates virtual environment if needed
 
 Author: AI Assistant
@@ -71,11 +75,25 @@ def ensure_virtual_environment():
 ensure_virtual_environment()
 
 # Now we can safely import the required packages
+import functools
+import glob
+import gzip
+import hashlib
+import json
+import logging
+import platform
+import re
+import time
+import tracemalloc
+from datetime import datetime
 import pandas as pd
 import openpyxl
 from openpyxl import load_workbook
 from typing import Tuple, Optional
 
+from report_ingest import iter_extracted_reports
+from report_manifest import hash_file
+
 # ========================================
 # CONFIGURATION - UPDATE THESE VARIABLES
 # ========================================
@@ -84,18 +102,124 @@ SHEET_NAME = "Input"               # Sheet name containing the data (change if d
 CREATE_BACKUP = False              # Whether to create backup before processing (True/False)
 FORCE_REPROCESS = True             # Process ALL rows even if columns B & C have data (True/False)
 INDIVIDUAL_RECORDS = False         # Create individual rows for each step (True/False)
+INCREMENTAL = False                # Only reparse rows whose Description changed since the last run (True/False)
+KEY_COLUMN = "ID"                  # Column identifying a row across runs, for INCREMENTAL (row number if missing)
+LOG_LEVEL = "DEBUG"                # Console output: DEBUG (every row), INFO (phases, summaries, progress), WARNING (problems only)
+PROFILE_REPORT = None              # JSON file for the phase profile (e.g. "profile.json"), or None
 
 # Examples:
 # EXCEL_FILE = "MyTestData.xlsx"
 # SHEET_NAME = "TestCases" 
 # CREATE_BACKUP = False
 # FORCE_REPROCESS = False          # Only process empty cells (default behavior)
+# INCREMENTAL = True               # Reparse edited descriptions only (steps cached in Book1.steps-cache.json.gz)
 # ========================================
 
+# Batch mode: consolidated per-workbook results (any report_sinks suffix: .csv, .parquet, .xlsx, ...)
+BATCH_RESULTS = "description_batch_results.csv"
+BATCH_COLUMNS = ["File", "Sheets", "Rows Updated", "Rows Skipped", "Rows Failed", "Seconds", "Status", "Error"]
+
+# Progress lines are logged every PROGRESS_EVERY rows when rows are not logged one by one
+PROGRESS_EVERY = 10_000
+
+
+logger = logging.getLogger("excel_project")
+
+
+def configure_logging(level=LOG_LEVEL):
+    """Send the processor's messages, as plain lines, to stdout at level (a name such as "INFO" or a number)."""
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(level)
+
+
+configure_logging()
+
+# Patterns and keyword matcher of the step parser, compiled once for parse_descriptions()
+STEP_PATTERN = re.compile(r'\|\s*Step[-\d][^|]*\|', re.IGNORECASE)  # Step-1, Step1, ... but not "Step No"
+STEP_NUMBER_PATTERN = re.compile(r'\|\s*(Step[-\d][^|]*)\|')
+EXPECTED_KEYWORDS = ['should', 'expected', 'result', 'verify', 'confirm', 'display', 'show', 'must', 'will']
+EXPECTED_KEYWORD_PATTERN = re.compile('|'.join(re.escape(keyword) for keyword in EXPECTED_KEYWORDS))
+
+# Bump when the parser's output changes: caches written by another version are discarded
+PARSER_VERSION = 1
+
+
+class DescriptionCache:
+    """
+    Sidecar cache of parsed descriptions for one workbook (<workbook>.steps-cache.json.gz).
+    
+    Per sheet, every row's key (KEY_COLUMN value) maps to [description sha256,
+    design steps, expected results], so an incremental run reparses only rows
+    whose Description changed. The workbook's own sha256 after the last run is
+    kept as well: an untouched workbook is not even loaded. Caches of another
+    PARSER_VERSION, and sheets cached under another key column, are ignored.
+    """
+    
+    def __init__(self, workbook_path: str):
+        self.workbook_path = workbook_path
+        self.path = f"{os.path.splitext(workbook_path)[0]}.steps-cache.json.gz"
+        self.workbook_sha256 = None
+        self.workbook_sheets = []
+        self.sheets = {}  # sheet -> {"key_column": ..., "rows": {key: [sha256, design, expected]}}
+        if os.path.exists(self.path):
+            try:
+                with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.warning(f"⚠️  Ignoring unreadable cache {self.path}: {e}")
+                return
+            if data.get("version") == PARSER_VERSION:
+                self.workbook_sha256 = data["workbook_sha256"]
+                self.workbook_sheets = data["workbook_sheets"]
+                self.sheets = data["sheets"]
+    
+    @staticmethod
+    def description_hash(description) -> str:
+        """sha256 of a Description cell; the type is included since 5 and "5" are different cells."""
+        text = "" if pd.isna(description) else f"{type(description).__name__}:{description}"
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    
+    def rows(self, sheet_name: str, key_column) -> dict:
+        """Cached rows of sheet_name, or {} if it was cached under another key column."""
+        sheet = self.sheets.get(sheet_name)
+        if sheet is None or sheet["key_column"] != key_column:
+            return {}
+        return sheet["rows"]
+    
+    def set_rows(self, sheet_name: str, key_column, rows: dict):
+        self.sheets[sheet_name] = {"key_column": key_column, "rows": rows}
+    
+    def is_current(self, sheet_names) -> bool:
+        """True if the workbook is unchanged since the cache was saved and every sheet it has was cached."""
+        if self.workbook_sha256 is None or not os.path.exists(self.workbook_path):
+            return False
+        if any(name in self.workbook_sheets and name not in self.sheets for name in sheet_names):
+            return False
+        return hash_file(self.workbook_path) == self.workbook_sha256
+    
+    def cached_row_count(self, sheet_names) -> int:
+        return sum(len(self.sheets[name]["rows"]) for name in sheet_names if name in self.sheets)
+    
+    def save(self, wb):
+        """Record the workbook as saved (hash and sheets) and write the cache atomically."""
+        self.workbook_sha256 = hash_file(self.workbook_path)
+        self.workbook_sheets = list(wb.sheetnames)
+        tmp_path = self.path + ".tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"version": PARSER_VERSION, "workbook_sha256": self.workbook_sha256,
+                       "workbook_sheets": self.workbook_sheets, "sheets": self.sheets}, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+
 class ExcelDescriptionProcessor:
     """Main class for processing Excel description columns."""
     
-    def __init__(self, file_path: str, sheet_name: str = 'Input', force_reprocess: bool = False, individual_records: bool = False):
+    def __init__(self, file_path: str, sheet_name: str = 'Input', force_reprocess: bool = False, individual_records: bool = False,
+                 incremental: bool = False, key_column: str = KEY_COLUMN, profile: bool = False):
         """
         Initialize the processor.
         
@@ -104,12 +228,185 @@ class ExcelDescriptionProcessor:
             sheet_name (str): Name of the sheet to process (default: 'Input')
             force_reprocess (bool): Process all rows even if columns B & C have data (default: False)
             individual_records (bool): Create individual rows for each step (default: False)
+            incremental (bool): Reparse only rows whose Description changed since the last run,
+                using the workbook's DescriptionCache (combined steps mode only; default: False)
+            key_column (str): Column identifying a row across runs (default: KEY_COLUMN)
+            profile (bool): Trace memory with tracemalloc and keep a per-phase profile, see profile_report()
+                (slows allocation-heavy phases down; default: False)
         """
         self.file_path = file_path
         self.sheet_name = sheet_name
         self.force_reprocess = force_reprocess
         self.individual_records = individual_records
+        self.incremental = incremental and not individual_records
+        self.key_column = key_column
+        self.cache = None       # DescriptionCache when incremental; batch mode shares one per workbook
         self.backup_created = False
+        self.wb = None          # openpyxl workbook, loaded once and shared by every phase
+        self.df = None          # DataFrame view of the target sheet (what pd.read_excel would return)
+        self.modified = False   # True once a phase changed the workbook; process() saves once at the end
+        self.timings = {}       # phase -> seconds
+        self.profile = profile
+        self.phase_rows = {}    # phase -> sheet rows when it ended (for rows/sec)
+        self.phase_peaks = {}   # phase -> peak traced bytes, when profiling
+        self.stats = {"updated": 0, "skipped": 0, "failed": 0}  # rows, for the batch result table
+    
+    @staticmethod
+    def _frame_from_sheet(ws) -> pd.DataFrame:
+        """
+        Build the DataFrame pd.read_excel would return for ws from the in-memory sheet.
+        
+        Args:
+            ws: openpyxl worksheet (first row is the header)
+            
+        Returns:
+            pd.DataFrame: One row per sheet row, empty cells as NaN, trailing empty rows dropped
+        """
+        rows = list(ws.iter_rows(values_only=True))
+        if not rows:
+            return pd.DataFrame()
+        header = [name if name is not None else f"Unnamed: {i}" for i, name in enumerate(rows[0])]
+        body = rows[1:]
+        while body and all(value is None for value in body[-1]):
+            body.pop()
+        return pd.DataFrame(body, columns=header)
+    
+    def load(self) -> bool:
+        """
+        Load the workbook and the target sheet's DataFrame once; later calls reuse them.
+        A workbook assigned to self.wb beforehand (batch mode, one per file) is used as is.
+        
+        Returns:
+            bool: True if the workbook is loaded
+        """
+        try:
+            if self.wb is None:
+                self.wb = load_workbook(self.file_path)
+            if self.df is None and self.sheet_name in self.wb.sheetnames:
+                self.df = self._frame_from_sheet(self.wb[self.sheet_name])
+            return True
+        except Exception as e:
+            logger.error(f"❌ Error loading Excel file: {e}")
+            return False
+    
+    def save(self) -> bool:
+        """
+        Save the shared workbook, once, if any phase modified it.
+        
+        Returns:
+            bool: True if the workbook was saved or nothing needed saving
+        """
+        if not self.modified:
+            return True
+        try:
+            self.wb.save(self.file_path)
+            self.modified = False
+            logger.info(f"\n💾 Workbook saved: {self.file_path}")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Error saving Excel file: {e}")
+            return False
+    
+    def save_cache(self) -> bool:
+        """
+        Write the description cache, after the workbook has been saved.
+        
+        Returns:
+            bool: True if the cache was written or there is none
+        """
+        if self.cache is None:
+            return True
+        try:
+            self.cache.save(self.wb)
+            logger.info(f"💾 Description cache saved: {self.cache.path}")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Error saving description cache: {e}")
+            return False
+    
+    def _row_keys(self, df: pd.DataFrame) -> Tuple[list, Optional[str]]:
+        """
+        Stable identity of every row, for the description cache.
+        
+        Args:
+            df (pd.DataFrame): The target sheet
+            
+        Returns:
+            tuple: (keys, key column used) - the key column value, repeats numbered "#2", "#3", ...;
+                   "row N" for blank keys, or for every row (key column None) if the sheet has no key column
+        """
+        if self.key_column not in df.columns:
+            logger.warning(f"⚠️  Key column '{self.key_column}' not found - rows are identified by row number")
+            return [f"row {idx + 2}" for idx in df.index], None
+        
+        keys, seen = [], {}
+        for idx, value in zip(df.index, df[self.key_column]):
+            if pd.isna(value):
+                keys.append(f"row {idx + 2}")
+                continue
+            # A blank cell turns an integer column into floats: 7.0 is still row "7"
+            key = str(int(value)) if isinstance(value, float) and value.is_integer() else str(value)
+            seen[key] = seen.get(key, 0) + 1
+            keys.append(key if seen[key] == 1 else f"{key} #{seen[key]}")
+        return keys, self.key_column
+    
+    def _timed(self, phase: str, step) -> bool:
+        """Run step(), record its wall time, rows and (when profiling) peak traced memory under phase."""
+        if self.profile:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            return step()
+        finally:
+            self.timings[phase] = self.timings.get(phase, 0.0) + time.perf_counter() - start
+            self.phase_rows[phase] = len(self.df) if self.df is not None else 0
+            if self.profile:
+                self.phase_peaks[phase] = max(self.phase_peaks.get(phase, 0), tracemalloc.get_traced_memory()[1])
+    
+    def _progress(self, phase: str, done: int, total: int):
+        """Log a progress line every PROGRESS_EVERY rows and at the last row, unless every row is logged."""
+        if (done % PROGRESS_EVERY == 0 or done == total) and not logger.isEnabledFor(logging.DEBUG):
+            logger.info(f"   ⏳ {phase}: {done:,}/{total:,} rows ({done / total:.0%})")
+    
+    def print_timings(self):
+        """Print the wall time, rows/sec and (when profiling) peak memory of every phase run so far."""
+        logger.info("\n⏱️  Phase Timings")
+        logger.info("-" * 60)
+        for phase in self.timings:
+            entry = self._phase_entry(phase)
+            rate = f"{entry['rows_per_sec']:>12,.0f} rows/s" if entry["rows_per_sec"] else " " * 19
+            peak = f"{entry['peak_mb']:>9.1f} MB" if self.profile else ""
+            logger.info(f"  {phase:<20} {entry['seconds']:>8.2f}s {rate}{peak}")
+        logger.info(f"  {'Total':<20} {sum(self.timings.values()):>8.2f}s")
+    
+    def _phase_entry(self, phase: str) -> dict:
+        seconds, rows = self.timings[phase], self.phase_rows.get(phase, 0)
+        return {"phase": phase, "seconds": round(seconds, 4), "rows": rows,
+                "rows_per_sec": round(rows / seconds, 1) if rows and seconds else None,
+                "peak_mb": round(self.phase_peaks[phase] / 2 ** 20, 2) if phase in self.phase_peaks else None}
+    
+    def profile_report(self) -> dict:
+        """
+        Profile of this run, for write_profile_report().
+        
+        Returns:
+            dict: File, sheet, mode, row counts and one entry per phase (seconds, rows, rows/sec, peak MB)
+        """
+        peaks = [self.phase_peaks[phase] for phase in self.timings if phase in self.phase_peaks]
+        return {
+            "file": self.file_path,
+            "sheet": self.sheet_name,
+            "mode": "individual_records" if self.individual_records else "combined_steps",
+            "force_reprocess": self.force_reprocess,
+            "incremental": self.incremental,
+            "rows": len(self.df) if self.df is not None else 0,
+            "rows_updated": self.stats["updated"],
+            "rows_skipped": self.stats["skipped"],
+            "rows_failed": self.stats["failed"],
+            "total_seconds": round(sum(self.timings.values()), 4),
+            "peak_mb": round(max(peaks) / 2 ** 20, 2) if peaks else None,
+            "phases": [self._phase_entry(phase) for phase in self.timings],
+        }
     
     def create_backup(self) -> bool:
         """
@@ -122,11 +419,11 @@ class ExcelDescriptionProcessor:
             backup_path = f"{os.path.splitext(self.file_path)[0]}_backup.xlsx"
             import shutil
             shutil.copy2(self.file_path, backup_path)
-            print(f"✅ Backup created: {backup_path}")
+            logger.info(f"✅ Backup created: {backup_path}")
             self.backup_created = True
             return True
         except Exception as e:
-            print(f"⚠️  Warning: Could not create backup: {e}")
+            logger.warning(f"⚠️  Warning: Could not create backup: {e}")
             return False
     
     def examine_excel_structure(self) -> bool:
@@ -137,44 +434,54 @@ class ExcelDescriptionProcessor:
             bool: True if examination was successful
         """
         try:
-            print("📋 Examining Excel File Structure")
-            print("=" * 60)
+            logger.info("📋 Examining Excel File Structure")
+            logger.info("=" * 60)
             
             # Check available sheets
-            xls = pd.ExcelFile(self.file_path)
-            print(f"Available sheets: {xls.sheet_names}")
+            if not self.load():
+                return False
+            logger.info(f"Available sheets: {self.wb.sheetnames}")
             
-            if self.sheet_name not in xls.sheet_names:
-                print(f"❌ Sheet '{self.sheet_name}' not found!")
-                print(f"Available sheets: {xls.sheet_names}")
+            if self.sheet_name not in self.wb.sheetnames:
+                logger.error(f"❌ Sheet '{self.sheet_name}' not found!")
+                logger.error(f"Available sheets: {self.wb.sheetnames}")
                 return False
             
-            # Read the target sheet
-            df = pd.read_excel(self.file_path, sheet_name=self.sheet_name)
-            print(f"\nSheet: {self.sheet_name}")
-            print(f"Shape: {df.shape}")
-            print(f"Columns: {df.columns.tolist()}")
+            # The target sheet, as loaded
+            df = self.df
+            logger.info(f"\nSheet: {self.sheet_name}")
+            logger.info(f"Shape: {df.shape}")
+            logger.info(f"Columns: {df.columns.tolist()}")
             
             # Check for required columns
             if 'Description' not in df.columns:
-                print("❌ 'Description' column not found!")
+                logger.error("❌ 'Description' column not found!")
                 return False
             
-            print("\n📊 Current Data Preview:")
-            print("-" * 40)
+            if not logger.isEnabledFor(logging.DEBUG):
+                # Summary: empty cell counts instead of one block per row
+                empty = {column: int(df[column].isna().sum()) if column in df.columns else "column missing"
+                         for column in ('Description', 'Description (Design Steps)', 'Description (Expected Result)')}
+                logger.info(f"Empty cells - Description: {empty['Description']}, "
+                            f"Design Steps: {empty['Description (Design Steps)']}, "
+                            f"Expected Result: {empty['Description (Expected Result)']}")
+                return True
+            
+            logger.debug("\n📊 Current Data Preview:")
+            logger.debug("-" * 40)
             for idx, row in df.iterrows():
                 desc_col_b = row.get('Description (Design Steps)', 'N/A')
                 desc_col_c = row.get('Description (Expected Result)', 'N/A')
                 
-                print(f"Row {idx + 1}:")
-                print(f"  Column A (Description): {'✓ Has data' if pd.notna(row['Description']) else '✗ Empty'}")
-                print(f"  Column B (Design Steps): {'✓ Has data' if pd.notna(desc_col_b) else '✗ Empty (will be processed)'}")
-                print(f"  Column C (Expected Result): {'✓ Has data' if pd.notna(desc_col_c) else '✗ Empty (will be processed)'}")
+                logger.debug(f"Row {idx + 1}:")
+                logger.debug(f"  Column A (Description): {'✓ Has data' if pd.notna(row['Description']) else '✗ Empty'}")
+                logger.debug(f"  Column B (Design Steps): {'✓ Has data' if pd.notna(desc_col_b) else '✗ Empty (will be processed)'}")
+                logger.debug(f"  Column C (Expected Result): {'✓ Has data' if pd.notna(desc_col_c) else '✗ Empty (will be processed)'}")
             
             return True
             
         except Exception as e:
-            print(f"❌ Error examining Excel structure: {e}")
+            logger.error(f"❌ Error examining Excel structure: {e}")
             return False
     
     def parse_description_to_steps(self, description_text: str) -> Tuple[str, str]:
@@ -239,6 +546,78 @@ class ExcelDescriptionProcessor:
         
         return design_steps_text, expected_results_text
     
+    def parse_descriptions(self, descriptions: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """
+        Parse a whole Description column at once; same values as parse_description_to_steps per row.
+        
+        Each distinct description is parsed once, with the module-level precompiled
+        patterns and one keyword alternation instead of per-call regex and keyword
+        lists. Unusual step blocks (e.g. a lower-case "step-1" marker) fall back to
+        the per-row helpers, so results stay identical.
+        
+        Args:
+            descriptions (pd.Series): Description column
+            
+        Returns:
+            tuple: (design_steps, expected_results) Series aligned with descriptions
+        """
+        codes, uniques = pd.factorize(descriptions, use_na_sentinel=True)
+        parsed = [self._parse_steps_fast(text) for text in uniques]
+        design = [steps[0] for steps in parsed] + [""]  # code -1 (missing) -> ""
+        expected = [steps[1] for steps in parsed] + [""]
+        return (pd.Series([design[code] for code in codes], index=descriptions.index, dtype=object),
+                pd.Series([expected[code] for code in codes], index=descriptions.index, dtype=object))
+    
+    def _parse_steps_fast(self, description_text) -> Tuple[str, str]:
+        """parse_description_to_steps with precompiled patterns, for parse_descriptions()."""
+        if pd.isna(description_text) or not description_text:
+            return "", ""
+        
+        text = str(description_text).replace('\r\n', '\n').replace('\r', '\n')
+        starts = [match.start() for match in STEP_PATTERN.finditer(text)]
+        if not starts:
+            return self._parse_line_by_line(text)
+        
+        design_steps = []
+        expected_results = []
+        for start_pos, end_pos in zip(starts, starts[1:] + [len(text)]):
+            step_block = text[start_pos:end_pos].strip()
+            flattened = ' '.join(step_block.split())
+            step_match = STEP_NUMBER_PATTERN.search(flattened)
+            if not step_match:
+                parsed_step = self._parse_step_block(step_block)
+            else:
+                after_step = flattened[step_match.end():].strip('|').strip()
+                if not after_step:
+                    continue
+                step_num = step_match.group(1).strip()
+                design_text, expected_text = self._split_content_fast(after_step)
+                parsed_step = {'design': f"{step_num}: {design_text}", 'result': f"{step_num}: {expected_text}"}
+            if parsed_step:
+                design_steps.append(parsed_step['design'])
+                expected_results.append(parsed_step['result'])
+        
+        return '\n'.join(design_steps), '\n'.join(expected_results)
+    
+    @staticmethod
+    def _split_content_fast(content_string: str) -> tuple:
+        """_split_complete_content_string with the keyword alternation compiled once."""
+        segments = [seg for seg in (seg.strip() for seg in content_string.split('|')) if seg]
+        if not segments:
+            return "", ""
+        if len(segments) == 1:
+            return segments[0], ""
+        
+        # The "... should" patterns of the per-row path all contain "should", a keyword already
+        split_index = next((i for i, segment in enumerate(segments)
+                            if EXPECTED_KEYWORD_PATTERN.search(segment.lower())), None)
+        if split_index is None:
+            split_index = 1 if len(segments) == 2 else max(1, len(segments) // 2)
+        
+        design_segments = segments[:split_index] if split_index > 0 else segments[:1]
+        expected_segments = segments[split_index:] if split_index < len(segments) else []
+        return ' | '.join(design_segments), ' | '.join(expected_segments)
+    
     def _parse_step_block(self, step_block: str) -> dict:
         """
         Parse a single step block that may contain multiple pipes within content.
@@ -267,7 +646,7 @@ class ExcelDescriptionProcessor:
             parts = [part for part in all_parts if part]
             
             if len(parts) < 2:
-                print(f"  ⚠️  Not enough parts in step block: {parts}")
+                logger.debug(f"  ⚠️  Not enough parts in step block: {parts}")
                 return None
             
             # First part is always the step number
@@ -289,7 +668,7 @@ class ExcelDescriptionProcessor:
             }
             
         except Exception as e:
-            print(f"  ⚠️  Warning: Could not parse step block: {step_block[:50]}... Error: {e}")
+            logger.warning(f"  ⚠️  Warning: Could not parse step block: {step_block[:50]}... Error: {e}")
         
         return None
     
@@ -385,7 +764,7 @@ class ExcelDescriptionProcessor:
             }
             
         except Exception as e:
-            print(f"  ⚠️  Warning: Could not parse step block: {step_block[:50]}... Error: {e}")
+            logger.warning(f"  ⚠️  Warning: Could not parse step block: {step_block[:50]}... Error: {e}")
         
         # Fallback to original method
         return self._parse_step_block(step_block)
@@ -454,7 +833,7 @@ class ExcelDescriptionProcessor:
             return design_text, expected_text
             
         except Exception as e:
-            print(f"  ⚠️  Warning: Could not split content string: {content_string[:50]}... Error: {e}")
+            logger.warning(f"  ⚠️  Warning: Could not split content string: {content_string[:50]}... Error: {e}")
             # Fallback: first half design, second half expected
             segments = content_string.split('|')
             mid = len(segments) // 2
@@ -544,35 +923,65 @@ class ExcelDescriptionProcessor:
     def update_excel_columns(self) -> bool:
         """
         Update the Excel file by populating columns B and C based on Description column.
+        Cells are changed in the shared in-memory workbook; save() writes them.
         
         Returns:
             bool: True if update was successful
         """
         try:
-            print("\n🔄 Processing Excel File")
-            print("=" * 60)
-            
-            # Load the workbook using openpyxl for better control
-            wb = load_workbook(self.file_path)
-            ws = wb[self.sheet_name]
+            logger.info("\n🔄 Processing Excel File")
+            logger.info("=" * 60)
             
-            # Read the current data using pandas for easier manipulation
-            df = pd.read_excel(self.file_path, sheet_name=self.sheet_name)
+            # Shared workbook (cells) and DataFrame view (row values), loaded once
+            if not self.load():
+                return False
+            ws = self.wb[self.sheet_name]
+            df = self.df
             
             updates_made = 0
             
-            # Process each row
-            for idx, row in df.iterrows():
-                description = row['Description']
-                current_design_steps = row.get('Description (Design Steps)')
-                current_expected_result = row.get('Description (Expected Result)')
+            # Parse every Description to process in one batch (the per-row parser gives the same values)
+            missing = pd.Series(None, index=df.index, dtype=object)
+            current_b = df['Description (Design Steps)'] if 'Description (Design Steps)' in df.columns else missing
+            current_c = df['Description (Expected Result)'] if 'Description (Expected Result)' in df.columns else missing
+            empty = current_b.isna() | current_c.isna()
+            if self.cache is not None:
+                # Incremental: only descriptions changed since the cached run are parsed; rows whose
+                # columns B / C were emptied since get their cached steps back
+                keys, key_column = self._row_keys(df)
+                cached = self.cache.rows(self.sheet_name, key_column)
+                hashes = [DescriptionCache.description_hash(text) for text in df['Description']]
+                entries = {idx: cached.get(key) for idx, key in zip(df.index, keys)}
+                changed = {idx: entries[idx] is None or entries[idx][0] != digest for idx, digest in zip(df.index, hashes)}
+                refill = {idx: is_empty and not changed[idx] and bool(entries[idx][1] or entries[idx][2])
+                          for idx, is_empty in zip(df.index, empty)}
+                to_parse = df.index if self.force_reprocess else df.index[[changed[idx] for idx in df.index]]
+            else:
+                to_parse = df.index if self.force_reprocess else df.index[empty]
+            parsed_b, parsed_c = self.parse_descriptions(df.loc[to_parse, 'Description'])
+            parsed = dict(zip(to_parse, zip(parsed_b, parsed_c)))  # row -> (design steps, expected results)
+            if self.cache is not None and not self.force_reprocess:
+                parsed.update((idx, tuple(entries[idx][1:])) for idx in df.index if refill[idx])
+            
+            # Process each row (current B / C values; the descriptions were parsed above)
+            debug = logger.isEnabledFor(logging.DEBUG)  # per-row messages are only built when they are shown
+            for done, (idx, current_design_steps, current_expected_result) in enumerate(zip(df.index, current_b, current_c), 1):
                 
                 # Determine if we should process this row
                 should_process = False
+                overwrite = self.force_reprocess
                 if self.force_reprocess:
                     # Force reprocess mode - process all rows
                     should_process = True
                     process_reason = "Force reprocess enabled"
+                elif self.cache is not None:
+                    # Incremental mode - process edited descriptions (replacing their steps) and emptied cells
+                    if changed[idx]:
+                        should_process = overwrite = True
+                        process_reason = "Description changed"
+                    elif refill[idx]:
+                        should_process = True
+                        process_reason = "Empty columns detected"
                 else:
                     # Normal mode - only process if columns B or C are empty
                     if pd.isna(current_design_steps) or pd.isna(current_expected_result):
@@ -580,10 +989,11 @@ class ExcelDescriptionProcessor:
                         process_reason = "Empty columns detected"
                 
                 if should_process:
-                    print(f"\n📝 Processing Row {idx + 1}: ({process_reason})")
+                    if debug:
+                        logger.debug(f"\n📝 Processing Row {idx + 1}: ({process_reason})")
                     
-                    # Parse the description
-                    design_steps, expected_results = self.parse_description_to_steps(description)
+                    # Parsed description (batch)
+                    design_steps, expected_results = parsed[idx]
                     
                     if design_steps or expected_results:
                         # Update the Excel cells (using 1-based indexing for openpyxl)
@@ -591,67 +1001,98 @@ class ExcelDescriptionProcessor:
                         
                         # Update Column B if we have design steps
                         if design_steps:
-                            if self.force_reprocess or pd.isna(current_design_steps):
+                            if overwrite or pd.isna(current_design_steps):
                                 ws.cell(row=excel_row, column=2, value=design_steps)  # Column B
-                                action = "Updated" if self.force_reprocess and pd.notna(current_design_steps) else "Added"
-                                print(f"  ✅ {action} Column B (Design Steps)")
-                                print(f"     Content: {design_steps.replace(chr(10), ' | ')}")  # Show on one line
+                                if debug:
+                                    action = "Updated" if overwrite and pd.notna(current_design_steps) else "Added"
+                                    logger.debug(f"  ✅ {action} Column B (Design Steps)")
+                                    logger.debug(f"     Content: {design_steps.replace(chr(10), ' | ')}")  # Show on one line
                         
                         # Update Column C if we have expected results
                         if expected_results:
-                            if self.force_reprocess or pd.isna(current_expected_result):
+                            if overwrite or pd.isna(current_expected_result):
                                 ws.cell(row=excel_row, column=3, value=expected_results)  # Column C
-                                action = "Updated" if self.force_reprocess and pd.notna(current_expected_result) else "Added"
-                                print(f"  ✅ {action} Column C (Expected Results)")
-                                print(f"     Content: {expected_results.replace(chr(10), ' | ')}")  # Show on one line
+                                if debug:
+                                    action = "Updated" if overwrite and pd.notna(current_expected_result) else "Added"
+                                    logger.debug(f"  ✅ {action} Column C (Expected Results)")
+                                    logger.debug(f"     Content: {expected_results.replace(chr(10), ' | ')}")  # Show on one line
                         
                         updates_made += 1
+                    elif self.cache is not None and changed[idx] and entries[idx] is not None and any(entries[idx][1:]):
+                        # The edited description has no steps any more: drop the ones parsed from its old text
+                        excel_row = idx + 2
+                        ws.cell(row=excel_row, column=2).value = None  # Column B (cell(value=None) keeps the value)
+                        ws.cell(row=excel_row, column=3).value = None  # Column C
+                        updates_made += 1
+                        logger.debug(f"  🧹 Cleared Columns B & C (no valid steps left in the edited description)")
                     else:
-                        print(f"  ⚠️  No valid steps found in description")
+                        self.stats["failed"] += 1
+                        logger.debug(f"  ⚠️  No valid steps found in description")
+                elif self.cache is not None:
+                    self.stats["skipped"] += 1
+                    if debug:
+                        logger.debug(f"Row {idx + 1}: ✓ Description unchanged (skipped)")
                 else:
-                    print(f"Row {idx + 1}: ✓ Already has data in columns B & C (skipped)")
+                    self.stats["skipped"] += 1
+                    if debug:
+                        logger.debug(f"Row {idx + 1}: ✓ Already has data in columns B & C (skipped)")
+                self._progress("Update columns", done, len(df))
+            self.stats["updated"] += updates_made
+            
+            if self.cache is not None:
+                # Every current row, parsed now or unchanged; deleted rows drop out
+                self.cache.set_rows(self.sheet_name, key_column, {
+                    key: [digest, *parsed[idx]] if idx in parsed else [digest, *entries[idx][1:]]
+                    for idx, key, digest in zip(df.index, keys, hashes)})
             
             if updates_made > 0:
-                # Save the workbook
-                wb.save(self.file_path)
-                print(f"\n✅ Excel file updated successfully!")
-                print(f"   File: {self.file_path}")
-                print(f"   Rows updated: {updates_made}")
+                # Refresh the DataFrame view from the updated cells; the workbook is saved once, later
+                self.df = self._frame_from_sheet(ws)
+                self.modified = True
+                logger.info(f"\n✅ Excel file updated successfully!")
+                logger.info(f"   File: {self.file_path}")
+                logger.info(f"   Rows updated: {updates_made}")
+            elif self.cache is not None:
+                logger.info(f"\n📋 No updates needed - no description changed since the last run")
             else:
-                print(f"\n📋 No updates needed - all rows already have data in columns B & C")
+                logger.info(f"\n📋 No updates needed - all rows already have data in columns B & C")
+            logger.info(f"   Rows skipped: {self.stats['skipped']}, without valid steps: {self.stats['failed']}")
             
             return True
             
         except Exception as e:
-            print(f"❌ Error updating Excel file: {e}")
+            logger.error(f"❌ Error updating Excel file: {e}")
             return False
     
     def create_individual_records(self) -> bool:
         """
-        Create individual records for each step in a new sheet.
+        Create individual records for each step in a new sheet of the shared workbook.
         
         Returns:
             bool: True if creation was successful
         """
         try:
-            print("\n📋 Creating Individual Step Records")
-            print("=" * 60)
+            logger.info("\n📋 Creating Individual Step Records")
+            logger.info("=" * 60)
             
-            # Read the original data
-            df = pd.read_excel(self.file_path, sheet_name=self.sheet_name)
+            # Original data, as loaded
+            if not self.load():
+                return False
+            df = self.df
             
             # Create list to store individual records
             individual_records = []
             
-            for idx, row in df.iterrows():
-                description = row['Description']
-                
-                print(f"\n📝 Processing Row {idx + 1} for individual records:")
+            debug = logger.isEnabledFor(logging.DEBUG)  # per-row messages are only built when they are shown
+            for done, (idx, description) in enumerate(zip(df.index, df['Description']), 1):
+                if debug:
+                    logger.debug(f"\n📝 Processing Row {idx + 1} for individual records:")
                 
                 # Parse individual steps
                 steps = self.parse_description_to_individual_steps(description)
                 
                 if steps:
+                    self.stats["updated"] += 1
                     for step_idx, step in enumerate(steps):
                         record = {
                             'Original_Row': idx + 1,
@@ -661,177 +1102,483 @@ class ExcelDescriptionProcessor:
                             'Original_Description': description
                         }
                         individual_records.append(record)
-                        print(f"  ✅ Step {step['step_number']}: {step['design_step']} → {step['expected_result']}")
+                        if debug:
+                            logger.debug(f"  ✅ Step {step['step_number']}: {step['design_step']} → {step['expected_result']}")
                 else:
-                    print(f"  ⚠️  No valid steps found")
+                    self.stats["failed"] += 1
+                    logger.debug(f"  ⚠️  No valid steps found")
+                self._progress("Individual records", done, len(df))
             
             if individual_records:
                 # Create DataFrame for individual records
                 records_df = pd.DataFrame(individual_records)
                 
-                print(f"\n📊 Created {len(individual_records)} individual step records")
-                
-                # Load workbook and add new sheet
-                from openpyxl import load_workbook
-                wb = load_workbook(self.file_path)
+                logger.info(f"\n📊 Created {len(individual_records)} individual step records")
                 
                 # Create new sheet name
                 new_sheet_name = f"{self.sheet_name}_Individual_Steps"
                 
                 # Remove sheet if it already exists
-                if new_sheet_name in wb.sheetnames:
-                    wb.remove(wb[new_sheet_name])
-                    print(f"  ♻️  Replaced existing sheet: {new_sheet_name}")
+                if new_sheet_name in self.wb.sheetnames:
+                    self.wb.remove(self.wb[new_sheet_name])
+                    logger.info(f"  ♻️  Replaced existing sheet: {new_sheet_name}")
                 
-                # Add the new sheet with individual records
-                with pd.ExcelWriter(self.file_path, engine='openpyxl', mode='a') as writer:
-                    records_df.to_excel(writer, sheet_name=new_sheet_name, index=False)
+                # Add the new sheet with individual records to the shared workbook
+                records_ws = self.wb.create_sheet(new_sheet_name)
+                records_ws.append(list(records_df.columns))
+                for record in records_df.itertuples(index=False):
+                    records_ws.append(list(record))
+                self.modified = True
                 
-                print(f"✅ Individual records saved to sheet: {new_sheet_name}")
-                print(f"   Total records: {len(individual_records)}")
+                logger.info(f"✅ Individual records saved to sheet: {new_sheet_name}")
+                logger.info(f"   Total records: {len(individual_records)}")
                 
                 # Show preview of the records
-                print(f"\n📋 Preview of Individual Records:")
-                print("-" * 60)
+                logger.info(f"\n📋 Preview of Individual Records:")
+                logger.info("-" * 60)
                 for i, record in enumerate(individual_records[:5]):  # Show first 5
-                    print(f"Record {i+1}: {record['Step_Number']} | {record['Design_Step']} | {record['Expected_Result']}")
+                    logger.info(f"Record {i+1}: {record['Step_Number']} | {record['Design_Step']} | {record['Expected_Result']}")
                 
                 if len(individual_records) > 5:
-                    print(f"... and {len(individual_records) - 5} more records")
+                    logger.info(f"... and {len(individual_records) - 5} more records")
                 
                 return True
             else:
-                print("❌ No individual records could be created")
+                logger.error("❌ No individual records could be created")
                 return False
                 
         except Exception as e:
-            print(f"❌ Error creating individual records: {e}")
+            logger.error(f"❌ Error creating individual records: {e}")
             return False
     
     def verify_results(self) -> bool:
         """
-        Verify the results after processing.
+        Verify the results after processing, against the in-memory state that save() writes.
         
         Returns:
             bool: True if verification was successful
         """
         try:
-            print("\n🔍 Verifying Results")
-            print("=" * 60)
+            logger.info("\n🔍 Verifying Results")
+            logger.info("=" * 60)
             
-            # Read the updated Excel file
-            df = pd.read_excel(self.file_path, sheet_name=self.sheet_name)
+            # Updated data, as held in memory
+            if not self.load():
+                return False
+            df = self.df
             
-            print(f"Final data shape: {df.shape}")
-            print(f"Columns: {df.columns.tolist()}")
+            logger.info(f"Final data shape: {df.shape}")
+            logger.info(f"Columns: {df.columns.tolist()}")
             
-            print("\n📋 Final Results Summary:")
-            print("-" * 40)
+            if not logger.isEnabledFor(logging.DEBUG):
+                # Summary: filled cell counts instead of every row's content
+                filled = {column: int(df[column].notna().sum()) if column in df.columns else 0
+                          for column in ('Description (Design Steps)', 'Description (Expected Result)')}
+                logger.info(f"Filled cells - Design Steps: {filled['Description (Design Steps)']}/{len(df)}, "
+                            f"Expected Result: {filled['Description (Expected Result)']}/{len(df)}")
+                return True
+            
+            logger.debug("\n📋 Final Results Summary:")
+            logger.debug("-" * 40)
             
             for idx, row in df.iterrows():
                 design_steps = row.get('Description (Design Steps)')
                 expected_results = row.get('Description (Expected Result)')
                 
-                print(f"\nRow {idx + 1}:")
+                logger.debug(f"\nRow {idx + 1}:")
                 if pd.notna(design_steps):
                     steps_preview = str(design_steps).replace('\n', ' | ')
-                    print(f"  Column B: ✓ {steps_preview}")
+                    logger.debug(f"  Column B: ✓ {steps_preview}")
                 else:
-                    print(f"  Column B: ✗ Empty")
+                    logger.debug(f"  Column B: ✗ Empty")
                 
                 if pd.notna(expected_results):
                     results_preview = str(expected_results).replace('\n', ' | ')
-                    print(f"  Column C: ✓ {results_preview}")
+                    logger.debug(f"  Column C: ✓ {results_preview}")
                 else:
-                    print(f"  Column C: ✗ Empty")
+                    logger.debug(f"  Column C: ✗ Empty")
             
             return True
             
         except Exception as e:
-            print(f"❌ Error verifying results: {e}")
+            logger.error(f"❌ Error verifying results: {e}")
             return False
     
-    def process(self, create_backup: bool = True) -> bool:
+    def process(self, create_backup: bool = True, save: bool = True) -> bool:
         """
         Main processing method that runs the complete workflow.
         
         Args:
             create_backup (bool): Whether to create a backup before processing
+            save (bool): Save the workbook at the end; False leaves it to the caller (batch mode
+                saves each workbook once, after all of its sheets)
             
         Returns:
             bool: True if processing was successful
         """
-        print("🚀 Excel Description Processor")
-        print("=" * 60)
-        print(f"File: {self.file_path}")
-        print(f"Sheet: {self.sheet_name}")
+        started_tracing = self.profile and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            return self._process(create_backup, save)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+    
+    def _process(self, create_backup: bool, save: bool) -> bool:
+        """The workflow of process(): backup, load, examine, update / individual records, save, verify."""
+        logger.info("🚀 Excel Description Processor")
+        logger.info("=" * 60)
+        logger.info(f"File: {self.file_path}")
+        logger.info(f"Sheet: {self.sheet_name}")
         mode = "Individual Records" if self.individual_records else "Combined Steps"
-        print(f"Mode: {mode}")
+        logger.info(f"Mode: {mode}")
         if self.force_reprocess:
-            print(f"Force Reprocess: Enabled")
-        print("=" * 60)
+            logger.info(f"Force Reprocess: Enabled")
+        if self.incremental:
+            logger.info(f"Incremental: Enabled (key column: {self.key_column})")
+        logger.info("=" * 60)
         
         # Check if file exists
         if not os.path.exists(self.file_path):
-            print(f"❌ Error: File '{self.file_path}' not found!")
+            logger.error(f"❌ Error: File '{self.file_path}' not found!")
             return False
         
         # Create backup if requested
         if create_backup:
-            self.create_backup()
+            self._timed("Backup", self.create_backup)
+        
+        # Incremental: a workbook unchanged since the cached run needs no work at all
+        if self.incremental and self.cache is None:
+            self.cache = DescriptionCache(self.file_path)
+        if self.cache is not None and not self.force_reprocess and self.wb is None and self.cache.is_current([self.sheet_name]):
+            self.stats["skipped"] = self.cache.cached_row_count([self.sheet_name])
+            logger.info(f"\n📋 Workbook unchanged since the last incremental run - nothing to do")
+            logger.info(f"   Cache: {self.cache.path}")
+            return True
+        
+        # Step 0: Load the workbook once; every phase works on this in-memory copy
+        if not self._timed("Load", self.load):
+            return False
         
         # Step 1: Examine structure
-        if not self.examine_excel_structure():
+        if not self._timed("Examine", self.examine_excel_structure):
             return False
         
         # Step 2: Update columns (if not individual records mode)
         if not self.individual_records:
-            if not self.update_excel_columns():
+            if not self._timed("Update columns", self.update_excel_columns):
                 return False
         
         # Step 3: Create individual records (if enabled)
         if self.individual_records:
-            if not self.create_individual_records():
+            if not self._timed("Individual records", self.create_individual_records):
                 return False
         
-        # Step 4: Verify results
-        if not self.verify_results():
+        # Step 4: Save once (then the description cache, which records the saved workbook's hash)
+        if save and not self._timed("Save", self.save):
+            return False
+        if save and not self._timed("Save", self.save_cache):
             return False
         
-        print("\n🎉 Processing completed successfully!")
-        print("=" * 60)
+        # Step 5: Verify results
+        if not self._timed("Verify", self.verify_results):
+            return False
+        
+        self.print_timings()
+        logger.info("\n🎉 Processing completed successfully!")
+        logger.info("=" * 60)
         
         return True
 
 
+# === Batch mode ===
+def find_workbooks(patterns) -> list:
+    """
+    Expand workbook files, directories (searched recursively) and glob patterns.
+    
+    Args:
+        patterns: Paths, directories or globs such as "designs/**/*.xlsx"
+        
+    Returns:
+        list: Sorted, unique .xlsx paths; backups (*_backup.xlsx) and Excel lock files (~$*) are left out
+    """
+    workbooks = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = glob.glob(os.path.join(pattern, "**", "*.xlsx"), recursive=True)
+        else:
+            matches = glob.glob(pattern, recursive=True)
+        for path in matches:
+            name = os.path.basename(path)
+            if (os.path.isfile(path) and name.lower().endswith(".xlsx")
+                    and not name.startswith("~$") and not name.endswith("_backup.xlsx")):
+                workbooks.add(os.path.normpath(path))
+    return sorted(workbooks)
+
+
+def _timed_workbook_phase(phases: list, phase: str, step, profile: bool):
+    """Run step() and append its phase entry (seconds, peak MB when profiling) to phases; returns its result."""
+    if profile:
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        return step()
+    finally:
+        seconds = time.perf_counter() - start
+        phases.append({"phase": phase, "seconds": round(seconds, 4), "rows": 0, "rows_per_sec": None,
+                       "peak_mb": round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 2) if profile else None})
+
+
+def process_workbook(file_path: str, sheet_names=(SHEET_NAME,), force_reprocess: bool = FORCE_REPROCESS,
+                     individual_records: bool = INDIVIDUAL_RECORDS, create_backup: bool = CREATE_BACKUP,
+                     incremental: bool = INCREMENTAL, key_column: str = KEY_COLUMN, log_level="WARNING",
+                     profile: bool = False) -> dict:
+    """
+    Process the given sheets of one workbook: loaded once, saved once if any sheet changed.
+    Module-level so it can run in a worker process.
+    
+    Args:
+        file_path (str): Path to the Excel file
+        sheet_names: Sheets to process; sheets the workbook does not have count as failed (Status
+            "partial", or "failed" if no sheet was processed) and are noted in Error
+        force_reprocess, individual_records, create_backup, incremental, key_column: As for a single-file run
+        log_level: Console output level while processing this workbook (default: problems only)
+        profile (bool): Add the sheets' profile_report()s to the result, under "Profile", after a
+            workbook-level entry for the workbook load and save (traced from before the load)
+        
+    Returns:
+        dict: One BATCH_COLUMNS row for the workbook
+    """
+    start = time.perf_counter()
+    result = {"File": file_path, "Sheets": 0, "Rows Updated": 0, "Rows Skipped": 0, "Rows Failed": 0, "Profile": []}
+    errors, failed = [], 0
+    workbook_phases = []  # load / save, shared by every sheet of this workbook
+    
+    previous_level = logger.level
+    logger.setLevel(log_level)
+    started_tracing = profile and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()  # the sheets' process() calls keep tracing into this one
+    try:
+        cache = DescriptionCache(file_path) if incremental and not individual_records else None
+        if cache is not None and not force_reprocess and cache.is_current(sheet_names):
+            # Unchanged since the cached run: nothing to load, parse or save
+            present = [name for name in sheet_names if name in cache.workbook_sheets]
+            missing = [name for name in sheet_names if name not in present]
+            result.update({"Sheets": len(present), "Rows Skipped": cache.cached_row_count(present),
+                           "Seconds": round(time.perf_counter() - start, 2),
+                           "Status": "failed" if not present else ("partial" if missing else "ok"),
+                           "Error": "; ".join(f"sheet '{name}' not found" for name in missing)})
+            return result
+        
+        wb = _timed_workbook_phase(workbook_phases, "Load workbook", lambda: load_workbook(file_path), profile)
+        modified = backed_up = False
+        for sheet_name in sheet_names:
+            if sheet_name not in wb.sheetnames:
+                failed += 1
+                errors.append(f"sheet '{sheet_name}' not found")
+                continue
+            processor = ExcelDescriptionProcessor(file_path, sheet_name, force_reprocess, individual_records,
+                                                  incremental, key_column, profile)
+            processor.wb = wb  # shared by every sheet of this workbook
+            processor.cache = cache
+            ok = processor.process(create_backup=create_backup and not backed_up, save=False)
+            backed_up = backed_up or processor.backup_created
+            modified = modified or processor.modified
+            result["Rows Updated"] += processor.stats["updated"]
+            result["Rows Skipped"] += processor.stats["skipped"]
+            result["Rows Failed"] += processor.stats["failed"]
+            if profile:
+                result["Profile"].append(processor.profile_report())
+            if ok:
+                result["Sheets"] += 1
+            else:
+                failed += 1
+                errors.append(f"sheet '{sheet_name}' failed")
+        def save():
+            if modified:
+                wb.save(file_path)
+            if cache is not None:
+                cache.save(wb)
+        _timed_workbook_phase(workbook_phases, "Save workbook", save, profile)
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+        logger.setLevel(previous_level)
+    
+    if profile and workbook_phases:
+        peaks = [entry["peak_mb"] for entry in workbook_phases]
+        result["Profile"].insert(0, {"file": file_path, "sheet": None, "mode": "workbook",
+                                     "total_seconds": round(sum(entry["seconds"] for entry in workbook_phases), 4),
+                                     "peak_mb": max(peaks), "phases": workbook_phases})
+    result["Seconds"] = round(time.perf_counter() - start, 2)
+    result["Status"] = "failed" if not result["Sheets"] else ("partial" if failed else "ok")
+    result["Error"] = "; ".join(errors)
+    return result
+
+
+def process_workbooks(patterns, sheet_names=(SHEET_NAME,), workers: int = 1, **options) -> pd.DataFrame:
+    """
+    Process every workbook matched by patterns across a pool of worker processes.
+    
+    Args:
+        patterns: Paths, directories or globs (see find_workbooks)
+        sheet_names: Sheets to process in every workbook
+        workers (int): Worker processes; 1 processes the workbooks one after another
+        **options: Passed to process_workbook (force_reprocess, individual_records, create_backup,
+            incremental, key_column, log_level, profile)
+        
+    Returns:
+        pd.DataFrame: One BATCH_COLUMNS row per workbook, in path order (plus "Profile" when profiling)
+    """
+    workbooks = find_workbooks(patterns)
+    process_one = functools.partial(process_workbook, sheet_names=tuple(sheet_names), **options)
+    
+    results = []
+    for file_path, result, error in iter_extracted_reports(workbooks, process_one, workers, progress=logger.info):
+        if error:  # the workbook could not be loaded or saved
+            result = {"File": file_path, "Sheets": 0, "Rows Updated": 0, "Rows Skipped": 0, "Rows Failed": 0,
+                      "Seconds": None, "Status": "failed", "Error": error, "Profile": []}
+        results.append(result)
+    return pd.DataFrame(results, columns=BATCH_COLUMNS + (["Profile"] if options.get("profile") else []))
+
+
+def write_profile_report(runs: list, path: str, **details) -> str:
+    """
+    Write a phase profile as JSON, to compare this tool's performance across releases.
+    
+    Args:
+        runs (list): profile_report() of every processed sheet (batch mode: after each workbook's
+            load / save entry)
+        path (str): JSON file to write
+        **details: Extra top-level fields (batch mode: workers, total_seconds, workbooks)
+        
+    Returns:
+        str: path
+    """
+    report = {
+        "tool": os.path.basename(__file__),
+        "parser_version": PARSER_VERSION,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "openpyxl": openpyxl.__version__,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        **details,
+        "runs": runs,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def batch_main(args) -> int:
+    """Run batch mode for the parsed command line; returns the exit code."""
+    from report_sinks import write_table
+    
+    start = time.perf_counter()
+    logger.info("🚀 Excel Description Processor - Batch Mode")
+    logger.info("=" * 60)
+    results = process_workbooks(args.batch, args.sheets, args.workers,
+                                force_reprocess=args.force_reprocess, individual_records=INDIVIDUAL_RECORDS,
+                                create_backup=CREATE_BACKUP, incremental=args.incremental, key_column=args.key_column,
+                                log_level=args.log_level if args.verbose else "WARNING", profile=bool(args.profile))
+    if results.empty:
+        logger.error(f"❌ No workbooks found for: {', '.join(args.batch)}")
+        return 1
+    profiles = results.pop("Profile") if args.profile else None
+    seconds = time.perf_counter() - start
+    
+    logger.info("\n📊 Batch Results")
+    logger.info("-" * 60)
+    logger.info(results.to_string(index=False))
+    failed = int((results["Status"] != "ok").sum())
+    logger.info(f"\n✅ {len(results) - failed}/{len(results)} workbooks processed in {seconds:.1f}s "
+                f"({args.workers} workers)")
+    logger.info(f"   Rows updated: {results['Rows Updated'].sum()}, skipped: {results['Rows Skipped'].sum()}, "
+                f"failed: {results['Rows Failed'].sum()}")
+    if failed:
+        logger.warning(f"⚠️  {failed} workbooks failed or were only partly processed")
+    logger.info(f"📁 Results saved to: {write_table(results, args.output)}")
+    if profiles is not None:
+        runs = [run for workbook_runs in profiles for run in workbook_runs]
+        workbooks = results.astype(object).where(results.notna(), None).to_dict("records")  # NaN is not JSON
+        path = write_profile_report(runs, args.profile, workers=args.workers, total_seconds=round(seconds, 4),
+                                    workbooks=workbooks)
+        logger.info(f"📈 Profile saved to: {path}")
+    return 1 if failed else 0
+
+
+def parse_args(argv=None):
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="Populate Design Steps / Expected Result columns from the Description column.",
+        epilog="Examples:\n"
+               "  python excel-project.py                          # EXCEL_FILE / SHEET_NAME\n"
+               "  python excel-project.py MyTestData.xlsx TestCases\n"
+               "  python excel-project.py --batch designs/ \"release/**/*.xlsx\" --sheets Input TestCases --workers 8\n"
+               "  python excel-project.py MyTestData.xlsx --quiet --profile profile.json",
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("file", nargs="?", default=EXCEL_FILE, help=f"Workbook to process (default: {EXCEL_FILE})")
+    parser.add_argument("sheet", nargs="?", default=SHEET_NAME, help=f"Sheet to process (default: {SHEET_NAME})")
+    parser.add_argument("--batch", nargs="+", metavar="PATH",
+                        help="Process many workbooks: files, directories (recursive) or glob patterns")
+    parser.add_argument("--sheets", nargs="+", default=[SHEET_NAME], help="Sheets to process in every workbook")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (batch mode)")
+    parser.add_argument("-o", "--output", default=BATCH_RESULTS, help=f"Batch result table (default: {BATCH_RESULTS})")
+    parser.add_argument("--force-reprocess", action=argparse.BooleanOptionalAction, default=None,
+                        help=f"Reprocess rows that already have steps (default: {FORCE_REPROCESS}, "
+                             f"off with --incremental)")
+    parser.add_argument("--incremental", action=argparse.BooleanOptionalAction, default=INCREMENTAL,
+                        help="Reparse only rows whose Description changed since the last run (sidecar "
+                             "<workbook>.steps-cache.json.gz)")
+    parser.add_argument("--key-column", default=KEY_COLUMN, help=f"Row identity for --incremental (default: {KEY_COLUMN})")
+    parser.add_argument("--log-level", default=LOG_LEVEL, type=str.upper,
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help=f"DEBUG: every row, INFO: phases, summaries and progress, WARNING: problems only "
+                             f"(default: {LOG_LEVEL})")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Summary mode, same as --log-level INFO")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Batch mode: log every workbook's output at --log-level (default: problems only)")
+    parser.add_argument("--profile", metavar="JSON", default=PROFILE_REPORT,
+                        help="Write wall time, rows/sec and peak memory (tracemalloc) per phase to this JSON file")
+    args = parser.parse_args(argv)
+    if args.quiet:
+        args.log_level = "INFO"
+    if args.force_reprocess is None:  # FORCE_REPROCESS would defeat --incremental unless asked for explicitly
+        args.force_reprocess = FORCE_REPROCESS and not args.incremental
+    return args
+
+
 def main():
     """Main function to run the Excel Description Processor."""
+    args = parse_args()
+    configure_logging(args.log_level)
+    if args.batch:
+        return batch_main(args)
     
-    # Use configuration variables from top of file, but allow command line override
-    if len(sys.argv) > 1:
-        file_path = sys.argv[1]  # Command line override
-    else:
-        file_path = EXCEL_FILE   # Use configuration variable
-    
-    if len(sys.argv) > 2:
-        sheet_name = sys.argv[2] # Command line override
-    else:
-        sheet_name = SHEET_NAME  # Use configuration variable
+    # Configuration variables from top of file, unless given on the command line
+    file_path = args.file
+    sheet_name = args.sheet
     
     # Create processor instance
-    processor = ExcelDescriptionProcessor(file_path, sheet_name, force_reprocess=FORCE_REPROCESS, individual_records=INDIVIDUAL_RECORDS)
+    processor = ExcelDescriptionProcessor(file_path, sheet_name, force_reprocess=args.force_reprocess, individual_records=INDIVIDUAL_RECORDS,
+                                          incremental=args.incremental, key_column=args.key_column, profile=bool(args.profile))
     
     # Run the processing
     success = processor.process(create_backup=CREATE_BACKUP)
+    if args.profile:
+        logger.info(f"📈 Profile saved to: {write_profile_report([processor.profile_report()], args.profile)}")
     
     if success:
-        print("\n✅ All operations completed successfully!")
-        print(f"📁 Updated file: {file_path}")
+        logger.info("\n✅ All operations completed successfully!")
+        logger.info(f"📁 Updated file: {file_path}")
         if processor.backup_created:
             backup_path = f"{os.path.splitext(file_path)[0]}_backup.xlsx"
-            print(f"💾 Backup available: {backup_path}")
+            logger.info(f"💾 Backup available: {backup_path}")
     else:
-        print("\n❌ Processing failed!")
+        logger.error("\n❌ Processing failed!")
         return 1
     
     return 0
@@ -0,0 +1,312 @@
+"""
+Single-pass writer for Test_Run_Details.xlsx.
+
+The details, summary and charts sheets are written in one streaming pass
+with openpyxl's write-only mode: rows go straight to the sheet XML, nothing
+is loaded back and the workbook is saved once. The charts reference the
+ranges of the "summary report" sheet instead of copies of its columns; only
+the status counts, which no other sheet holds, live on the charts sheet.
+
+Charts stay small however large the history gets: with more than top_tests
+tests the bar charts show the top_tests tests by Total_Time plus an "Other"
+bucket, and with more than max_runs run-N columns the "Durations Across Runs"
+chart shows percentile bands (p10 / p50 / p90 of each test's runs) or, with
+run_mode="lttb", the max_runs runs picked by largest-triangle-three-buckets
+on the median duration per run. Reduced chart data is written to the charts
+sheet below the status counts; unreduced charts keep referencing the summary.
+
+Cells look like pandas' ExcelWriter output: a plain header row, empty cells
+for NaN/NaT and the same datetime number format. Sheets are RolloverSheets:
+at Excel's 1,048,576-row limit a sheet continues in "<title> (2)", "(3)", ...
+with the header repeated, and since write-only rows are flushed to disk as
+they are appended, memory does not grow with the row count.
+"""
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.chart import BarChart, LineChart, PieChart, Reference
+
+DETAILS_SHEET = "test run details"
+SUMMARY_SHEET = "summary report"
+CHARTS_SHEET = "charts"
+DATETIME_NUMBER_FORMAT = "YYYY-MM-DD HH:MM:SS"  # pandas ExcelWriter default
+EXCEL_MAX_ROWS = 1_048_576  # header included
+ROW_CHUNK = 50_000  # rows converted to Python values at a time
+STREAM_CHUNK = 5_000  # extracted rows buffered by DetailSheetStream before they are written
+CHART_ROWS = 18  # rows between stacked chart anchors
+CHART_TOP_TESTS = 30  # bar/line chart tests; the rest are summed into OTHER_TESTS (None: every test)
+CHART_MAX_RUNS = 50  # line chart series before run_mode applies (None: every run-N column)
+CHART_RUN_MODE = "bands"  # "bands" (percentiles across runs) or "lttb" (largest-triangle-three-buckets runs)
+CHART_BANDS = (0.1, 0.5, 0.9)
+OTHER_TESTS = "Other"
+
+
+# === Rows ===
+def iter_frame_rows(df, chunk_rows=ROW_CHUNK):
+    """Yield each row of df as a list of cell values (None for NaN/NaT), chunk_rows rows converted at a time."""
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        columns = [_cell_values(chunk[name]) for name in chunk.columns]
+        for row in zip(*columns):
+            yield list(row)
+
+
+def _cell_values(column):
+    if isinstance(column.dtype, pd.SparseDtype):  # duration_summary run-N columns: densify this chunk only
+        column = column.sparse.to_dense()
+    return column.astype(object).where(column.notna(), None).tolist()
+
+
+def datetime_column_indexes(df):
+    return [i for i, name in enumerate(df.columns) if pd.api.types.is_datetime64_any_dtype(df[name])]
+
+
+class RolloverSheet:
+    """
+    Write-only sheet that continues in "<title> (2)", "(3)", ... at the row limit.
+
+    Args:
+        wb (Workbook): Write-only workbook
+        title (str): Title of the first sheet
+        header (list): Header row, repeated on every sheet
+        datetime_columns (list): Indexes of columns written with DATETIME_NUMBER_FORMAT
+        max_rows (int): Rows per sheet, header included
+    """
+
+    def __init__(self, wb, title, header, datetime_columns=(), max_rows=EXCEL_MAX_ROWS):
+        self.wb = wb
+        self.title = title
+        self.header = [str(name) for name in header]
+        self.datetime_columns = list(datetime_columns)
+        self.max_rows = max_rows
+        self.sheets = []
+        self.rows = 0
+        self._new_sheet()
+
+    @property
+    def ws(self):
+        return self.sheets[-1]
+
+    def _new_sheet(self):
+        title = self.title if not self.sheets else f"{self.title} ({len(self.sheets) + 1})"
+        self.sheets.append(self.wb.create_sheet(title))
+        self.ws.append(self.header)
+        self._sheet_rows = 1
+
+    def append(self, row):
+        if self._sheet_rows >= self.max_rows:
+            self._new_sheet()
+        for i in self.datetime_columns:
+            if row[i] is not None:
+                cell = WriteOnlyCell(self.ws, value=row[i])
+                cell.number_format = DATETIME_NUMBER_FORMAT
+                row[i] = cell
+        self.ws.append(row)
+        self._sheet_rows += 1
+        self.rows += 1
+
+    def append_frame(self, df, chunk_rows=ROW_CHUNK):
+        for row in iter_frame_rows(df, chunk_rows):
+            self.append(row)
+
+
+def write_frame(wb, title, df, chunk_rows=ROW_CHUNK, max_rows=EXCEL_MAX_ROWS):
+    """Write df (header + rows) to a new RolloverSheet of wb and return it."""
+    sheet = RolloverSheet(wb, title, df.columns, datetime_column_indexes(df), max_rows)
+    sheet.append_frame(df, chunk_rows)
+    return sheet
+
+
+class DetailSheetStream:
+    """
+    Row sink that writes extracted rows to a RolloverSheet as they arrive.
+
+    Pass it as the rows container of report_ingest.load_report_rows: extend()
+    buffers the dict rows of each report and every chunk_rows rows turns them
+    into a DataFrame, hands it to prepare (column conversions, derived
+    columns) and appends the result to the sheet, created on the first flush
+    with the prepared columns as header. Only one chunk is held at a time;
+    rows are also passed on to tee (e.g. a report_rows.ReportRowBatch) when
+    the caller still needs them for a summary.
+    """
+
+    def __init__(self, wb, title=DETAILS_SHEET, prepare=None, tee=None, chunk_rows=STREAM_CHUNK,
+                 max_rows=EXCEL_MAX_ROWS):
+        self.wb = wb
+        self.title = title
+        self.prepare = prepare
+        self.tee = tee
+        self.chunk_rows = chunk_rows
+        self.max_rows = max_rows
+        self.sheet = None
+        self.pending = []
+
+    def __len__(self):
+        return (self.sheet.rows if self.sheet else 0) + len(self.pending)
+
+    def extend(self, rows):
+        rows = list(rows)
+        self.pending.extend(rows)
+        if self.tee is not None:
+            self.tee.extend(rows)
+        if len(self.pending) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        df = pd.DataFrame(self.pending)
+        self.pending = []
+        if self.prepare is not None:
+            df = self.prepare(df)
+        if self.sheet is None:
+            self.sheet = RolloverSheet(self.wb, self.title, df.columns, datetime_column_indexes(df), self.max_rows)
+        self.sheet.append_frame(df, self.chunk_rows)
+
+
+# === Chart data reduction ===
+def lttb(x, y, threshold):
+    """Indexes of the threshold points that largest-triangle-three-buckets keeps of (x, y)."""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    every = (n - 2) / (threshold - 2)
+    keep = [0]
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = int(i * every) + 1, int((i + 1) * every) + 1
+        next_lo, next_hi = hi, min(int((i + 2) * every) + 1, n)
+        avg_x, avg_y = x[next_lo:next_hi].mean(), y[next_lo:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        keep.append(a)
+    keep.append(n - 1)
+    return np.array(keep)
+
+
+def top_tests_frame(summary_df, top_tests):
+    """Test Name / Count / Total_Time of the top_tests tests by Total_Time plus an OTHER_TESTS row."""
+    order = summary_df.sort_values(["Total_Time", "Test Name"], ascending=[False, True], kind="stable")
+    top, rest = order.iloc[:top_tests], order.iloc[top_tests:]
+    frame = top[["Test Name", "Count", "Total_Time"]].astype({"Test Name": object})
+    other = pd.DataFrame({"Test Name": [OTHER_TESTS], "Count": [rest["Count"].sum()],
+                          "Total_Time": [round(rest["Total_Time"].sum(), 2)]})
+    return pd.concat([frame, other], ignore_index=True), top.index
+
+
+def run_series_frame(summary_df, rows, run_columns, max_runs, run_mode, bands=CHART_BANDS):
+    """Line chart series for summary rows: run columns as they are, or reduced per run_mode."""
+    runs = summary_df.loc[rows, run_columns].to_numpy(dtype=np.float64)
+    if max_runs is None or len(run_columns) <= max_runs:
+        return pd.DataFrame(runs, columns=run_columns)
+    if run_mode == "lttb":
+        # Column by column: the run columns are sparse, a single to_numpy() would densify all of them
+        with np.errstate(all="ignore"):
+            medians = np.nan_to_num([np.nanmedian(summary_df[column].to_numpy(dtype=np.float64))
+                                     for column in run_columns])
+        keep = lttb(np.arange(len(run_columns), dtype=np.float64), medians, max_runs)
+        return pd.DataFrame(runs[:, keep], columns=[run_columns[i] for i in keep])
+    if run_mode != "bands":
+        raise ValueError(f"Unknown run_mode {run_mode!r}; expected 'bands' or 'lttb'")
+    with np.errstate(all="ignore"):
+        band_values = np.nanquantile(runs, bands, axis=1).T if len(runs) else np.empty((0, len(bands)))
+    return pd.DataFrame(band_values, columns=[f"p{round(q * 100)} of runs" for q in bands])
+
+
+# === Charts ===
+def add_summary_charts(ws, summary_ws, summary_df, status_counts, top_tests=CHART_TOP_TESTS,
+                       max_runs=CHART_MAX_RUNS, run_mode=CHART_RUN_MODE):
+    """
+    Add the status pie and the summary charts to the charts sheet ws.
+
+    Bar and line charts point at summary_ws ("summary report": Test Name,
+    Count, Total_Time, Max_Time, run-1 .. run-N) unless there are more than
+    top_tests tests or max_runs run columns; then the reduced chart data is
+    written to ws and charted from there. The status counts are written to ws
+    first since no other sheet holds them.
+    """
+    ws.append(["Test Status", "Count"])
+    for status, count in status_counts.items():
+        ws.append([status, int(count)])
+
+    columns = list(summary_df.columns)
+    run_columns = [name for name in columns if str(name).startswith("run-")]
+    reduce_tests = top_tests is not None and len(summary_df) > top_tests
+    reduce_runs = max_runs is not None and len(run_columns) > max_runs
+    if reduce_tests or reduce_runs:
+        if reduce_tests:
+            chart_df, rows = top_tests_frame(summary_df, top_tests)
+        else:
+            chart_df, rows = summary_df[["Test Name", "Count", "Total_Time"]], summary_df.index
+        if run_columns:
+            series = run_series_frame(summary_df, rows, run_columns, max_runs, run_mode)
+            chart_df = pd.concat([chart_df.reset_index(drop=True), series], axis=1)
+        first_row = len(status_counts) + 3  # below the status counts and a blank row
+        ws.append([])
+        for row in [list(chart_df.columns)] + list(iter_frame_rows(chart_df)):
+            ws.append(row)
+        _add_test_charts(ws, ws, chart_df, first_row, len(chart_df) - (1 if reduce_tests else 0), status_counts)
+    else:
+        _add_test_charts(ws, summary_ws, summary_df, 1, len(summary_df), status_counts)
+
+
+def _add_test_charts(ws, data_ws, data_df, header_row, line_rows, status_counts):
+    """Pie from ws's status counts; bars and line from data_df, written to data_ws at header_row."""
+    anchors = (f"E{2 + i * CHART_ROWS}" for i in range(4))
+    pie = PieChart()
+    pie.title = "Test Status Distribution"
+    pie.add_data(Reference(ws, min_col=2, min_row=2, max_row=len(status_counts) + 1))
+    pie.set_categories(Reference(ws, min_col=1, min_row=2, max_row=len(status_counts) + 1))
+    ws.add_chart(pie, next(anchors))
+
+    first_row, last_row = header_row + 1, header_row + len(data_df)
+    names = Reference(data_ws, min_col=1, min_row=first_row, max_row=last_row)
+    columns = list(data_df.columns)
+    for title, column, y_title in (("Total Duration by Test Name", "Total_Time", "Total Duration (mins)"),
+                                   ("Test Run Count", "Count", "Run Count")):
+        col = columns.index(column) + 1
+        bar = BarChart()
+        bar.title = title
+        bar.x_axis.title = "Test Name"
+        bar.y_axis.title = y_title
+        bar.add_data(Reference(data_ws, min_col=col, min_row=first_row, max_row=last_row))
+        bar.set_categories(names)
+        ws.add_chart(bar, next(anchors))
+
+    # Every column after the bar data holds run series (run-N or percentile bands)
+    series_cols = [i + 1 for i, name in enumerate(columns)
+                   if str(name).startswith("run-") or str(name).endswith(" of runs")]
+    if series_cols:
+        line_last_row = header_row + line_rows
+        line_chart = LineChart()
+        line_chart.title = "Durations Across Runs"
+        line_chart.x_axis.title = "Test Name"
+        line_chart.y_axis.title = "Duration (mins)"
+        line_chart.add_data(Reference(data_ws, min_col=series_cols[0], max_col=series_cols[-1],
+                                      min_row=header_row, max_row=line_last_row), titles_from_data=True)
+        line_chart.set_categories(Reference(data_ws, min_col=1, min_row=first_row, max_row=line_last_row))
+        ws.add_chart(line_chart, next(anchors))
+
+
+# === Workbook ===
+def write_summary_workbook(path, details_df, summary_df, charts=True, status_col="Test Status", **chart_options):
+    """
+    Write details, summary and (optionally) charts sheets to path in one pass, saving once.
+
+    chart_options (top_tests, max_runs, run_mode) go to add_summary_charts.
+    """
+    wb = Workbook(write_only=True)
+    write_frame(wb, DETAILS_SHEET, details_df)
+    finish_summary_workbook(wb, path, summary_df, details_df[status_col].value_counts() if charts else None,
+                            **chart_options)
+
+
+def finish_summary_workbook(wb, path, summary_df, status_counts=None, **chart_options):
+    """Add the summary (and, given status_counts, the charts) sheet after the details sheets and save."""
+    summary = write_frame(wb, SUMMARY_SHEET, summary_df)
+    if status_counts is not None:
+        add_summary_charts(wb.create_sheet(CHARTS_SHEET), summary.sheets[0], summary_df, status_counts,
+                           **chart_options)
+    wb.save(path)
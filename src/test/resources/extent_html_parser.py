@@ -0,0 +1,680 @@
+"""
+Extent report test extraction backends and layout registry.
+
+Every backend yields one dict per test block with the raw text of the test
+name, status, start/end time and time taken (None when the report does not
+have that element) plus the text of the last step timestamp cell.
+
+- "auto":   reads the first few KB, picks the matching layout from the registry
+            below and runs the streaming parser configured for it.
+- "stream": the streaming parser with the ExtentReports v3/v4 layout
+            (``ul.test-collection > li``), regardless of what the file is.
+- "bs4":    the original BeautifulSoup tree + CSS selector path (v3/v4 only).
+
+The streaming parser is an event-driven html.parser pass: rows are emitted as
+each test block closes and the DOM is never built, so memory stays flat on
+400 MB reports. Before any decoding, the file is memory-mapped and every
+``data:image/...;base64,`` payload (inlined screenshots are >90% of a report)
+is skipped at the byte level, so the parser only sees markup and text.
+
+iter_test_steps() runs the same pass in step mode: each test record also
+carries its step-log rows (status, timestamp, details), see extent_step_log.py.
+
+Layouts
+-------
+- "aventstack-v3-v4": ``ul.test-collection > li`` with ``span.test-*`` fields
+  and ``td.timestamp`` step cells (ExtentReport-Excel-Summary.py).
+- "relevantcodes-v2": ``li.test`` / ``li.collection-item.test`` blocks with
+  ``span.test-*`` fields (python5.py), "Start Time"/"End Time" label spans
+  (python8.py, python9.py) and the ``panel-lead suite-started-time`` dashboard
+  (python-2.py, python4.py). Reports without test blocks fall back to their
+  ``div.test-name`` scenario names.
+- "time-info": suite times in the 2nd and 4th span of ``div.time-info`` and
+  ``div.test-name`` scenario names (python.py).
+"""
+
+import io
+import itertools
+import mmap
+import os
+import re
+from html.parser import HTMLParser
+
+# === Constants ===
+EXTRACTOR_VERSION = 2  # bump whenever extracted rows change; invalidates report_cache entries
+CHUNK_SIZE = 1 << 20  # characters fed to the streaming parser per read
+SNIFF_BYTES = 16 * 1024  # head of the file used for layout detection
+PRESCAN_BASE64 = True  # strip inlined base64 images before the parser sees them
+BACKENDS = ("auto", "stream", "bs4")
+
+# Elements html.parser / BeautifulSoup never push onto the open-element stack
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+# Strings inside these are not part of a parent's .text in BeautifulSoup
+NON_TEXT_ELEMENTS = {"script", "style", "template"}
+
+
+def _empty_test():
+    return {
+        "name": None,
+        "status": None,
+        "started": None,
+        "ended": None,
+        "time_taken": None,
+        "last_timestamp": None,
+    }
+
+
+def _empty_step(status=None):
+    return {"status": status, "timestamp": None, "details": None}
+
+
+# === Layout registry ===
+class ExtentLayout:
+    """
+    Declarative description of one Extent report DOM shape.
+
+    Args:
+        name (str): Registry key
+        markers (list): Lower-case substrings that identify the layout in the file head
+        block (callable): (tag, classes, parent) -> True when the element starts a test block
+        fields (dict): {(tag, css_class): field} first match inside a block
+        step_cell (tuple): (tag, css_class) whose last occurrence is "last_timestamp"
+        step_row (str): Tag of one step-log row; in step mode a row holding a step_cell is a step
+        step_fields (dict): {(tag, css_class): field} text of a step row cell
+        step_status (tuple): (tag, css_class) cell whose other classes give the step status
+        labels (dict): {label text: field} value read from the span after the label span,
+            used when the class-based field is missing
+        suite_fields (dict): {(tag, css_class): field} first match anywhere in the report
+        suite_spans (tuple): (tag, css_class, {span index: field}) for suite times that
+            are only identified by position
+        scenario (tuple): (tag, css_class) yielding name-only tests when no block was found
+    """
+
+    def __init__(self, name, markers, block, fields, step_cell=None, labels=None,
+                 suite_fields=None, suite_spans=None, scenario=None, step_row="tr",
+                 step_fields=None, step_status=None):
+        self.name = name
+        self.markers = markers
+        self.block = block
+        self.fields = fields
+        self.step_cell = step_cell
+        self.step_row = step_row
+        self.step_fields = step_fields or {}
+        self.step_status = step_status
+        self.labels = labels or {}
+        self.suite_fields = suite_fields or {}
+        self.suite_spans = suite_spans
+        self.scenario = scenario
+
+
+LAYOUTS = {}
+DEFAULT_LAYOUT = "aventstack-v3-v4"
+
+
+def register_layout(layout):
+    LAYOUTS[layout.name] = layout
+    return layout
+
+
+TEST_SPAN_FIELDS = {
+    ("span", "test-name"): "name",
+    ("span", "test-status"): "status",
+    ("span", "test-started-time"): "started",
+    ("span", "test-ended-time"): "ended",
+}
+
+STEP_CELL_FIELDS = {
+    ("td", "step-details"): "details",
+}
+
+SUITE_SPAN_FIELDS = {
+    ("span", "suite-started-time"): "suite_started",
+    ("span", "suite-ended-time"): "suite_ended",
+}
+
+register_layout(ExtentLayout(
+    name="aventstack-v3-v4",
+    markers=["aventstack", "test-collection", "spark"],
+    block=lambda tag, classes, parent: (
+        tag == "li" and parent is not None and parent[0] == "ul" and "test-collection" in parent[1]
+    ),
+    fields=TEST_SPAN_FIELDS,
+    step_cell=("td", "timestamp"),
+    step_fields=STEP_CELL_FIELDS,
+    step_status=("td", "status"),
+))
+
+register_layout(ExtentLayout(
+    name="relevantcodes-v2",
+    markers=["relevantcodes", "extentreports 2", "anshooarora", "collection-item test"],
+    block=lambda tag, classes, parent: tag == "li" and "test" in classes,
+    fields={**TEST_SPAN_FIELDS, ("span", "test-time-taken"): "time_taken"},
+    step_cell=("td", "timestamp"),
+    step_fields=STEP_CELL_FIELDS,
+    step_status=("td", "status"),
+    labels={"Start Time": "started", "End Time": "ended"},
+    suite_fields=SUITE_SPAN_FIELDS,
+    scenario=("div", "test-name"),
+))
+
+register_layout(ExtentLayout(
+    name="time-info",
+    markers=["time-info"],
+    block=lambda tag, classes, parent: False,
+    fields={},
+    suite_spans=("div", "time-info", {1: "suite_started", 3: "suite_ended"}),
+    scenario=("div", "test-name"),
+))
+
+
+def sniff_layout(head):
+    """Pick the registered layout whose markers best match the start of a report."""
+    head = head.lower()
+    best_name, best_score = DEFAULT_LAYOUT, 0
+    for name, layout in LAYOUTS.items():
+        score = sum(1 for marker in layout.markers if marker in head)
+        if score > best_score:
+            best_name, best_score = name, score
+    return LAYOUTS[best_name]
+
+
+def detect_layout(html_path):
+    with open(html_path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+    return sniff_layout(head.decode("utf-8", errors="ignore"))
+
+
+def detect_stream_layout(stream):
+    """
+    Sniff the layout of a binary stream that cannot seek (e.g. a ZipFile member).
+
+    Returns:
+        tuple: (layout, stream) where the returned stream replays the sniffed head
+    """
+    head = stream.read(SNIFF_BYTES)
+    rest = iter(lambda: stream.read(CHUNK_SIZE), b"")
+    replay = io.BufferedReader(_ChunkStream(itertools.chain([head], rest)))
+    return sniff_layout(head.decode("utf-8", errors="ignore")), replay
+
+
+def _is_path(source):
+    return isinstance(source, (str, os.PathLike))
+
+
+def _resolve_layout(source, layout):
+    """Return (layout, source), sniffing the layout when None and looking up registry names."""
+    if layout is None:
+        if _is_path(source):
+            return detect_layout(source), source
+        return detect_stream_layout(source)
+    if isinstance(layout, str):
+        layout = LAYOUTS[layout]
+    return layout, source
+
+
+# === Streaming backend ===
+class ExtentStreamParser(HTMLParser):
+    """
+    Collects test blocks from an Extent report without building a DOM.
+
+    With steps=True every test record also gets a "steps" list with one
+    {"status", "timestamp", "details"} dict per step-log row.
+    """
+
+    def __init__(self, layout=None, steps=False):
+        super().__init__(convert_charrefs=True)
+        self.layout = layout or LAYOUTS[DEFAULT_LAYOUT]
+        self.steps = steps
+        self._step_rows = []   # [(depth, step)] step-log rows not yet closed
+        self._stack = []       # [(tag, classes)] of currently open elements
+        self._captures = []    # [(depth, target, field, parts, seq)] text being collected
+        self._last_step = {}   # id(record) -> seq of its latest step cell
+        self._open_tests = []  # [(depth, seq, record)] test blocks not yet closed
+        self._done_tests = []  # [(seq, record)] closed, waiting for the outermost block
+        self._pending_label = None  # field whose value is the next span inside the block
+        self._suite_span_depth = None
+        self._suite_span_count = 0
+        self._seq = 0
+        self._skip_text = 0
+        self.block_count = 0
+        self.scenarios = []    # name-only tests, emitted by finish() if no block was found
+        self.suite = {"suite_started": None, "suite_ended": None}
+        self.ready = []        # finished records in document order
+
+    def _capture(self, depth, target, field, seq=None):
+        self._captures.append((depth, target, field, [], seq))
+
+    def handle_starttag(self, tag, attrs):
+        classes = ()
+        for key, value in attrs:
+            if key == "class" and value:
+                classes = value.split()
+                break
+
+        if tag in VOID_ELEMENTS:
+            return
+
+        layout = self.layout
+        parent = self._stack[-1] if self._stack else None
+        self._stack.append((tag, classes))
+        depth = len(self._stack)
+
+        if tag in NON_TEXT_ELEMENTS:
+            self._skip_text += 1
+
+        if layout.block(tag, classes, parent):
+            record = _empty_test()
+            if self.steps:
+                record["steps"] = []
+            self._open_tests.append((depth, self._seq, record))
+            self._seq += 1
+            self.block_count += 1
+            return
+
+        for (field_tag, css_class), field in layout.suite_fields.items():
+            if tag == field_tag and css_class in classes and self.suite[field] is None:
+                self.suite[field] = ""
+                self._capture(depth, self.suite, field)
+
+        if layout.suite_spans:
+            span_tag, css_class, positions = layout.suite_spans
+            if self._suite_span_depth is None and tag == span_tag and css_class in classes:
+                self._suite_span_depth = depth
+            elif self._suite_span_depth is not None and tag == "span":
+                field = positions.get(self._suite_span_count)
+                self._suite_span_count += 1
+                if field and self.suite[field] is None:
+                    self.suite[field] = ""
+                    self._capture(depth, self.suite, field)
+
+        if layout.scenario and not self._open_tests:
+            scenario_tag, css_class = layout.scenario
+            if tag == scenario_tag and css_class in classes:
+                record = _empty_test()
+                record["name"] = ""
+                self.scenarios.append(record)
+                self._capture(depth, record, "name")
+
+        if not self._open_tests:
+            return
+
+        if self.steps and tag == layout.step_row:
+            self._step_rows.append((depth, _empty_step(dict(attrs).get("status"))))
+
+        if self._pending_label and tag == "span":
+            field = self._pending_label
+            self._pending_label = None
+            for _, _, record in self._open_tests:
+                self._capture(depth, record, "label:" + field)
+
+        if not classes:
+            if layout.labels and tag == "span":
+                self._capture(depth, None, "label", None)
+            return
+
+        for (field_tag, css_class), field in layout.fields.items():
+            if tag == field_tag and css_class in classes:
+                for _, _, record in self._open_tests:
+                    if record[field] is None:
+                        record[field] = ""
+                        self._capture(depth, record, field)
+
+        if layout.step_cell and tag == layout.step_cell[0] and layout.step_cell[1] in classes:
+            self._seq += 1
+            for _, _, record in self._open_tests:
+                self._last_step[id(record)] = self._seq
+                self._capture(depth, record, "last_timestamp", self._seq)
+            if self._step_rows and self._step_rows[-1][1]["timestamp"] is None:
+                self._step_rows[-1][1]["timestamp"] = ""
+                self._capture(depth, self._step_rows[-1][1], "timestamp")
+
+        if self._step_rows:
+            step = self._step_rows[-1][1]
+            for (field_tag, css_class), field in layout.step_fields.items():
+                if tag == field_tag and css_class in classes and step[field] is None:
+                    step[field] = ""
+                    self._capture(depth, step, field)
+            if layout.step_status and tag == layout.step_status[0] and layout.step_status[1] in classes:
+                status = [name for name in classes if name != layout.step_status[1]]
+                if status and step["status"] is None:
+                    step["status"] = status[0]
+
+        if layout.labels and tag == "span":
+            self._capture(depth, None, "label", None)
+
+    def handle_startendtag(self, tag, attrs):
+        # <span class="test-name"/> is still a match, just an empty one
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                break
+        else:
+            return  # stray end tag, ignored like BeautifulSoup does
+
+        while len(self._stack) > index:
+            self._close_top()
+
+    def handle_data(self, data):
+        if self._skip_text or not self._captures:
+            return
+        for capture in self._captures:
+            capture[3].append(data)
+
+    def _close_top(self):
+        depth = len(self._stack)
+        tag, _ = self._stack.pop()
+
+        if tag in NON_TEXT_ELEMENTS:
+            self._skip_text -= 1
+
+        if depth == self._suite_span_depth:
+            self._suite_span_depth = None
+            self._suite_span_count = 0
+
+        while self._captures and self._captures[-1][0] == depth:
+            _, target, field, parts, seq = self._captures.pop()
+            if target is None:
+                # Any span inside a block may be a "Start Time"-style label
+                self._pending_label = self.layout.labels.get("".join(parts))
+            # A step cell nested in an earlier one closes first but is later in document order
+            elif seq is None or self._last_step.get(id(target)) == seq:
+                target[field] = "".join(parts).strip()
+
+        if self._step_rows and self._step_rows[-1][0] == depth:
+            _, step = self._step_rows.pop()
+            # Header and layout rows have no timestamp cell
+            if step["timestamp"] is not None and self._open_tests:
+                self._open_tests[-1][2]["steps"].append(step)
+
+        if self._open_tests and self._open_tests[-1][0] == depth:
+            _, seq, record = self._open_tests.pop()
+            self._last_step.pop(id(record), None)
+            self._pending_label = None
+            for field in self.layout.labels.values():
+                label_value = record.pop("label:" + field, None)
+                if record[field] is None:
+                    record[field] = label_value
+            self._done_tests.append((seq, record))
+            if not self._open_tests:
+                # Nested blocks close first; release them in selector order
+                self._done_tests.sort(key=lambda item: item[0])
+                self.ready.extend(record for _, record in self._done_tests)
+                self._done_tests = []
+
+    def finish(self):
+        self.close()
+        while self._stack:
+            self._close_top()
+        if not self.block_count:
+            self.ready.extend(self.scenarios)
+
+
+# === Base64 payload pre-scan ===
+DATA_IMAGE_MARKER = b"data:image/"
+BASE64_MARKER = b";base64,"
+MAX_MIME_BYTES = 64  # "data:image/" + subtype + optional params before ";base64,"
+MMAP_WINDOW = 8 * 1024 * 1024  # bytes mapped at a time, bounds resident pages
+PAYLOAD_WINDOWS = (64 * 1024, 4096, 256)
+BASE64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=\r\n"
+BASE64_END = re.compile(rb"[^A-Za-z0-9+/=\r\n]")
+
+
+class ScanStats:
+    def __init__(self):
+        self.bytes_parsed = 0
+        self.bytes_skipped = 0
+        self.payloads = 0
+
+    def as_dict(self):
+        return {"bytes_parsed": self.bytes_parsed, "bytes_skipped": self.bytes_skipped, "payloads": self.payloads}
+
+
+class Base64Stripper:
+    """
+    Removes data:image/...;base64, payloads from a byte buffer.
+
+    pieces() may be called repeatedly on successive buffers: it yields the
+    markup that is safe to emit and leaves the end of what it used in
+    self.consumed, keeping state when a buffer ends inside a payload.
+    """
+
+    def __init__(self, stats, chunk_size=CHUNK_SIZE):
+        self.stats = stats
+        self.chunk_size = chunk_size
+        self.in_payload = False
+        self.consumed = 0
+
+    def _emit(self, buf, start, stop):
+        for offset in range(start, stop, self.chunk_size):
+            piece = buf[offset:min(stop, offset + self.chunk_size)]
+            self.stats.bytes_parsed += len(piece)
+            yield piece
+
+    def _payload_end(self, buf, pos, end):
+        # Windows made only of base64 characters are skipped with a C-level
+        # translate(), narrowing to smaller windows once one holds the end; the
+        # regex only ever runs on the last, smallest window.
+        for window in PAYLOAD_WINDOWS:
+            while pos < end:
+                stop = min(end, pos + window)
+                if buf[pos:stop].translate(None, BASE64_ALPHABET):
+                    break
+                pos = stop
+            else:
+                return -1
+            end = stop
+        return BASE64_END.search(buf, pos, end).start()
+
+    def pieces(self, buf, start=0, final=False):
+        pos, end = start, len(buf)
+        while pos < end:
+            if self.in_payload:
+                stop = self._payload_end(buf, pos, end)
+                if stop == -1:
+                    self.stats.bytes_skipped += end - pos
+                    pos = end
+                else:
+                    self.stats.bytes_skipped += stop - pos
+                    pos = stop
+                    self.in_payload = False
+                continue
+
+            marker_start = buf.find(DATA_IMAGE_MARKER, pos)
+            if marker_start == -1:
+                # Keep a partial marker at the end of the buffer for the next call
+                stop = end if final else max(pos, end - len(DATA_IMAGE_MARKER) + 1)
+                yield from self._emit(buf, pos, stop)
+                pos = stop
+                break
+
+            marker = buf.find(BASE64_MARKER, marker_start, marker_start + MAX_MIME_BYTES)
+            if marker == -1:
+                if not final and end < marker_start + MAX_MIME_BYTES:
+                    yield from self._emit(buf, pos, marker_start)
+                    pos = marker_start
+                    break
+                # Not base64 (e.g. an SVG data URI): keep it as markup
+                stop = marker_start + len(DATA_IMAGE_MARKER)
+                yield from self._emit(buf, pos, stop)
+                pos = stop
+                continue
+
+            stop = marker + len(BASE64_MARKER)
+            yield from self._emit(buf, pos, stop)
+            pos = stop
+            self.in_payload = True
+            self.stats.payloads += 1
+        self.consumed = pos
+
+
+def iter_stripped_chunks(read, stats, chunk_size=CHUNK_SIZE):
+    """Strip base64 payloads from a byte stream given by read(n)."""
+    stripper = Base64Stripper(stats, chunk_size)
+    pending = b""
+    while True:
+        block = read(chunk_size)
+        final = not block
+        buf = pending + block if pending else block
+        yield from stripper.pieces(buf, final=final)
+        pending = buf[stripper.consumed:]
+        if final:
+            return
+
+
+def iter_stripped_file(html_path, stats, chunk_size=CHUNK_SIZE, window_size=MMAP_WINDOW):
+    """
+    Strip base64 payloads from a file through a sliding memory map.
+
+    Payload bytes are never decoded or handed to the parser, and only one
+    window of the file is mapped at a time so resident memory does not grow
+    with the file.
+    """
+    stripper = Base64Stripper(stats, chunk_size)
+    with open(html_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        offset = 0
+        while offset < size:
+            map_start = offset - offset % mmap.ALLOCATIONGRANULARITY
+            length = min(offset - map_start + window_size, size - map_start)
+            final = map_start + length >= size
+            with mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ, offset=map_start) as mm:
+                yield from stripper.pieces(mm, start=offset - map_start, final=final)
+            offset = map_start + stripper.consumed
+            if final:
+                break
+
+
+class _ChunkStream(io.RawIOBase):
+    """Read-only raw stream over an iterator of byte chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        while not self._buffer:
+            self._buffer = next(self._chunks, None)
+            if self._buffer is None:
+                self._buffer = b""
+                return 0
+        size = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def open_report_text(source, stats=None, prescan=PRESCAN_BASE64):
+    """
+    Open a report as text exactly like open(path, "r", encoding="utf-8", errors="ignore"),
+    optionally with base64 image payloads removed first.
+
+    source is a path or a binary stream such as a ZipFile member; streams are
+    read sequentially and never need to seek.
+    """
+    stats = stats if stats is not None else ScanStats()
+    if _is_path(source):
+        if not prescan:
+            return open(source, "r", encoding="utf-8", errors="ignore")
+        chunks = iter_stripped_file(source, stats)
+    else:
+        if not prescan:
+            return io.TextIOWrapper(source, encoding="utf-8", errors="ignore")
+        chunks = iter_stripped_chunks(source.read, stats)
+    return io.TextIOWrapper(io.BufferedReader(_ChunkStream(chunks)), encoding="utf-8", errors="ignore")
+
+
+# === Streaming driver ===
+def _stream_report(text_stream, parser, chunk_size=CHUNK_SIZE):
+    with text_stream as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            if parser.ready:
+                yield from parser.ready
+                parser.ready = []
+    parser.finish()
+    yield from parser.ready
+    parser.ready = []
+
+
+def iter_test_fields_stream(source, layout=None, stats=None, prescan=PRESCAN_BASE64):
+    text_stream = open_report_text(source, stats, prescan)
+    return _stream_report(text_stream, ExtentStreamParser(layout))
+
+
+def iter_test_steps(source, layout=None, stats=None):
+    """
+    Yield test records that also carry their step-log rows under "steps".
+
+    The layout is sniffed from the report head when not given.
+    """
+    layout, source = _resolve_layout(source, layout)
+    return _stream_report(open_report_text(source, stats), ExtentStreamParser(layout, steps=True))
+
+
+def extract_report(source, layout=None):
+    """
+    Detect the layout (unless given) and extract a whole report in one pass.
+
+    Args:
+        source: Report path or binary stream (e.g. ZipFile.open(member))
+        layout: ExtentLayout or registry name, sniffed from the report head when None
+
+    Returns:
+        dict: {"layout", "suite_started", "suite_ended", "bytes_parsed",
+               "bytes_skipped", "payloads", "tests"}
+    """
+    layout, source = _resolve_layout(source, layout)
+
+    stats = ScanStats()
+    parser = ExtentStreamParser(layout)
+    tests = list(_stream_report(open_report_text(source, stats), parser))
+    return {"layout": layout.name, **parser.suite, **stats.as_dict(), "tests": tests}
+
+
+# === BeautifulSoup backend ===
+def iter_test_fields_bs4(source):
+    from bs4 import BeautifulSoup
+
+    with open_report_text(source, prescan=False) as f:
+        soup = BeautifulSoup(f, "html.parser")
+
+    for test in soup.select("ul.test-collection > li"):
+        record = _empty_test()
+        for (tag, css_class), field in TEST_SPAN_FIELDS.items():
+            span = test.select_one(f"{tag}.{css_class}")
+            if span:
+                record[field] = span.text.strip()
+
+        timestamps = test.select("td.timestamp")
+        if timestamps:
+            record["last_timestamp"] = timestamps[-1].text.strip()
+
+        yield record
+
+
+def iter_test_fields(source, backend="auto"):
+    """Yield test dicts from a report path or binary stream with the chosen backend."""
+    if backend == "auto":
+        if _is_path(source):
+            return iter_test_fields_stream(source, detect_layout(source))
+        layout, source = detect_stream_layout(source)
+        return iter_test_fields_stream(source, layout)
+    if backend == "stream":
+        return iter_test_fields_stream(source)
+    if backend == "bs4":
+        return iter_test_fields_bs4(source)
+    raise ValueError(f"Unknown parser backend '{backend}', expected one of {BACKENDS}")
@@ -0,0 +1,206 @@
+"""
+Step-level log of Extent reports: one row per step-log entry of every test.
+
+Columns: report, test, step (0-based index in the test), status, timestamp
+(raw cell text), details (step text) and delta_seconds (time since the
+previous step of the same test, None for the first step or an unreadable
+timestamp). Time-only stamps that go backwards are taken to cross midnight.
+
+Rows are written in batches while reports are parsed, as Parquet row groups
+when pyarrow is installed and as gzip'd CSV otherwise, so the log of
+thousands of runs can be queried later without touching the HTML again.
+
+Usage:
+    python extent_step_log.py Reports --workers 4
+    python extent_step_log.py Reports --slowest 25     # query the existing log only
+"""
+
+import argparse
+import csv
+import gzip
+import os
+from datetime import datetime
+
+from extent_html_parser import iter_test_steps
+from report_archives import iter_report_streams, relative_report_name
+from report_ingest import find_report_sources, iter_extracted_reports
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+STEP_COLUMNS = ["report", "test", "step", "status", "timestamp", "details", "delta_seconds"]
+STEP_TIME_FORMATS = ["%H:%M:%S", "%I:%M:%S %p", "%m/%d/%Y %H:%M:%S", "%Y-%m-%d %H:%M:%S"]
+BATCH_ROWS = 64 * 1024
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+if pa is not None:
+    STEP_SCHEMA = pa.schema([
+        ("report", pa.string()),
+        ("test", pa.string()),
+        ("step", pa.int32()),
+        ("status", pa.string()),
+        ("timestamp", pa.string()),
+        ("details", pa.string()),
+        ("delta_seconds", pa.float64()),
+    ])
+
+
+def step_log_path(folder_path):
+    extension = ".parquet" if pa is not None else ".csv.gz"
+    return os.path.join(folder_path, "extent_step_log" + extension)
+
+
+def parse_step_time(text):
+    """Return (datetime, time_only) for a step timestamp, or (None, False)."""
+    text = (text or "").strip()
+    for index, fmt in enumerate(STEP_TIME_FORMATS):
+        try:
+            return datetime.strptime(text, fmt), index < 2
+        except ValueError:
+            continue
+    return None, False
+
+
+def iter_step_rows(report_name, tests):
+    """Flatten test records from iter_test_steps into step-log rows with deltas."""
+    for test in tests:
+        previous = None
+        for index, step in enumerate(test["steps"]):
+            current, time_only = parse_step_time(step["timestamp"])
+            delta = None
+            if current is not None and previous is not None:
+                delta = (current - previous).total_seconds()
+                if delta < 0 and time_only:
+                    delta += SECONDS_PER_DAY
+            previous = current
+
+            yield {
+                "report": report_name,
+                "test": test["name"],
+                "step": index,
+                "status": step["status"],
+                "timestamp": step["timestamp"],
+                "details": step["details"],
+                "delta_seconds": delta,
+            }
+
+
+def extract_step_rows(file_path):
+    """All step-log rows of an .html report or of every report inside a .zip."""
+    rows = []
+    for report_name, stream in iter_report_streams(file_path):
+        rows.extend(iter_step_rows(report_name, iter_test_steps(stream)))
+    return rows
+
+
+# === Columnar writer ===
+class StepLogWriter:
+    """Streams step rows to Parquet (one row group per batch) or gzip'd CSV."""
+
+    def __init__(self, path, batch_rows=BATCH_ROWS):
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.batch_rows = batch_rows
+        self.rows_written = 0
+        self._batch = []
+        self._writer = None
+        self._csv_file = None
+        self.parquet = path.endswith(".parquet")
+        if self.parquet and pa is None:
+            raise RuntimeError("Writing Parquet needs pyarrow; use a .csv.gz path instead")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(commit=exc_type is None)
+
+    def write(self, rows):
+        for row in rows:
+            self._batch.append(row)
+            if len(self._batch) >= self.batch_rows:
+                self.flush()
+
+    def _open(self):
+        if self.parquet:
+            self._writer = pq.ParquetWriter(self.tmp_path, STEP_SCHEMA, compression="zstd")
+        else:
+            self._csv_file = gzip.open(self.tmp_path, "wt", newline="", encoding="utf-8")
+            self._writer = csv.DictWriter(self._csv_file, fieldnames=STEP_COLUMNS)
+            self._writer.writeheader()
+
+    def flush(self):
+        if not self._batch:
+            return
+        if self._writer is None:
+            self._open()
+        if self.parquet:
+            self._writer.write_table(pa.Table.from_pylist(self._batch, schema=STEP_SCHEMA))
+        else:
+            self._writer.writerows(self._batch)
+        self.rows_written += len(self._batch)
+        self._batch = []
+
+    def close(self, commit=True):
+        if commit:
+            self.flush()
+            if self._writer is None:  # no steps at all: still leave a valid, empty log
+                self._open()
+        if self.parquet and self._writer is not None:
+            self._writer.close()
+        if self._csv_file is not None:
+            self._csv_file.close()
+        if commit:
+            os.replace(self.tmp_path, self.path)
+        elif os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+def read_step_log(path, columns=None):
+    """Load (some columns of) a step log as a DataFrame."""
+    import pandas as pd
+
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_csv(path, usecols=columns, keep_default_na=False, na_values={"delta_seconds": [""]})
+
+
+def build_step_log(folder_path, output_path, workers=1):
+    sources = find_report_sources(folder_path)
+    with StepLogWriter(output_path) as writer:
+        for file_path, rows, error in iter_extracted_reports(sources, extract_step_rows, workers):
+            if error:
+                print(f"❌ Error reading {os.path.relpath(file_path, folder_path)}: {error}")
+                continue
+            for row in rows:
+                row["report"] = relative_report_name(row["report"], folder_path)
+            writer.write(rows)
+    print(f"✅ {writer.rows_written} step(s) from {len(sources)} report file(s) saved to: {output_path}")
+
+
+def print_slowest_steps(output_path, count):
+    df = read_step_log(output_path, columns=["report", "test", "step", "details", "delta_seconds"])
+    slowest = df.nlargest(count, "delta_seconds")
+    print(f"\n🐢 {len(slowest)} slowest step(s) in {output_path}:")
+    for row in slowest.itertuples(index=False):
+        details = (row.details or "")[:80]
+        print(f"  {row.delta_seconds:>9.1f}s  {row.report} | {row.test} | step {row.step}: {details}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("folder", nargs="?", default="Reports", help="Folder to scan for .html reports and .zip archives")
+    parser.add_argument("--workers", type=int, default=1, help="Parse reports in N worker processes")
+    parser.add_argument("--output", help="Step log path (.parquet or .csv.gz), default inside the folder")
+    parser.add_argument("--slowest", type=int, metavar="N", help="Only print the N slowest steps of the existing log")
+    args = parser.parse_args()
+
+    output_path = args.output or step_log_path(args.folder)
+    if args.slowest:
+        print_slowest_steps(output_path, args.slowest)
+    else:
+        build_step_log(args.folder, output_path, workers=args.workers)
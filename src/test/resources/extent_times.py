@@ -0,0 +1,105 @@
+"""
+Shared, vectorized timestamp parsing for Extent report columns.
+
+Report times show up in several formats (see TIME_FORMATS) and columns of
+millions of rows hold only a few thousand distinct strings, so a column is
+parsed like this:
+
+1. pd.factorize() maps every row to the code of its distinct string.
+2. The format is detected once per column from a sample of those strings.
+3. Only the distinct strings are parsed, with the detected format first and
+   the remaining formats for whatever it could not read (mixed reports).
+4. The parsed values are broadcast back to the rows through the codes.
+
+Times are kept as int64 epoch values in EPOCH_UNIT with NAT for missing or
+unreadable strings, which is also the memory layout of a datetime64 column,
+so to_datetime_column() converts without copying row data.
+"""
+
+import numpy as np
+import pandas as pd
+
+TIME_FORMATS = [
+    "%m/%d/%Y %H:%M:%S",  # DATETIME_FORMAT of the Excel summary scripts
+    "%m/%d/%Y %H:%M",     # "Start Time" / "End Time" label spans (python8.py, python9.py)
+    "%Y-%m-%d %H:%M:%S",  # python6.py / python7.py CSV input
+    "%Y-%m-%d %H:%M",     # python8.py / python9.py CSV output
+    "%H:%M:%S",           # td.timestamp step cells, dated 1900-01-01 like strptime
+]
+EPOCH_UNIT = "us"  # what pd.to_datetime returns for strings
+NAT = np.iinfo(np.int64).min  # int64 value of NaT
+SNIFF_VALUES = 64  # distinct strings used to detect a column's format
+
+
+def _distinct_strings(values):
+    """Return (codes, uniques): per-row code (-1 for missing) and stripped distinct strings."""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    uniques = pd.Series(uniques, dtype=object).astype(str).str.strip()
+    return codes, uniques.to_numpy(dtype=object)
+
+
+def _parse_with(strings, fmt):
+    parsed = pd.to_datetime(pd.Series(strings, dtype=object), format=fmt, errors="coerce")
+    return parsed.to_numpy(dtype=f"datetime64[{EPOCH_UNIT}]").view(np.int64)
+
+
+def detect_time_format(values, formats=TIME_FORMATS):
+    """Return the format that reads the most of a sample of distinct values, or None."""
+    _, uniques = _distinct_strings(values)
+    sample = uniques[:SNIFF_VALUES]
+    best_format, best_count = None, 0
+    for fmt in formats:
+        count = int((_parse_with(sample, fmt) != NAT).sum())
+        if count > best_count:
+            best_format, best_count = fmt, count
+    return best_format
+
+
+def _parse_distinct(uniques, fmt, formats):
+    result = np.full(len(uniques), NAT, dtype=np.int64)
+    pending = np.arange(len(uniques))
+    for candidate in [fmt] + [f for f in formats if f != fmt]:
+        if not len(pending):
+            break
+        parsed = _parse_with(uniques[pending], candidate)
+        ok = parsed != NAT
+        result[pending[ok]] = parsed[ok]
+        pending = pending[~ok]
+    return result
+
+
+def parse_epoch(values, fmt=None, formats=TIME_FORMATS):
+    """
+    Parse timestamp strings into int64 epoch values in EPOCH_UNIT.
+
+    Args:
+        values: Sequence or Series of strings (None/NaN allowed)
+        fmt (str): Format to try first; detected from the column when None
+        formats (list): Formats tried, in order, for strings fmt cannot read
+
+    Returns:
+        numpy.ndarray: int64 epoch values, NAT where a value is missing or unreadable
+    """
+    if isinstance(values, pd.Series) and pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy(dtype=f"datetime64[{EPOCH_UNIT}]").view(np.int64)
+
+    codes, uniques = _distinct_strings(values)
+    if not len(uniques):
+        return np.full(len(codes), NAT, dtype=np.int64)
+
+    if fmt is None:
+        fmt = detect_time_format(uniques[:SNIFF_VALUES], formats) or formats[0]
+    parsed = _parse_distinct(uniques, fmt, formats)
+    return np.where(codes < 0, NAT, parsed.take(codes))
+
+
+def to_datetime_column(values, fmt=None, formats=TIME_FORMATS):
+    """
+    Drop-in for pd.to_datetime(values, errors="coerce") on report time columns.
+
+    Returns a datetime64 Series (same index as values when it is a Series).
+    """
+    epoch = parse_epoch(values, fmt, formats)
+    index = values.index if isinstance(values, pd.Series) else None
+    name = values.name if isinstance(values, pd.Series) else None
+    return pd.Series(epoch.view(f"datetime64[{EPOCH_UNIT}]"), index=index, name=name)
@@ -1,10 +1,17 @@
 import os
-import csv
+import pandas as pd
 from bs4 import BeautifulSoup
+from extent_times import to_datetime_column
+from report_sinks import pa, write_table
 
 # Root folder where HTML files are stored
 report_folder = "test-reports"
-output_csv = os.path.join(report_folder, "extent_report_test_details.csv")
+output_base = os.path.join(report_folder, "extent_report_test_details")
+
+# Output sinks, all written from the same table: .parquet / .arrow keep typed timestamps and
+# dictionary-encoded names for python6.py / python7.py; .csv(.gz) / .xlsx are presentation copies
+OUTPUT_SUFFIXES = [".parquet", ".csv"] if pa is not None else [".csv"]
+TYPED_SUFFIXES = (".parquet", ".arrow", ".feather")  # sinks that get parsed timestamps
 
 # CSV headers
 header = ["File Path", "Test Name", "Test Status", "Test Start Time", "Test End Time", "Time Taken"]
@@ -40,10 +47,15 @@ for root, dirs, files in os.walk(report_folder):
                     rel_path = os.path.relpath(file_path, report_folder)
                     rows.append([rel_path, test_name, status, start_time, end_time, time_taken])
 
-# Write to CSV
-with open(output_csv, "w", newline="", encoding="utf-8") as csvfile:
-    writer = csv.writer(csvfile)
-    writer.writerow(header)
-    writer.writerows(rows)
+# One table for every sink
+df = pd.DataFrame(rows, columns=header)
+for col in ["File Path", "Test Name", "Test Status"]:
+    df[col] = df[col].astype("category")
+
+# Typed timestamps for the columnar sinks only: the CSV / Excel copies keep the report text,
+# since times in no known format (and "N/A") would parse to empty cells
+typed_df = df.assign(**{col: to_datetime_column(df[col]) for col in ["Test Start Time", "Test End Time"]})
 
-print(f"✅ Test-level report saved at: {output_csv}")
\ No newline at end of file
+for suffix in OUTPUT_SUFFIXES:
+    output_path = write_table(typed_df if suffix in TYPED_SUFFIXES else df, output_base + suffix)
+    print(f"✅ Test-level report saved at: {output_path}")
\ No newline at end of file
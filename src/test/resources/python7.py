@@ -1,18 +1,15 @@
 import csv
-from datetime import datetime
 from collections import defaultdict
 import os
+from extent_times import to_datetime_column
+from report_sinks import find_table, read_table
 
-# Input and output file paths
-input_csv = "test-reports/extent_report_test_details.csv"
+# Input and output file paths (input: python5.py output, .parquet / .arrow preferred over .csv)
+input_base = "test-reports/extent_report_test_details"
 summary_csv = "test-reports/extent_report_summary.csv"
 
-# Parse datetime safely
-def parse_time(t_str):
-    try:
-        return datetime.strptime(t_str, "%Y-%m-%d %H:%M:%S")
-    except:
-        return None
+# python5.py time format; anything else counts as unreadable
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 # Dictionary to hold summaries
 test_summary = defaultdict(lambda: {
@@ -22,22 +19,25 @@ test_summary = defaultdict(lambda: {
     "shortest_duration_sec": float("inf")
 })
 
-# Read input test details
-with open(input_csv, "r", encoding="utf-8") as csvfile:
-    reader = csv.DictReader(csvfile)
-    for row in reader:
-        test_name = row["Test Name"]
-        start_time = parse_time(row["Test Start Time"])
-        end_time = parse_time(row["Test End Time"])
+# Read input test details: only the three columns used, timestamps parsed per distinct value
+input_path = find_table(input_base)
+if input_path is None:
+    raise SystemExit(f"❌ No {input_base}.parquet/.arrow/.csv found; run python5.py first")
+details = read_table(input_path, columns=["Test Name", "Test Start Time", "Test End Time"],
+                     keep_default_na=False)
+start_times = to_datetime_column(details["Test Start Time"], TIME_FORMAT, formats=[TIME_FORMAT])
+end_times = to_datetime_column(details["Test End Time"], TIME_FORMAT, formats=[TIME_FORMAT])
+durations = (end_times - start_times).dt.total_seconds()
+test_names = details["Test Name"].astype(object)
+valid = test_names.notna() & (test_names != "") & durations.notna()
 
-        if test_name and start_time and end_time:
-            duration = (end_time - start_time).total_seconds()
-            data = test_summary[test_name]
-            data["runs"] += 1
-            data["total_duration_sec"] += duration
-            data["longest_duration_sec"] = max(data["longest_duration_sec"], duration)
-            if duration > 0:
-                data["shortest_duration_sec"] = min(data["shortest_duration_sec"], duration)
+for test_name, duration in zip(test_names[valid].tolist(), durations[valid].tolist()):
+    data = test_summary[test_name]
+    data["runs"] += 1
+    data["total_duration_sec"] += duration
+    data["longest_duration_sec"] = max(data["longest_duration_sec"], duration)
+    if duration > 0:
+        data["shortest_duration_sec"] = min(data["shortest_duration_sec"], duration)
 
 # Write summary to output CSV
 with open(summary_csv, "w", newline="", encoding="utf-8") as csvfile:
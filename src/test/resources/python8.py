@@ -1,13 +1,14 @@
 import os
-import zipfile
 import csv
+import argparse
 from bs4 import BeautifulSoup
 from datetime import datetime
-import tempfile
+from extent_html_parser import open_report_text
+from report_archives import iter_report_streams, relative_report_name
+from report_ingest import find_report_sources, iter_extracted_reports
 
 # Base folder where all reports (or ZIPs) reside
 base_folder = "test-reports"
-output_csv = os.path.join(base_folder, "extent_report_test_details.csv")
 
 # Function to parse datetime from format: "5/19/2025 18:55"
 def parse_time(time_str):
@@ -16,72 +17,78 @@ def parse_time(time_str):
     except:
         return None
 
-# Extract details from an HTML report
-def extract_from_html(file_path):
+# Extract details from an HTML report (a text stream, on disk or inside a ZIP)
+def extract_from_html(f, report_name):
     results = []
-    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-        soup = BeautifulSoup(f, "html.parser")
-
-        # Report Start and End Times (only once per report)
-        start_span = soup.find("span", string="Start Time")
-        end_span = soup.find("span", string="End Time")
-
-        report_start = parse_time(start_span.find_next("span").text.strip()) if start_span else None
-        report_end = parse_time(end_span.find_next("span").text.strip()) if end_span else None
-
-        # Individual test names (usually <span class='test-name'>)
-        for test_name_span in soup.find_all("span", class_="test-name"):
-            test_name = test_name_span.text.strip()
-
-            # Try to find nearby start and end time
-            container = test_name_span.find_parent("li")
-            test_start = None
-            test_end = None
-
-            if container:
-                start_tag = container.find("span", string="Start Time")
-                end_tag = container.find("span", string="End Time")
-
-                if start_tag:
-                    test_start = parse_time(start_tag.find_next("span").text.strip())
-                if end_tag:
-                    test_end = parse_time(end_tag.find_next("span").text.strip())
-
-            results.append({
-                "Test Name": test_name,
-                "Test Start Time": test_start.strftime("%Y-%m-%d %H:%M") if test_start else "",
-                "Test End Time": test_end.strftime("%Y-%m-%d %H:%M") if test_end else "",
-                "Report File": os.path.relpath(file_path, base_folder)
-            })
+    soup = BeautifulSoup(f, "html.parser")
+
+    # Report Start and End Times (only once per report)
+    start_span = soup.find("span", string="Start Time")
+    end_span = soup.find("span", string="End Time")
+
+    report_start = parse_time(start_span.find_next("span").text.strip()) if start_span else None
+    report_end = parse_time(end_span.find_next("span").text.strip()) if end_span else None
+
+    # Individual test names (usually <span class='test-name'>)
+    for test_name_span in soup.find_all("span", class_="test-name"):
+        test_name = test_name_span.text.strip()
+
+        # Try to find nearby start and end time
+        container = test_name_span.find_parent("li")
+        test_start = None
+        test_end = None
+
+        if container:
+            start_tag = container.find("span", string="Start Time")
+            end_tag = container.find("span", string="End Time")
+
+            if start_tag:
+                test_start = parse_time(start_tag.find_next("span").text.strip())
+            if end_tag:
+                test_end = parse_time(end_tag.find_next("span").text.strip())
+
+        results.append({
+            "Test Name": test_name,
+            "Test Start Time": test_start.strftime("%Y-%m-%d %H:%M") if test_start else "",
+            "Test End Time": test_end.strftime("%Y-%m-%d %H:%M") if test_end else "",
+            "Report File": report_name
+        })
     return results
 
-# Process files recursively (including ZIPs)
-all_test_data = []
-
-for root, dirs, files in os.walk(base_folder):
-    for file in files:
-        file_path = os.path.join(root, file)
-
-        if file.lower().endswith(".html"):
-            all_test_data.extend(extract_from_html(file_path))
-
-        elif file.lower().endswith(".zip"):
-            with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                with tempfile.TemporaryDirectory() as tmp_dir:
-                    zip_ref.extractall(tmp_dir)
-
-                    # Look for HTML files inside extracted content
-                    for dirpath, _, zip_files in os.walk(tmp_dir):
-                        for zip_file in zip_files:
-                            if zip_file.lower().endswith(".html"):
-                                html_path = os.path.join(dirpath, zip_file)
-                                all_test_data.extend(extract_from_html(html_path))
+# Extract every report in an .html file or a .zip (nested ZIPs included), without unpacking to disk
+def extract_from_source(file_path):
+    results = []
+    for report_name, stream in iter_report_streams(file_path):
+        with open_report_text(stream) as f:
+            results.extend(extract_from_html(f, report_name))
+    return results
 
-# Write output to CSV
-with open(output_csv, "w", newline="", encoding="utf-8") as csvfile:
-    writer = csv.DictWriter(csvfile, fieldnames=["Test Name", "Test Start Time", "Test End Time", "Report File"])
-    writer.writeheader()
-    for row in all_test_data:
-        writer.writerow(row)
 
-print(f"✅ Extracted data from HTMLs & ZIPs saved to: {output_csv}")
\ No newline at end of file
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract test start/end times from Extent HTML reports and ZIPs")
+    parser.add_argument("folder", nargs="?", default=base_folder, help="Folder to scan for .html reports and .zip archives")
+    parser.add_argument("--workers", type=int, default=1, help="Process reports and archives in N worker processes")
+    args = parser.parse_args()
+
+    base_folder = args.folder
+    output_csv = os.path.join(base_folder, "extent_report_test_details.csv")
+
+    # Process files recursively (including ZIPs)
+    all_test_data = []
+    sources = find_report_sources(base_folder)
+    for file_path, rows, error in iter_extracted_reports(sources, extract_from_source, args.workers):
+        if error:
+            print(f"❌ Error reading {os.path.relpath(file_path, base_folder)}: {error}")
+            continue
+        for row in rows:
+            row["Report File"] = relative_report_name(row["Report File"], base_folder)
+        all_test_data.extend(rows)
+
+    # Write output to CSV
+    with open(output_csv, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=["Test Name", "Test Start Time", "Test End Time", "Report File"])
+        writer.writeheader()
+        for row in all_test_data:
+            writer.writerow(row)
+
+    print(f"✅ Extracted data from HTMLs & ZIPs saved to: {output_csv}")
@@ -0,0 +1,83 @@
+"""
+Read Extent HTML reports straight out of ZIP archives.
+
+Archived report ZIPs are mostly screenshots, CSS and JS. Instead of
+``extractall`` into a temp dir, only ``.html`` members are opened with
+``ZipFile.open`` and streamed to the extractor; nothing else is read or
+written to disk.
+
+- Nested ZIPs are opened in place when stored uncompressed (seeking inside
+  them is free). A compressed nested ZIP is spooled to memory first, up to
+  SPOOL_MAX_BYTES and to a temp file beyond, because ZipFile needs to seek
+  and seeking backwards in a deflate stream means decompressing it again.
+- Member names are reported as ``<archive>!/<member>``, nested archives
+  chain the same way: ``runs.zip!/run-1.zip!/index.html``.
+"""
+
+import os
+import shutil
+import tempfile
+import zipfile
+
+HTML_SUFFIX = ".html"
+ZIP_SUFFIX = ".zip"
+MEMBER_SEPARATOR = "!/"
+SPOOL_MAX_BYTES = 64 * 1024 * 1024
+COPY_BLOCK_SIZE = 1 << 20
+
+
+def is_archive(path):
+    return path.lower().endswith(ZIP_SUFFIX)
+
+
+def _open_nested(archive, info):
+    if info.compress_type == zipfile.ZIP_STORED:
+        return archive.open(info)
+
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    with archive.open(info) as member:
+        shutil.copyfileobj(member, spool, COPY_BLOCK_SIZE)
+    spool.seek(0)
+    return spool
+
+
+def iter_archive_members(archive, archive_name):
+    """Yield (member_name, binary stream) for every .html member, recursing into nested ZIPs."""
+    for info in sorted(archive.infolist(), key=lambda info: info.filename):
+        if info.is_dir():
+            continue
+
+        member_name = f"{archive_name}{MEMBER_SEPARATOR}{info.filename}"
+        filename = info.filename.lower()
+        if filename.endswith(HTML_SUFFIX):
+            with archive.open(info) as member:
+                yield member_name, member
+        elif filename.endswith(ZIP_SUFFIX):
+            with _open_nested(archive, info) as nested_file, zipfile.ZipFile(nested_file) as nested:
+                yield from iter_archive_members(nested, member_name)
+
+
+def iter_report_streams(path):
+    """
+    Yield (report_name, binary stream) for a .html report or every .html inside a .zip.
+
+    Streams are only valid until the next item is requested.
+    """
+    if is_archive(path):
+        with zipfile.ZipFile(path) as archive:
+            yield from iter_archive_members(archive, path)
+    else:
+        with open(path, "rb") as f:
+            yield path, f
+
+
+def split_member_name(report_name):
+    """Return (outer archive or report path, member path inside it or None)."""
+    outer, _, member = report_name.partition(MEMBER_SEPARATOR)
+    return outer, member or None
+
+
+def relative_report_name(report_name, folder_path):
+    outer, member = split_member_name(report_name)
+    outer = os.path.relpath(outer, folder_path)
+    return f"{outer}{MEMBER_SEPARATOR}{member}" if member else outer
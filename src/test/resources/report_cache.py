@@ -0,0 +1,116 @@
+"""
+Persistent cache of the rows extracted from each Extent report.
+
+Entries are keyed by the report's SHA-256 (from report_manifest), so a full
+Test_Run_Details.xlsx rebuild only parses reports it has never seen. Rows are
+stored column-wise: Parquet when pyarrow is installed, otherwise gzip'd
+column-oriented JSON.
+
+- Invalidation: the file name carries the cache namespace, the extractor
+  version and the parser backend; bumping extent_html_parser.EXTRACTOR_VERSION
+  orphans old entries and they are purged on the next run. Entries of the
+  other backends are kept, so switching PARSER_BACKEND back reuses them.
+- Eviction: least-recently-used entries are removed once the cache grows
+  past max_bytes.
+"""
+
+import gzip
+import json
+import os
+
+from extent_html_parser import BACKENDS, EXTRACTOR_VERSION
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+CACHE_DIR = ".extent_cache"
+MAX_CACHE_BYTES = 2 * 1024 ** 3
+
+
+def _rows_to_columns(rows):
+    columns = {}
+    for key in (rows[0] if rows else {}):
+        columns[key] = [row[key] for row in rows]
+    return columns
+
+
+def _columns_to_rows(columns):
+    keys = list(columns)
+    return [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+
+class ReportRowCache:
+    def __init__(self, cache_dir, namespace, backend="auto", version=EXTRACTOR_VERSION, max_bytes=MAX_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.prefix = f"{namespace}-v{version}-{backend}-"
+        self.namespace = namespace
+        self.version = version
+        self.max_bytes = max_bytes
+        self.extension = ".parquet" if pa is not None else ".json.gz"
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self.purge_stale()
+
+    def _path(self, sha256):
+        return os.path.join(self.cache_dir, f"{self.prefix}{sha256}{self.extension}")
+
+    def contains(self, sha256):
+        return os.path.exists(self._path(sha256))
+
+    def get(self, sha256):
+        path = self._path(sha256)
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+
+        try:
+            if self.extension == ".parquet":
+                columns = pq.read_table(path).to_pydict()
+            else:
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    columns = json.load(f)
+        except Exception as e:
+            print(f"⚠️  Dropping unreadable cache entry {os.path.basename(path)}: {e}")
+            os.remove(path)
+            self.misses += 1
+            return None
+
+        os.utime(path)  # mark as recently used for eviction
+        self.hits += 1
+        return _columns_to_rows(columns)
+
+    def put(self, sha256, rows):
+        path = self._path(sha256)
+        tmp_path = path + ".tmp"
+        columns = _rows_to_columns(rows)
+        if self.extension == ".parquet":
+            pq.write_table(pa.table(columns), tmp_path, compression="zstd")
+        else:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(columns, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def purge_stale(self):
+        """Remove entries written by another extractor version of this namespace."""
+        current = tuple(f"{self.namespace}-v{self.version}-{backend}-" for backend in BACKENDS)
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(f"{self.namespace}-v") and not name.startswith(current):
+                os.remove(os.path.join(self.cache_dir, name))
+
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
@@ -0,0 +1,157 @@
+"""
+Report discovery and (optionally parallel) extraction shared by the summary scripts.
+
+Reports are always handed back sorted by path, so a ``--workers N`` run builds
+exactly the same rows, in the same order, as the serial run.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+# === Discovery ===
+def find_html_reports(folder_path):
+    reports = []
+    for root, _, files in os.walk(folder_path):
+        for file in files:
+            if file.lower().endswith(".html"):
+                reports.append(os.path.join(root, file))
+    return sorted(reports)
+
+
+def find_report_sources(folder_path):
+    """Like find_html_reports, plus every .zip archive (see report_archives)."""
+    sources = []
+    for root, _, files in os.walk(folder_path):
+        for file in files:
+            if file.lower().endswith((".html", ".zip")):
+                sources.append(os.path.join(root, file))
+    return sorted(sources)
+
+
+# === Extraction ===
+def _extract_one(extract_fn, html_path):
+    # Runs in the worker: a bad report must not take the pool down with it
+    try:
+        return extract_fn(html_path), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def iter_extracted_reports(html_paths, extract_fn, workers=1, progress=print):
+    """
+    Yield (html_path, rows, error) for every report, in the order given.
+
+    extract_fn must be a module-level function so it can be sent to worker
+    processes. error is None on success, rows is None on failure. progress
+    gets one "[done/total]" line per report (e.g. a logger method).
+    """
+    html_paths = list(html_paths)
+    total = len(html_paths)
+
+    if workers <= 1 or total <= 1:
+        for done, html_path in enumerate(html_paths, 1):
+            progress(f"🔍 [{done}/{total}] Processing: {html_path}")
+            rows, error = _extract_one(extract_fn, html_path)
+            yield html_path, rows, error
+        return
+
+    results = {}
+    next_index = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_extract_one, extract_fn, html_path): index
+            for index, html_path in enumerate(html_paths)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:  # worker crashed (e.g. killed by the OOM killer)
+                results[index] = (None, f"{type(e).__name__}: {e}")
+            progress(f"🔍 [{done}/{total}] Processed: {html_paths[index]}")
+
+            # Release results in path order as soon as the prefix is complete
+            while next_index in results:
+                rows, error = results.pop(next_index)
+                yield html_paths[next_index], rows, error
+                next_index += 1
+
+
+# === Manifest + cache aware loading ===
+REPORT_COLUMN = "HTML Report"  # report file name on every extracted row
+
+
+def _with_report_name(report_rows, html_path, report_column):
+    # Cache entries are keyed by content only: the report may since have been renamed or
+    # copied under another name, so the name comes from the path being loaded
+    if report_column is not None:
+        name = os.path.basename(html_path)
+        for row in report_rows:
+            if report_column in row:
+                row[report_column] = name
+    return report_rows
+
+
+def load_report_rows(folder_path, extract_fn, manifest, cache=None, workers=1, reprocess_all=False, rows=None,
+                     skip_unchanged=False, report_column=REPORT_COLUMN):
+    """
+    Return (rows, changed_count) covering every report under folder_path, in path order.
+
+    Reports whose content hash is already in the cache are read from it; only
+    the rest are parsed (and then cached). changed_count is the number of
+    reports the manifest had not seen in their current form, plus the reports
+    it held that are no longer under folder_path (their rows must leave the
+    output too). rows is a list
+    by default; pass any container with extend() (e.g. report_rows.ReportRowBatch)
+    to collect into it, one report at a time. With skip_unchanged, nothing is
+    loaded when no report changed (returns (rows, 0)), so a streaming rows
+    container is only fed when its output is rebuilt. Rows read from the cache get
+    report_column set to the current report's file name.
+    """
+    scanned, missing = manifest.scan(folder_path, find_html_reports(folder_path))
+    manifest.forget(missing)  # deleted or moved reports, committed with this run's records
+
+    to_parse = {}
+    changed_count = len(missing)
+    for html_path, fingerprint, changed in scanned:
+        changed_count += changed
+        if cache is None or reprocess_all or not cache.contains(fingerprint.sha256):
+            to_parse[html_path] = fingerprint
+
+    all_rows = [] if rows is None else rows
+    if skip_unchanged and not changed_count:
+        manifest.commit()
+        return all_rows, 0
+
+    # Parsed reports come back in path order, so cached and parsed reports interleave in order
+    parsed = iter_extracted_reports(list(to_parse), extract_fn, workers)
+    for html_path, fingerprint, changed in scanned:
+        report_rows = None
+        if html_path not in to_parse:
+            report_rows = cache.get(fingerprint.sha256)
+            if report_rows is not None:
+                _with_report_name(report_rows, html_path, report_column)
+                if changed:
+                    manifest.record(fingerprint, len(report_rows))
+
+        if report_rows is None:
+            if html_path in to_parse:
+                _, report_rows, error = next(parsed)
+            else:  # cache entry dropped since the scan
+                report_rows, error = _extract_one(extract_fn, html_path)
+            if error:
+                print(f"❌ Error reading {os.path.relpath(html_path, folder_path)}: {error}")
+                continue
+            manifest.record(fingerprint, len(report_rows))
+            if cache is not None:
+                cache.put(fingerprint.sha256, report_rows)
+
+        all_rows.extend(report_rows)
+
+    manifest.commit()
+    if cache is not None:
+        cache.evict()
+        print(f"🗃️  Row cache: {cache.hits} hit(s), {len(to_parse)} report(s) parsed")
+
+    return all_rows, changed_count
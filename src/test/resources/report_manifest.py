@@ -0,0 +1,121 @@
+"""
+Incremental ingest manifest for Extent reports.
+
+Replaces the old ``processed_files.csv`` basename log. Reports are keyed by
+their path relative to the scanned folder (every Spark run writes
+``index.html``, so basenames collide) and fingerprinted by size, mtime and
+SHA-256. A report whose size and mtime still match is skipped with a single
+indexed lookup and no read; if only the mtime moved, the content hash decides.
+Reports that were deleted or moved since the last scan are forgotten in the
+same transaction as the reports recorded by that run.
+"""
+
+import hashlib
+import os
+import sqlite3
+from collections import namedtuple
+from datetime import datetime
+
+MANIFEST_FILE = "processed_reports.sqlite"
+HASH_BLOCK_SIZE = 1 << 20
+
+ReportFingerprint = namedtuple("ReportFingerprint", ["rel_path", "size", "mtime_ns", "sha256"])
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ReportManifest:
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS reports (
+                rel_path    TEXT PRIMARY KEY,
+                size        INTEGER NOT NULL,
+                mtime_ns    INTEGER NOT NULL,
+                sha256      TEXT NOT NULL,
+                rows        INTEGER NOT NULL,
+                ingested_at TEXT NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS reports_sha256 ON reports (sha256)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.conn.commit()
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def reset(self):
+        self.conn.execute("DELETE FROM reports")
+        self.conn.commit()
+        print(f"🗑️  Cleared '{self.db_path}' to reprocess all reports.")
+
+    def lookup(self, rel_path):
+        row = self.conn.execute(
+            "SELECT rel_path, size, mtime_ns, sha256 FROM reports WHERE rel_path = ?", (rel_path,)
+        ).fetchone()
+        return ReportFingerprint(*row) if row else None
+
+    def fingerprint(self, folder_path, path):
+        """Return (fingerprint, changed) for a report under folder_path."""
+        rel_path = os.path.relpath(path, folder_path).replace(os.sep, "/")
+        stat = os.stat(path)
+        known = self.lookup(rel_path)
+
+        if known and known.size == stat.st_size and known.mtime_ns == stat.st_mtime_ns:
+            return known, False
+
+        current = ReportFingerprint(rel_path, stat.st_size, stat.st_mtime_ns, hash_file(path))
+        if known and known.sha256 == current.sha256:
+            # Touched or copied but identical: remember the new mtime, skip the parse
+            self.conn.execute(
+                "UPDATE reports SET size = ?, mtime_ns = ? WHERE rel_path = ?",
+                (current.size, current.mtime_ns, rel_path),
+            )
+            return current, False
+        return current, True
+
+    def scan(self, folder_path, paths):
+        """
+        Return (scanned, missing) for the reports in paths.
+
+        scanned is [(path, fingerprint, changed)] for every report in paths;
+        missing lists the rel_paths the manifest holds that were not in paths
+        (deleted or moved reports), for forget().
+        """
+        scanned = []
+        for path in paths:
+            fingerprint, changed = self.fingerprint(folder_path, path)
+            scanned.append((path, fingerprint, changed))
+        self.conn.commit()
+
+        seen = {fingerprint.rel_path for _, fingerprint, _ in scanned}
+        missing = [rel_path for (rel_path,) in self.conn.execute("SELECT rel_path FROM reports")
+                   if rel_path not in seen]
+        return scanned, missing
+
+    def forget(self, rel_paths):
+        """Remove reports that are gone; committed together with record() by commit()."""
+        self.conn.executemany("DELETE FROM reports WHERE rel_path = ?", [(rel_path,) for rel_path in rel_paths])
+
+    def record(self, fingerprint, rows):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO reports (rel_path, size, mtime_ns, sha256, rows, ingested_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (*fingerprint, rows, datetime.now().isoformat(timespec="seconds")),
+        )
+
+    def commit(self):
+        self.conn.commit()
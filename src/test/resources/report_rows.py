@@ -0,0 +1,176 @@
+"""
+Compact, append-only container for extracted report rows.
+
+The summary scripts used to collect every test as a dict with repeated string
+keys ("HTML Report", "Test Name", ...) and copy the whole list into a
+DataFrame. ReportRowBatch keeps one typed array per column instead:
+
+- dictionary columns (report, test name, status, ...): an int32 code per row
+  in an array.array plus one copy of each distinct string
+- time columns: int64 epoch values in an array.array; strings are buffered
+  and parsed PARSE_ROWS at a time with extent_times.parse_epoch (distinct
+  strings only), so no per-row strptime and no per-row string is kept
+
+Handing off creates no per-row Python objects: to_arrow() wraps the int32
+code and int64 epoch buffers without copying, to_pandas() shares the epoch
+buffers as datetime64 columns (appending to the batch raises BufferError
+while such views are alive). pandas Categoricals re-pack their codes into
+the narrowest integer type, one vectorized pass per column.
+"""
+
+import sys
+from array import array
+
+import numpy as np
+import pandas as pd
+
+from extent_times import EPOCH_UNIT, NAT, parse_epoch
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+DICTIONARY = "dictionary"
+TIME = "time"
+PARSE_ROWS = 64 * 1024
+
+# Rows of the Excel summary scripts (extract_tests_from_html)
+SUMMARY_ROW_COLUMNS = {
+    "HTML Report": DICTIONARY,
+    "Test Name": DICTIONARY,
+    "Test Status": DICTIONARY,
+    "Start Time": TIME,
+    "End Time": TIME,
+}
+
+
+class _DictionaryColumn:
+    def __init__(self):
+        self.codes = array("i")
+        self.lookup = {}
+        self.values = []
+
+    def append(self, value):
+        if value is None or value != value:  # None or NaN
+            self.codes.append(-1)
+            return
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def code_array(self):
+        return np.frombuffer(self.codes, dtype=np.int32)
+
+    def nbytes(self):
+        return (self.codes.itemsize * len(self.codes) + sys.getsizeof(self.lookup) + sys.getsizeof(self.values)
+                + sum(sys.getsizeof(value) for value in self.values))
+
+
+class _TimeColumn:
+    def __init__(self, fmt=None):
+        self.fmt = fmt
+        self.epochs = array("q")
+        self.pending = []
+
+    def append(self, value):
+        self.pending.append(value)
+        if len(self.pending) >= PARSE_ROWS:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            parsed = parse_epoch(self.pending, self.fmt)
+            self.epochs.frombytes(parsed.tobytes())
+            self.pending = []
+
+    def epoch_array(self):
+        self.flush()
+        return np.frombuffer(self.epochs, dtype=np.int64)
+
+    def nbytes(self):
+        return self.epochs.itemsize * len(self.epochs) + sum(sys.getsizeof(value) for value in self.pending)
+
+
+class ReportRowBatch:
+    """
+    Append-only typed column store for report rows.
+
+    Args:
+        columns (dict): {column: DICTIONARY or TIME}; keys missing from a row are stored as missing
+        time_formats (dict): {time column: strptime format tried first}, detected when absent
+    """
+
+    def __init__(self, columns=SUMMARY_ROW_COLUMNS, time_formats=None):
+        self.kinds = dict(columns)
+        self.time_formats = time_formats or {}
+        self.columns = {
+            name: _TimeColumn(self.time_formats.get(name)) if kind == TIME else _DictionaryColumn()
+            for name, kind in self.kinds.items()
+        }
+        self.rows = 0
+
+    def __len__(self):
+        return self.rows
+
+    def append(self, row):
+        for name, column in self.columns.items():
+            column.append(row.get(name))
+        self.rows += 1
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    @classmethod
+    def from_rows(cls, rows, columns=SUMMARY_ROW_COLUMNS, time_formats=None):
+        batch = cls(columns, time_formats)
+        batch.extend(rows)
+        return batch
+
+    def epoch(self, name):
+        """int64 epoch values (EPOCH_UNIT) of a time column, NAT where missing or unreadable."""
+        return self.columns[name].epoch_array()
+
+    def nbytes(self):
+        """Approximate memory held by the batch, distinct strings included."""
+        return sum(column.nbytes() for column in self.columns.values())
+
+    def to_pandas(self, sort_categories=False):
+        """
+        DataFrame with Categorical dictionary columns and datetime64 time columns.
+
+        sort_categories orders each dictionary lexically (one pass over the codes)
+        so groupby/sort results match plain string columns.
+        """
+        data = {}
+        for name, column in self.columns.items():
+            if self.kinds[name] == TIME:
+                data[name] = self.epoch(name).view(f"datetime64[{EPOCH_UNIT}]")
+                continue
+            codes, categories = column.code_array(), pd.Index(column.values, dtype=object)
+            if sort_categories and len(categories):
+                order = np.argsort(categories.astype(str).to_numpy(), kind="stable")
+                remap = np.empty(len(order) + 1, dtype=np.int32)
+                remap[order] = np.arange(len(order), dtype=np.int32)
+                remap[-1] = -1
+                codes, categories = remap[codes], categories[order]
+            data[name] = pd.Categorical.from_codes(codes, categories=categories)
+        return pd.DataFrame(data, copy=False)
+
+    def to_arrow(self):
+        """pyarrow Table with dictionary<int32, string> and timestamp columns."""
+        if pa is None:
+            raise RuntimeError("to_arrow() needs pyarrow")
+        arrays = {}
+        for name, column in self.columns.items():
+            if self.kinds[name] == TIME:
+                epoch = self.epoch(name)
+                arrays[name] = pa.array(epoch.view(f"datetime64[{EPOCH_UNIT}]"), mask=epoch == NAT)
+                continue
+            codes = column.code_array()
+            indices = pa.array(codes, mask=codes < 0) if (codes < 0).any() else pa.array(codes)
+            arrays[name] = pa.DictionaryArray.from_arrays(indices, pa.array(column.values, type=pa.string()))
+        return pa.table(arrays)
@@ -0,0 +1,197 @@
+"""
+Pluggable output sinks for report tables: Parquet, Arrow IPC, CSV(.gz) and Excel.
+
+A stage builds its table once (a DataFrame, a pyarrow Table or a
+report_rows.ReportRowBatch) and writes it to any number of sinks; the sink is
+picked from the file suffix:
+
+- .parquet / .arrow (Arrow IPC file, also .feather): low-cardinality string
+  columns (test names, statuses, report paths) are dictionary-encoded and
+  datetime columns stay typed timestamps, so nothing is re-parsed on read
+- .csv / .csv.gz: timestamps written as CSV_TIME_FORMAT, what python6.py /
+  python7.py read
+- .xlsx: one write-only sheet via excel_workbook, a presentation copy only
+
+read_table() / iter_table_batches() read any of them back, only the
+requested columns (Parquet and Arrow IPC read just those columns from disk;
+CSV columns come back as strings unless the caller passes read_csv options).
+find_table() picks the most efficient existing copy of a table written under
+several suffixes. SINKS maps each suffix to its (writer, reader, batch
+reader); add an entry to plug in another format.
+"""
+
+import os
+
+import pandas as pd
+from openpyxl import Workbook
+
+from excel_workbook import write_frame
+from report_rows import ReportRowBatch
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+CSV_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+DICTIONARY_RATIO = 0.5  # string columns with at most this share of distinct values are dictionary-encoded
+READ_PREFERENCE = (".parquet", ".arrow", ".feather", ".csv.gz", ".csv", ".xlsx")
+EXCEL_SHEET = "Sheet1"
+
+
+def _require_pyarrow(suffix):
+    if pa is None:
+        raise RuntimeError(f"{suffix} output needs pyarrow (pip install pyarrow)")
+
+
+# === Table conversion ===
+def to_frame(data):
+    """DataFrame view of a DataFrame, pyarrow Table or ReportRowBatch."""
+    if isinstance(data, ReportRowBatch):
+        return data.to_pandas(sort_categories=True)
+    if pa is not None and isinstance(data, pa.Table):
+        return data.to_pandas()
+    return data
+
+
+def to_arrow(data):
+    """pyarrow Table with low-cardinality string columns dictionary-encoded and typed timestamps."""
+    _require_pyarrow("Arrow")
+    if isinstance(data, pa.Table):
+        table = data
+    elif isinstance(data, ReportRowBatch):
+        table = data.to_arrow()
+    else:
+        # Arrow has no sparse type: sparse columns (duration_summary run-N) are written dense
+        sparse = {name: dtype.subtype for name, dtype in data.dtypes.items() if isinstance(dtype, pd.SparseDtype)}
+        table = pa.Table.from_pandas(data.astype(sparse) if sparse else data, preserve_index=False)
+
+    for i, field in enumerate(table.schema):
+        if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+            continue
+        column = table.column(i)
+        if len(column) and pc.count_distinct(column).as_py() <= DICTIONARY_RATIO * len(column):
+            table = table.set_column(i, field.name, pc.dictionary_encode(column))
+    return table
+
+
+# === Sinks ===
+def write_parquet(data, path):
+    _require_pyarrow(".parquet")
+    pq.write_table(to_arrow(data), path)
+
+
+def read_parquet(path, columns=None, **_):
+    _require_pyarrow(".parquet")
+    return pq.read_table(path, columns=columns).to_pandas()
+
+
+def iter_parquet_batches(path, columns=None, batch_rows=None, **_):
+    _require_pyarrow(".parquet")
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_rows, columns=columns):
+        yield batch.to_pandas()
+
+
+def write_arrow(data, path):
+    _require_pyarrow(".arrow")
+    table = to_arrow(data)
+    with ipc.new_file(path, table.schema) as writer:
+        writer.write_table(table)
+
+
+def read_arrow(path, columns=None, **_):
+    _require_pyarrow(".arrow")
+    with pa.memory_map(path) as source:
+        table = ipc.open_file(source).read_all()
+    return (table.select(columns) if columns else table).to_pandas()
+
+
+def iter_arrow_batches(path, columns=None, batch_rows=None, **_):
+    _require_pyarrow(".arrow")
+    with pa.memory_map(path) as source:
+        reader = ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            batch = batch.select(columns) if columns else batch
+            for start in range(0, batch.num_rows, batch_rows or max(batch.num_rows, 1)):
+                yield batch.slice(start, batch_rows).to_pandas()
+
+
+def write_csv(data, path):
+    to_frame(data).to_csv(path, index=False, date_format=CSV_TIME_FORMAT)  # .gz compressed by suffix
+
+
+def read_csv(path, columns=None, **options):
+    return pd.read_csv(path, usecols=columns, **{"dtype": str, **options})
+
+
+def iter_csv_batches(path, columns=None, batch_rows=None, **options):
+    if batch_rows is None:
+        yield read_csv(path, columns, **options)
+        return
+    yield from pd.read_csv(path, usecols=columns, chunksize=batch_rows, **{"dtype": str, **options})
+
+
+def write_excel(data, path, sheet_name=EXCEL_SHEET):
+    wb = Workbook(write_only=True)
+    write_frame(wb, sheet_name, to_frame(data))
+    wb.save(path)
+
+
+def read_excel(path, columns=None, **options):
+    return pd.read_excel(path, usecols=columns, **options)
+
+
+def iter_excel_batches(path, columns=None, batch_rows=None, **options):
+    yield read_excel(path, columns, **options)
+
+
+SINKS = {
+    ".parquet": (write_parquet, read_parquet, iter_parquet_batches),
+    ".arrow": (write_arrow, read_arrow, iter_arrow_batches),
+    ".feather": (write_arrow, read_arrow, iter_arrow_batches),
+    ".csv.gz": (write_csv, read_csv, iter_csv_batches),
+    ".csv": (write_csv, read_csv, iter_csv_batches),
+    ".xlsx": (write_excel, read_excel, iter_excel_batches),
+}
+
+
+def sink_suffix(path):
+    """Return the SINKS suffix of path (longest match, so ".csv.gz" beats ".gz")."""
+    name = path.lower()
+    suffix = max((s for s in SINKS if name.endswith(s)), key=len, default=None)
+    if suffix is None:
+        raise ValueError(f"No sink for {path}; expected one of {', '.join(SINKS)}")
+    return suffix
+
+
+def write_table(data, path):
+    """Write data to path with the sink of its suffix; returns path."""
+    SINKS[sink_suffix(path)][0](data, path)
+    return path
+
+
+def write_tables(data, base_path, suffixes):
+    """Write the same table to base_path + suffix for every suffix; returns the paths written."""
+    return [write_table(data, base_path + suffix) for suffix in suffixes]
+
+
+def read_table(path, columns=None, **csv_options):
+    """DataFrame of path, only columns when given; csv_options go to pd.read_csv / pd.read_excel."""
+    return SINKS[sink_suffix(path)][1](path, columns=list(columns) if columns else None, **csv_options)
+
+
+def iter_table_batches(path, columns=None, batch_rows=None, **csv_options):
+    """Yield DataFrames of up to batch_rows rows of path (Excel input comes in one batch)."""
+    yield from SINKS[sink_suffix(path)][2](path, columns=list(columns) if columns else None,
+                                           batch_rows=batch_rows, **csv_options)
+
+
+def find_table(base_path, suffixes=READ_PREFERENCE):
+    """Return the first existing base_path + suffix, in suffixes order, or None."""
+    if os.path.exists(base_path) and any(base_path.lower().endswith(s) for s in SINKS):
+        return base_path
+    return next((base_path + s for s in suffixes if os.path.exists(base_path + s)), None)
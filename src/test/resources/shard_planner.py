@@ -0,0 +1,250 @@
+"""
+Duration-aware TestNG shard planner.
+
+Reads per-test duration history (the "summary report" / test_duration_summary.csv
+run-N columns, or the p90 column of duration_stats.py output), estimates each
+test method with a quantile of its runs (p90 by default) and spreads the
+methods of a testng.xml over N nodes x T threads with LPT: longest method
+first, always onto the least-loaded thread. Every node gets its own
+testng-shard-<i>.xml (parallel="methods", thread-count=T) listing its methods
+longest first within each class, which TestNG's thread pool, handing the
+next method to the first free thread, follows closely.
+
+simulate() replays that list scheduling for any plan and predicts the
+wall-clock time of every node; the CLI compares the plan with the original
+testng.xml run on a single node.
+
+Extent test names are the @Test description when there is one, else the
+method name (TestListener); pass --sources to map descriptions back to
+methods. Methods without history are estimated with the median estimate.
+
+Usage:
+    python shard_planner.py ../../../testng.xml test-reports/test_duration_summary.csv --nodes 4 --threads 3
+    python shard_planner.py testng.xml Test_Run_Details.xlsx --sources ../java -o shards --quantile 0.5
+"""
+
+import argparse
+import heapq
+import os
+import re
+import xml.etree.ElementTree as ET
+from collections import defaultdict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+from report_sinks import read_table
+
+DEFAULT_QUANTILE = 0.9
+SUMMARY_SHEET = "summary report"
+TESTNG_DOCTYPE = '<!DOCTYPE suite SYSTEM "https://testng.org/testng-1.0.dtd">'
+SHARD_FILE = "testng-shard-{index}.xml"
+TEST_ANNOTATION = re.compile(
+    r'@Test\s*(?:\((?P<args>[^)]*)\))?\s*(?:@\w+(?:\([^)]*\))?\s*)*public\s+void\s+(?P<method>\w+)\s*\('
+)
+DESCRIPTION_ARG = re.compile(r'description\s*=\s*"(?P<description>(?:[^"\\]|\\.)*)"')
+PACKAGE_DECL = re.compile(r"^\s*package\s+([\w.]+)\s*;", re.MULTILINE)
+
+TestMethod = namedtuple("TestMethod", ["class_name", "method", "minutes"])
+
+
+# === Duration history ===
+def load_duration_history(path, quantile=DEFAULT_QUANTILE):
+    """
+    Return {Test Name: estimated minutes} from a summary CSV/workbook or duration_stats output.
+
+    Summary tables are estimated with the quantile of their run-N columns
+    (Max_Time when a test has no runs); duration_stats output must carry the
+    matching pNN column.
+    """
+    if path.lower().endswith(".xlsx"):
+        df = pd.read_excel(path, sheet_name=SUMMARY_SHEET)
+    else:
+        df = read_table(path, dtype=None)  # CSV, .csv.gz, .parquet or .arrow
+
+    run_cols = [col for col in df.columns if str(col).startswith("run-")]
+    if run_cols:
+        runs = df[run_cols].to_numpy(dtype=np.float64)
+        has_runs = ~np.isnan(runs).all(axis=1)
+        estimates = df["Max_Time"].to_numpy(dtype=np.float64).copy()
+        if has_runs.any():
+            estimates[has_runs] = np.nanquantile(runs[has_runs], quantile, axis=1)
+        return dict(zip(df["Test Name"], estimates))
+
+    column = next((col for col in df.columns if str(col).startswith(f"p{round(quantile * 100)} (")), None)
+    if column is None:
+        raise ValueError(f"{path} has neither run-N columns nor a p{round(quantile * 100)} column")
+    scale = 1 / 60 if column.endswith("(sec)") else 1
+    return dict(zip(df["Test Name"], df[column] * scale))
+
+
+def find_test_descriptions(source_dir):
+    """Return {(class, method): description} for @Test(description=...) methods under source_dir."""
+    descriptions = {}
+    for root, _, files in os.walk(source_dir):
+        for file in files:
+            if not file.endswith(".java"):
+                continue
+            with open(os.path.join(root, file), "r", encoding="utf-8", errors="ignore") as f:
+                source = f.read()
+            package = PACKAGE_DECL.search(source)
+            class_name = (package.group(1) + "." if package else "") + file[:-len(".java")]
+            for match in TEST_ANNOTATION.finditer(source):
+                description = DESCRIPTION_ARG.search(match.group("args") or "")
+                if description:
+                    descriptions[(class_name, match.group("method"))] = description.group("description")
+    return descriptions
+
+
+def estimate_methods(methods, history, descriptions=None):
+    """Attach minutes to (class, method) pairs; returns (TestMethod list, names without history)."""
+    descriptions = descriptions or {}
+    estimated, missing = [], []
+    for class_name, method in methods:
+        simple_class = class_name.rsplit(".", 1)[-1]
+        candidates = [descriptions.get((class_name, method)), f"{class_name}.{method}",
+                      f"{simple_class}.{method}", method]
+        minutes = next((history[name] for name in candidates if name in history), None)
+        if minutes is None or np.isnan(minutes):
+            missing.append(f"{class_name}.{method}")
+        estimated.append(TestMethod(class_name, method, minutes))
+
+    known = [m.minutes for m in estimated if m.minutes is not None and not np.isnan(m.minutes)]
+    default = float(np.median(known)) if known else 1.0
+    estimated = [m if m.minutes is not None and not np.isnan(m.minutes) else m._replace(minutes=default)
+                 for m in estimated]
+    return estimated, missing
+
+
+# === testng.xml ===
+def read_suite(xml_path):
+    """Return (suite element, [(class, method)]) for every <include> of every <test>."""
+    suite = ET.parse(xml_path).getroot()
+    methods = []
+    for class_el in suite.iter("class"):
+        includes = class_el.findall("./methods/include")
+        if not includes:
+            raise ValueError(f"<class name=\"{class_el.get('name')}\"> lists no methods; "
+                             f"add <methods><include .../></methods> to plan it")
+        methods.extend((class_el.get("name"), include.get("name")) for include in includes)
+    return suite, methods
+
+
+def write_shard_suites(suite, shards, threads, output_dir):
+    """Write one testng.xml per shard, keeping the suite attributes and listeners; returns the paths."""
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for index, shard in enumerate(shards, 1):
+        shard_suite = ET.Element("suite", dict(suite.attrib))
+        shard_suite.set("name", f"{suite.get('name', 'Suite')} (shard {index}/{len(shards)})")
+        shard_suite.set("parallel", "methods")
+        shard_suite.set("thread-count", str(threads))
+        shard_suite.set("preserve-order", "true")
+        for child in suite:
+            if child.tag != "test":
+                shard_suite.append(child)
+
+        test_el = ET.SubElement(shard_suite, "test", {
+            "name": f"Shard {index}", "parallel": "methods", "thread-count": str(threads),
+            "preserve-order": "true",
+        })
+        classes_el = ET.SubElement(test_el, "classes")
+        by_class = defaultdict(list)
+        for method in shard:
+            by_class[method.class_name].append(method)
+        for class_name, class_methods in by_class.items():
+            methods_el = ET.SubElement(ET.SubElement(classes_el, "class", {"name": class_name}), "methods")
+            for method in class_methods:
+                ET.SubElement(methods_el, "include", {"name": method.method})
+
+        ET.indent(shard_suite, space="    ")
+        path = os.path.join(output_dir, SHARD_FILE.format(index=index))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f'<?xml version="1.0" encoding="UTF-8"?>\n{TESTNG_DOCTYPE}\n')
+            f.write(ET.tostring(shard_suite, encoding="unicode"))
+            f.write("\n")
+        paths.append(path)
+    return paths
+
+
+# === Planning and simulation ===
+def plan_shards(methods, nodes, threads):
+    """
+    LPT over nodes x threads: returns one method list per node, in testng.xml order.
+
+    A testng.xml lists methods class by class, so each shard is ordered by
+    class (the class holding the longest method first) and longest first
+    within a class; simulate() on the result predicts that order.
+    """
+    loads = [(0.0, slot) for slot in range(nodes * threads)]
+    heapq.heapify(loads)
+    shards = [[] for _ in range(nodes)]
+    for method in sorted(methods, key=lambda m: (-m.minutes, m.class_name, m.method)):
+        load, slot = heapq.heappop(loads)
+        shards[slot // threads].append(method)
+        heapq.heappush(loads, (load + method.minutes, slot))
+
+    for shard in shards:
+        class_rank = {}
+        for method in shard:
+            class_rank.setdefault(method.class_name, len(class_rank))
+        shard.sort(key=lambda m: class_rank[m.class_name])  # stable: longest first within a class
+    return shards
+
+
+def simulate(shards, threads, minutes=None):
+    """
+    Predict each node's wall-clock minutes when TestNG runs its methods in order on threads.
+
+    Args:
+        shards (list): Method lists, one per node, in execution order
+        threads (int): Threads per node
+        minutes (dict): Optional {(class, method): minutes} overriding the plan estimates
+
+    Returns:
+        list: Predicted wall-clock minutes per node
+    """
+    walls = []
+    for shard in shards:
+        free_at = [0.0] * threads
+        for method in shard:
+            duration = method.minutes if minutes is None else minutes[(method.class_name, method.method)]
+            heapq.heappush(free_at, heapq.heappop(free_at) + duration)
+        walls.append(max(free_at))
+    return walls
+
+
+def print_plan(shards, walls, label):
+    print(f"\n📋 {label}: predicted wall time {max(walls):.2f} min")
+    for index, (shard, wall) in enumerate(zip(shards, walls), 1):
+        busy = sum(m.minutes for m in shard)
+        print(f"   Node {index}: {len(shard):>4} methods, {busy:>8.2f} min of work, {wall:>8.2f} min wall")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("testng", help="testng.xml listing the methods to plan")
+    parser.add_argument("history", help="test_duration_summary.csv, Test_Run_Details.xlsx or duration_stats output")
+    parser.add_argument("--nodes", type=int, default=1, help="Grid nodes (one testng.xml each)")
+    parser.add_argument("--threads", type=int, default=2, help="TestNG thread-count per node")
+    parser.add_argument("--quantile", type=float, default=DEFAULT_QUANTILE, help="Run quantile used as estimate")
+    parser.add_argument("--sources", help="Java test sources, to map @Test descriptions to methods")
+    parser.add_argument("-o", "--output", default="testng-shards", help="Folder for testng-shard-<i>.xml")
+    args = parser.parse_args()
+
+    suite, suite_methods = read_suite(args.testng)
+    history = load_duration_history(args.history, args.quantile)
+    descriptions = find_test_descriptions(args.sources) if args.sources else None
+    methods, missing = estimate_methods(suite_methods, history, descriptions)
+    if missing:
+        print(f"⚠️ No history for {len(missing)} method(s), using the median estimate: {', '.join(missing[:5])}"
+              f"{' ...' if len(missing) > 5 else ''}")
+
+    baseline_threads = int(suite.get("thread-count", 1))
+    print_plan([methods], simulate([methods], baseline_threads), f"{args.testng} as is (1 node x {baseline_threads} threads)")
+
+    shards = plan_shards(methods, args.nodes, args.threads)
+    print_plan(shards, simulate(shards, args.threads), f"LPT plan ({args.nodes} nodes x {args.threads} threads)")
+
+    for path in write_shard_suites(suite, shards, args.threads, args.output):
+        print(f"✅ Shard suite saved to: {path}")
@@ -0,0 +1,243 @@
+"""
+Incrementally maintained duration summary (a materialized "summary report").
+
+The summary scripts rebuild Count / Total_Time / Max_Time and run-1..run-N
+from the whole detail history on every invocation. This store keeps that
+state in SQLite instead:
+
+- runs:    one row per test run (report, test, start, duration), indexed by
+           (test, start, duration) so the run-N columns come out of an index
+           scan in summary order, without sorting
+- tests:   Count / Total_Time / Max_Time per test, updated in place
+- reports: which reports have been absorbed
+
+absorb() costs time proportional to the batch: its runs are inserted and its
+per-test aggregates are upserted into tests. retract() removes a report that
+was ingested by mistake and recomputes only the tests it touched (Max_Time
+cannot be "subtracted"). Absorbing a report that is already in the store
+replaces it. Durations are in minutes, like FinalSummary_Final.py.
+
+Usage:
+    python summary_store.py absorb test-reports/extent_report_test_details.csv --report-col "Report File"
+    python summary_store.py absorb run-1234.csv --report run-1234
+    python summary_store.py retract run-1234
+    python summary_store.py publish -o test-reports/test_duration_summary.csv --excel Test_Run_Details.xlsx
+    python summary_store.py publish --last-runs 50 --long test-reports/test_run_history.csv
+"""
+
+import argparse
+import os
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from duration_summary import MAX_EXCEL_RUNS, RUN_INDEX_COL, wide_from_long
+from extent_times import EPOCH_UNIT, NAT, parse_epoch
+from report_sinks import read_table, write_table
+
+SUMMARY_STORE_FILE = "duration_summary.sqlite"
+SUMMARY_SHEET = "summary report"
+EPOCH_TICKS_PER_MINUTE = np.timedelta64(1, "m") // np.timedelta64(1, EPOCH_UNIT)
+
+
+def runs_from_frame(df, name_col="Test Name", start_col="Test Start Time", end_col="Test End Time"):
+    """Return (names, start epochs, durations in minutes) for rows with a name and both times."""
+    starts = parse_epoch(df[start_col])
+    ends = parse_epoch(df[end_col])
+    names = df[name_col].to_numpy(dtype=object)
+    valid = (starts != NAT) & (ends != NAT) & pd.notna(names) & (names != "")  # "" is a missing name in Parquet/Arrow
+    durations = (ends[valid] - starts[valid]) / EPOCH_TICKS_PER_MINUTE
+    return names[valid], starts[valid], durations
+
+
+class DurationSummaryStore:
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                report   TEXT NOT NULL,
+                test     TEXT NOT NULL,
+                start_us INTEGER NOT NULL,
+                duration REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS runs_test ON runs (test, start_us, duration);
+            CREATE INDEX IF NOT EXISTS runs_report ON runs (report);
+            CREATE TABLE IF NOT EXISTS tests (
+                test       TEXT PRIMARY KEY,
+                count      INTEGER NOT NULL,
+                total_time REAL NOT NULL,
+                max_time   REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS reports (
+                report      TEXT PRIMARY KEY,
+                runs        INTEGER NOT NULL,
+                ingested_at TEXT NOT NULL
+            );
+        """)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.conn.commit()
+        else:
+            self.conn.rollback()
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def commit(self):
+        self.conn.commit()
+
+    def reports(self):
+        return self.conn.execute("SELECT report, runs, ingested_at FROM reports ORDER BY report").fetchall()
+
+    # === Updates ===
+    def absorb(self, report, names, starts, durations):
+        """Add one report's runs (names, int64 start epochs, durations in minutes)."""
+        if self.conn.execute("SELECT 1 FROM reports WHERE report = ?", (report,)).fetchone():
+            self.retract(report)
+
+        names = list(names)
+        starts = np.asarray(starts, dtype=np.int64)
+        durations = np.asarray(durations, dtype=np.float64)
+        self.conn.executemany(
+            "INSERT INTO runs (report, test, start_us, duration) VALUES (?, ?, ?, ?)",
+            zip([report] * len(names), names, starts.tolist(), durations.tolist()),
+        )
+
+        batch = pd.Series(durations).groupby(names).agg(["count", "sum", "max"])
+        self.conn.executemany(
+            "INSERT INTO tests (test, count, total_time, max_time) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (test) DO UPDATE SET count = count + excluded.count, "
+            "total_time = total_time + excluded.total_time, max_time = MAX(max_time, excluded.max_time)",
+            zip(batch.index.tolist(), batch["count"].tolist(), batch["sum"].tolist(), batch["max"].tolist()),
+        )
+        self.conn.execute(
+            "INSERT INTO reports (report, runs, ingested_at) VALUES (?, ?, ?)",
+            (report, len(names), datetime.now().isoformat(timespec="seconds")),
+        )
+        return len(names)
+
+    def retract(self, report):
+        """Remove a report's runs; only the tests it touched are recomputed. Returns runs removed."""
+        tests = [row[0] for row in self.conn.execute("SELECT DISTINCT test FROM runs WHERE report = ?", (report,))]
+        removed = self.conn.execute("DELETE FROM runs WHERE report = ?", (report,)).rowcount
+        self.conn.execute("DELETE FROM reports WHERE report = ?", (report,))
+
+        for test in tests:
+            count, total, longest = self.conn.execute(
+                "SELECT COUNT(*), SUM(duration), MAX(duration) FROM runs WHERE test = ?", (test,)
+            ).fetchone()
+            if count:
+                self.conn.execute(
+                    "UPDATE tests SET count = ?, total_time = ?, max_time = ? WHERE test = ?",
+                    (count, total, longest, test),
+                )
+            else:
+                self.conn.execute("DELETE FROM tests WHERE test = ?", (test,))
+        return removed
+
+    # === Publishing ===
+    def runs_long(self):
+        """Long-format history (Test Name, Run Index, Test Start Time, Duration (min)), runs ordered by start."""
+        long_df = pd.read_sql_query(
+            'SELECT test AS "Test Name", start_us, duration AS "Duration (min)" '
+            "FROM runs INDEXED BY runs_test ORDER BY test, start_us, duration",
+            self.conn,
+        )
+        starts = long_df.pop("start_us").to_numpy(dtype=np.int64).view(f"datetime64[{EPOCH_UNIT}]")
+        long_df.insert(1, RUN_INDEX_COL, long_df.groupby("Test Name", sort=False).cumcount() + 1)
+        long_df.insert(2, "Test Start Time", starts)
+        return long_df
+
+    def summary_frame(self, last_runs=None):
+        """
+        The summary table (Test Name, Count, Total_Time, Max_Time, run-1 .. run-N), runs ordered by start.
+
+        With last_runs only each test's latest runs are kept, as run-1 .. run-K.
+        """
+        stats = pd.read_sql_query(
+            'SELECT test AS "Test Name", count AS Count, total_time AS Total_Time, max_time AS Max_Time '
+            "FROM tests ORDER BY test",
+            self.conn,
+        )
+        long_df = self.runs_long()
+        run_columns = wide_from_long(long_df, stats["Test Name"], "Test Name", "Duration (min)", last_runs)
+        return pd.concat([stats, run_columns], axis=1)
+
+
+def absorb_csv(store, csv_path, report=None, report_col=None):
+    """Absorb a detail CSV (or .parquet/.arrow table), as one report or one report per value of report_col."""
+    columns = ["Test Name", "Test Start Time", "Test End Time"] + ([report_col] if report_col else [])
+    df = read_table(csv_path, columns)
+    if report_col:
+        groups = df.groupby(report_col, sort=True)
+    else:
+        groups = [(report or os.path.basename(csv_path), df)]
+
+    for name, rows in groups:
+        absorbed = store.absorb(name, *runs_from_frame(rows))
+        print(f"➕ Absorbed {absorbed} run(s) from report '{name}'")
+    store.commit()
+
+
+def publish(store, output_csv=None, output_excel=None, last_runs=None, output_long=None):
+    if output_excel and last_runs is None:
+        last_runs = MAX_EXCEL_RUNS
+    summary_df = store.summary_frame(last_runs)
+    if output_csv:
+        write_table(summary_df, output_csv)
+        print(f"✅ Summary saved to: {output_csv}")
+    if output_excel:
+        mode = "a" if os.path.exists(output_excel) else "w"
+        options = {"if_sheet_exists": "replace"} if mode == "a" else {}
+        with pd.ExcelWriter(output_excel, engine="openpyxl", mode=mode, **options) as writer:
+            summary_df.to_excel(writer, index=False, sheet_name=SUMMARY_SHEET)
+        print(f"✅ '{SUMMARY_SHEET}' sheet saved to: {output_excel}")
+    if output_long:
+        write_table(store.runs_long(), output_long)
+        print(f"✅ Full run history (long format) saved to: {output_long}")
+    print(f"✅ {len(summary_df)} tests in the summary.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--store", default=SUMMARY_STORE_FILE, help="SQLite summary store")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    absorb_parser = commands.add_parser("absorb", help="Add the runs of a detail CSV")
+    absorb_parser.add_argument("csv", help="CSV with Test Name / Test Start Time / Test End Time")
+    absorb_parser.add_argument("--report", help="Report name for the whole CSV (default: CSV file name)")
+    absorb_parser.add_argument("--report-col", help="Column naming each row's report, e.g. 'Report File'")
+
+    retract_parser = commands.add_parser("retract", help="Remove reports ingested by mistake")
+    retract_parser.add_argument("reports", nargs="+")
+
+    publish_parser = commands.add_parser("publish", help="Write the summary table")
+    publish_parser.add_argument("-o", "--output", default="test_duration_summary.csv", help="Summary .csv/.csv.gz/.parquet/.arrow")
+    publish_parser.add_argument("--excel", help=f"Workbook whose '{SUMMARY_SHEET}' sheet is replaced")
+    publish_parser.add_argument("--last-runs", type=int, help="Keep only each test's last N runs as run-1 .. run-N "
+                                f"(default with --excel: {MAX_EXCEL_RUNS}, Excel's column limit)")
+    publish_parser.add_argument("--long", help="Also write the full history as (test, run index, start, duration) "
+                                               "to this .csv/.parquet/.arrow")
+
+    commands.add_parser("list", help="List absorbed reports")
+    args = parser.parse_args()
+
+    with DurationSummaryStore(args.store) as store:
+        if args.command == "absorb":
+            absorb_csv(store, args.csv, args.report, args.report_col)
+        elif args.command == "retract":
+            for report in args.reports:
+                print(f"➖ Retracted {store.retract(report)} run(s) of report '{report}'")
+        elif args.command == "publish":
+            publish(store, args.output, args.excel, args.last_runs, args.long)
+        else:
+            for report, runs, ingested_at in store.reports():
+                print(f"{report}\t{runs}\t{ingested_at}")
@@ -1,45 +1,41 @@
 import os
 import csv
-from bs4 import BeautifulSoup
+import argparse
+from extent_html_parser import iter_test_fields
+from report_ingest import find_html_reports, iter_extracted_reports
 
-def extract_tests_from_html(html_path):
-    with open(html_path, "r", encoding="utf-8", errors="ignore") as f:
-        soup = BeautifulSoup(f, "html.parser")
+PARSER_BACKEND = "auto"  # "auto" (sniff report layout), "stream" (v3/v4 layout only) or "bs4" (BeautifulSoup tree)
 
+def extract_tests_from_html(html_path):
     test_data = []
 
     # Loop through all test case <li> elements
-    for test in soup.select("ul.test-collection > li"):
+    for test in iter_test_fields(html_path, backend=PARSER_BACKEND):
         test_name = "Unknown"
         test_status = "Unknown"
         test_start = ""
         test_end = ""
 
         # Test Name
-        name_span = test.select_one("span.test-name")
-        if name_span:
-            test_name = name_span.text.strip()
+        if test["name"] is not None:
+            test_name = test["name"]
 
         # Status
-        status_span = test.select_one("span.test-status")
-        if status_span:
-            test_status = status_span.text.strip()
+        if test["status"] is not None:
+            test_status = test["status"]
 
         # Start Time
-        start_span = test.select_one("span.test-started-time")
-        if start_span:
-            test_start = start_span.text.strip()
+        if test["started"] is not None:
+            test_start = test["started"]
 
         # End Time
-        end_span = test.select_one("span.test-ended-time")
-        if end_span:
-            test_end = end_span.text.strip()
+        if test["ended"] is not None:
+            test_end = test["ended"]
 
         # Fallback to last test step timestamp
         if not test_end or test_end.strip() == "":
-            timestamps = test.select("td.timestamp")
-            if timestamps:
-                last_step_time = timestamps[-1].text.strip()
+            if test["last_timestamp"] is not None:
+                last_step_time = test["last_timestamp"]
                 if test_start and len(test_start.split()) == 2:
                     test_date = test_start.split()[0]
                     test_end = f"{test_date} {last_step_time}"
@@ -55,15 +51,14 @@ def extract_tests_from_html(html_path):
     return test_data
 
 
-def extract_all_reports_from_folder(folder_path):
+def extract_all_reports_from_folder(folder_path, workers=1):
     all_data = []
-    for root, dirs, files in os.walk(folder_path):
-        for file in files:
-            if file.lower().endswith(".html"):
-                html_path = os.path.join(root, file)
-                print(f"🔍 Processing: {html_path}")
-                test_info = extract_tests_from_html(html_path)
-                all_data.extend(test_info)
+    html_paths = find_html_reports(folder_path)
+    for html_path, test_info, error in iter_extracted_reports(html_paths, extract_tests_from_html, workers):
+        if error:
+            print(f"❌ Error reading {os.path.basename(html_path)}: {error}")
+        else:
+            all_data.extend(test_info)
     return all_data
 
 
@@ -83,7 +78,14 @@ def write_to_csv(data, output_csv):
 # ========= 🔁 USAGE ==========
 if __name__ == "__main__":
     input_folder = r"C:\Path\To\Your\Reports"  # ⬅️ Update this
+
+    parser = argparse.ArgumentParser(description="Dump test start/end times from Extent HTML reports to CSV")
+    parser.add_argument("folder", nargs="?", default=input_folder, help="Folder to scan for .html reports")
+    parser.add_argument("--workers", type=int, default=1, help="Parse reports in N worker processes")
+    args = parser.parse_args()
+
+    input_folder = args.folder
     output_csv = os.path.join(input_folder, "extent_test_summary.csv")
 
-    all_tests = extract_all_reports_from_folder(input_folder)
+    all_tests = extract_all_reports_from_folder(input_folder, workers=args.workers)
     write_to_csv(all_tests, output_csv)
\ No newline at end of file
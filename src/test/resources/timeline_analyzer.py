@@ -0,0 +1,243 @@
+"""
+Parallel-execution timeline of Extent reports and a TestNG thread-count recommender.
+
+For every report the test intervals (start, end) are swept once in time
+order (O(n log n)) to rebuild how many tests were running at each moment.
+From that concurrency profile each report gets:
+
+- wall time (suite-started-time .. suite-ended-time when the report has them,
+  else first start .. last end) and busy time (sum of test durations)
+- peak and mean concurrency, and parallel efficiency:
+  busy / (threads x wall), threads being the configured thread-count
+  (--threads / --testng) or the observed peak
+- idle gaps: stretches inside the wall time with no test running
+
+The recommender replays every report's tests, in start order, on 1..N
+threads the way TestNG's pool runs them (next test on the first free thread)
+and picks the smallest thread-count whose median predicted wall time is
+within --tolerance of the best one.
+
+Usage:
+    python timeline_analyzer.py Reports --workers 4 --testng ../../../testng.xml
+    python timeline_analyzer.py test-reports/extent_report_test_details.csv --max-threads 32
+"""
+
+import argparse
+import heapq
+import os
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pandas as pd
+
+from extent_html_parser import extract_report
+from extent_times import EPOCH_UNIT, NAT, parse_epoch
+from report_archives import iter_report_streams, relative_report_name
+from report_ingest import find_report_sources, iter_extracted_reports
+from report_sinks import read_table, write_table
+
+REPORT_COLUMNS = ("Report File", "Report Source", "HTML Report")  # python8.py, python9.py, Excel summaries
+MAX_THREADS = 16
+TOLERANCE = 0.05
+TIMELINE_FILE = "test_timeline.csv"
+EPOCH_TICKS_PER_MINUTE = np.timedelta64(1, "m") // np.timedelta64(1, EPOCH_UNIT)
+
+
+# === Sweep line ===
+def concurrency_steps(starts, ends):
+    """
+    Return (times, levels): levels[i] tests run from times[i] until times[i + 1].
+
+    A test ending at the same instant another one starts does not overlap it.
+    """
+    times = np.concatenate((starts, ends))
+    deltas = np.concatenate((np.ones(len(starts), dtype=np.int64), np.full(len(ends), -1, dtype=np.int64)))
+    order = np.lexsort((deltas, times))
+    times, levels = times[order], np.cumsum(deltas[order])
+    last_at_time = np.r_[times[1:] != times[:-1], True]
+    return times[last_at_time], levels[last_at_time]
+
+
+def idle_gaps(times, levels, window_start, window_end):
+    """Return [(gap start, gap length)] where nothing runs between window_start and window_end."""
+    gaps = []
+    if len(times) and times[0] > window_start:
+        gaps.append((window_start, times[0] - window_start))
+    empty = np.flatnonzero(levels[:-1] == 0)
+    gaps.extend(zip(times[empty].tolist(), (times[empty + 1] - times[empty]).tolist()))
+    if len(times) and window_end > times[-1]:
+        gaps.append((times[-1], window_end - times[-1]))
+    return [(start, length) for start, length in gaps if length > 0]
+
+
+def analyze_timeline(starts, ends, threads=None, suite_start=NAT, suite_end=NAT):
+    """
+    Concurrency statistics of one report.
+
+    Args:
+        starts, ends (numpy.ndarray): int64 epoch times (EPOCH_UNIT) of valid test intervals
+        threads (int): Configured thread-count; the observed peak when None
+        suite_start, suite_end (int): Suite bounds from the report, NAT when unknown
+
+    Returns:
+        dict: Tests, Wall/Busy/Idle/Longest Idle Gap (min), Peak and Mean Concurrency,
+              Threads, Efficiency, Saturated (min) (time with every thread busy)
+    """
+    times, levels = concurrency_steps(starts, ends)
+    window_start = min(suite_start, times[0]) if suite_start != NAT else times[0]
+    window_end = max(suite_end, times[-1]) if suite_end != NAT else times[-1]
+
+    wall = window_end - window_start
+    busy = int((ends - starts).sum())
+    peak = int(levels.max())
+    threads = threads or peak
+    segments = np.diff(times)
+    gaps = idle_gaps(times, levels, window_start, window_end)
+
+    return {
+        "Tests": len(starts),
+        "Wall (min)": wall / EPOCH_TICKS_PER_MINUTE,
+        "Busy (min)": busy / EPOCH_TICKS_PER_MINUTE,
+        "Peak Concurrency": peak,
+        "Mean Concurrency": busy / wall if wall else np.nan,
+        "Threads": threads,
+        "Efficiency": busy / (threads * wall) if wall and threads else np.nan,
+        "Saturated (min)": segments[levels[:-1] >= threads].sum() / EPOCH_TICKS_PER_MINUTE,
+        "Idle (min)": sum(length for _, length in gaps) / EPOCH_TICKS_PER_MINUTE,
+        "Idle Gaps": len(gaps),
+        "Longest Idle Gap (min)": max((length for _, length in gaps), default=0) / EPOCH_TICKS_PER_MINUTE,
+    }
+
+
+# === Thread-count recommendation ===
+def predict_wall(durations, threads):
+    """Wall time of running durations, in order, on a pool of threads (next test on the first free thread)."""
+    free_at = [0] * threads
+    for duration in durations:
+        heapq.heappush(free_at, heapq.heappop(free_at) + duration)
+    return max(free_at)
+
+
+def recommend_threads(report_durations, max_threads=MAX_THREADS, tolerance=TOLERANCE):
+    """
+    Predict every report on 1..max_threads threads.
+
+    Args:
+        report_durations (list): Per report, test durations in start order
+        max_threads (int): Largest thread-count considered
+        tolerance (float): Accepted slowdown against the best thread-count
+
+    Returns:
+        (pd.DataFrame, int): per thread-count median predicted wall (min), median slowdown
+        against max_threads and median efficiency; and the recommended thread-count
+    """
+    rows = []
+    best = [predict_wall(durations, max_threads) for durations in report_durations]
+    for threads in range(1, max_threads + 1):
+        walls = np.array([predict_wall(durations, threads) for durations in report_durations], dtype=np.float64)
+        busy = np.array([sum(durations) for durations in report_durations], dtype=np.float64)
+        rows.append({
+            "Threads": threads,
+            "Predicted Wall (min)": np.median(walls) / EPOCH_TICKS_PER_MINUTE,
+            "Slowdown": np.median(walls / np.maximum(best, 1)),
+            "Efficiency": np.median(busy / (threads * np.maximum(walls, 1))),
+        })
+    table = pd.DataFrame(rows)
+    recommended = int(table.loc[table["Slowdown"] <= 1 + tolerance, "Threads"].min())
+    return table, recommended
+
+
+def read_thread_count(testng_path):
+    return int(ET.parse(testng_path).getroot().get("thread-count", 1))
+
+
+# === Inputs ===
+def extract_report_intervals(file_path):
+    """[{report, suite_started, suite_ended, tests: [(name, started, ended)]}] for an .html or every report in a .zip."""
+    reports = []
+    for report_name, stream in iter_report_streams(file_path):
+        report = extract_report(stream)
+        reports.append({
+            "report": report_name,
+            "suite_started": report["suite_started"],
+            "suite_ended": report["suite_ended"],
+            "tests": [(test["name"], test["started"], test["ended"]) for test in report["tests"]],
+        })
+    return reports
+
+
+def load_folder_intervals(folder_path, workers=1):
+    """Yield (report name, starts, ends, suite start, suite end) for every report under folder_path."""
+    sources = find_report_sources(folder_path)
+    for file_path, reports, error in iter_extracted_reports(sources, extract_report_intervals, workers):
+        if error:
+            print(f"❌ Error reading {os.path.relpath(file_path, folder_path)}: {error}")
+            continue
+        for report in reports:
+            tests = report["tests"]
+            suite_start, suite_end = parse_epoch([report["suite_started"], report["suite_ended"]])
+            yield (relative_report_name(report["report"], folder_path),
+                   parse_epoch([t[1] for t in tests]), parse_epoch([t[2] for t in tests]), suite_start, suite_end)
+
+
+def load_csv_intervals(csv_path):
+    """Yield (report name, starts, ends, NAT, NAT) per report of a python8.py/python9.py detail CSV (or table)."""
+    df = read_table(csv_path)
+    report_col = next((col for col in REPORT_COLUMNS if col in df.columns), None)
+    starts = parse_epoch(df["Test Start Time"])
+    ends = parse_epoch(df["Test End Time"])
+    groups = df.groupby(report_col, sort=True).indices if report_col else {os.path.basename(csv_path): np.arange(len(df))}
+    for report, rows in groups.items():
+        yield report, starts[rows], ends[rows], NAT, NAT
+
+
+def valid_intervals(starts, ends):
+    valid = (starts != NAT) & (ends != NAT) & (ends >= starts)
+    return starts[valid], ends[valid], int((~valid).sum())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="Report folder (.html/.zip) or detail CSV (python8.py / python9.py)")
+    parser.add_argument("--workers", type=int, default=1, help="Parse reports in N worker processes")
+    parser.add_argument("--threads", type=int, help="Configured thread-count used for efficiency")
+    parser.add_argument("--testng", help="Read the configured thread-count from this testng.xml")
+    parser.add_argument("--max-threads", type=int, default=MAX_THREADS, help="Largest thread-count to consider")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="Accepted slowdown vs. the best count")
+    parser.add_argument("-o", "--output", help=f"Per-report CSV (default: {TIMELINE_FILE} next to the source)")
+    args = parser.parse_args()
+
+    threads = args.threads or (read_thread_count(args.testng) if args.testng else None)
+    if os.path.isdir(args.source):
+        intervals = load_folder_intervals(args.source, args.workers)
+        output_path = args.output or os.path.join(args.source, TIMELINE_FILE)
+    else:
+        intervals = load_csv_intervals(args.source)
+        output_path = args.output or os.path.join(os.path.dirname(args.source), TIMELINE_FILE)
+
+    rows, report_durations = [], []
+    for report, starts, ends, suite_start, suite_end in intervals:
+        starts, ends, skipped = valid_intervals(starts, ends)
+        if not len(starts):
+            print(f"⚠️ {report}: no test with both start and end time")
+            continue
+        rows.append({"Report": report, **analyze_timeline(starts, ends, threads, suite_start, suite_end),
+                     "Skipped Tests": skipped})
+        order = np.argsort(starts, kind="stable")
+        report_durations.append((ends - starts)[order].tolist())
+
+    if not rows:
+        print("⚠️ No test intervals found.")
+        raise SystemExit(1)
+
+    timeline_df = pd.DataFrame(rows).round(3)
+    write_table(timeline_df, output_path)
+    print(f"\n✅ Timeline of {len(timeline_df)} report(s) saved to: {output_path}")
+    print(f"   Median efficiency {timeline_df['Efficiency'].median():.0%}, "
+          f"median peak concurrency {timeline_df['Peak Concurrency'].median():.0f}, "
+          f"{timeline_df['Idle (min)'].sum():.1f} min idle in total")
+
+    table, recommended = recommend_threads(report_durations, args.max_threads, args.tolerance)
+    print("\n" + table.round(3).to_string(index=False))
+    print(f"\n🧵 Recommended thread-count: {recommended} "
+          f"(smallest within {args.tolerance:.0%} of the best predicted wall time)")